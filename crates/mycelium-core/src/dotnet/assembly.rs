@@ -23,32 +23,37 @@ impl AssemblyIndex {
             .insert(namespace.to_string(), project.to_string());
     }
 
+    /// Register many namespace/project pairs in one pass.
+    ///
+    /// Later pairs overwrite earlier ones for the same namespace, matching
+    /// repeated calls to [`register`](Self::register).
+    pub fn register_many<I, N, P>(&mut self, pairs: I)
+    where
+        I: IntoIterator<Item = (N, P)>,
+        N: Into<String>,
+        P: Into<String>,
+    {
+        let pairs = pairs.into_iter();
+        self.ns_to_project.reserve(pairs.size_hint().0);
+        self.ns_to_project
+            .extend(pairs.map(|(ns, project)| (ns.into(), project.into())));
+    }
+
     /// Resolve a namespace to the project that owns it.
     ///
     /// Tries exact match first, then prefix matching (e.g.,
     /// `Absence.Services.Internal` matches `Absence.Services` if
     /// `Absence` project registered `Absence` as root namespace).
     pub fn resolve_namespace(&self, namespace: &str) -> Option<&str> {
-        // Exact match
-        if let Some(project) = self.ns_to_project.get(namespace) {
-            return Some(project.as_str());
-        }
-
-        // Prefix match: find the longest matching namespace prefix
-        let mut best_match: Option<&str> = None;
-        let mut best_len = 0;
-
-        for (ns, project) in &self.ns_to_project {
-            if namespace.starts_with(ns.as_str()) && ns.len() > best_len {
-                // Ensure it matches at a dot boundary
-                if namespace.len() == ns.len() || namespace.as_bytes()[ns.len()] == b'.' {
-                    best_match = Some(project.as_str());
-                    best_len = ns.len();
-                }
+        // Exact match, then successively shorter dot-boundary prefixes, so the
+        // first hit is the longest registered prefix.
+        let mut candidate = namespace;
+        loop {
+            if let Some(project) = self.ns_to_project.get(candidate) {
+                return Some(project.as_str());
             }
+            candidate = &candidate[..candidate.rfind('.')?];
         }
-
-        best_match
     }
 
     /// Return the full namespace-to-project mapping.
@@ -98,6 +103,28 @@ mod tests {
         );
     }
 
+    #[test]
+    fn register_many_matches_register() {
+        let mut idx = AssemblyIndex::new();
+        idx.register_many([
+            ("Absence", "Core.csproj"),
+            ("Absence.Services", "Services.csproj"),
+        ]);
+        assert_eq!(idx.get_all_namespaces().len(), 2);
+        assert_eq!(
+            idx.resolve_namespace("Absence.Services.Internal"),
+            Some("Services.csproj")
+        );
+        assert_eq!(idx.resolve_namespace("Absence.Models"), Some("Core.csproj"));
+    }
+
+    #[test]
+    fn prefix_requires_dot_boundary() {
+        let mut idx = AssemblyIndex::new();
+        idx.register("Absence", "Core.csproj");
+        assert_eq!(idx.resolve_namespace("AbsenceTracking.Services"), None);
+    }
+
     #[test]
     fn no_match() {
         let mut idx = AssemblyIndex::new();
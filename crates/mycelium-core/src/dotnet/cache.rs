@@ -0,0 +1,97 @@
+//! Modification-time keyed cache for parsed .csproj/.vbproj project files.
+
+use std::collections::HashMap;
+use std::path::{Path, PathBuf};
+use std::sync::{Arc, Mutex, PoisonError};
+use std::time::SystemTime;
+
+/// Bound on cached entries for long-lived processes. Once it is reached the
+/// whole cache is cleared; there is no LRU eviction of individual entries.
+const CACHE_CAPACITY: usize = 256;
+
+/// Caches a parsed value per file path, invalidated when the file's mtime changes.
+pub(crate) struct FileCache<T> {
+    entries: Mutex<HashMap<PathBuf, (SystemTime, Arc<T>)>>,
+}
+
+impl<T> FileCache<T> {
+    pub(crate) fn new() -> Self {
+        Self {
+            entries: Mutex::new(HashMap::new()),
+        }
+    }
+
+    /// Return the cached parse of `path`, or read and parse it with `parse`.
+    ///
+    /// Returns `None` if the file cannot be read. Files whose mtime is
+    /// unavailable are parsed every time rather than cached.
+    pub(crate) fn get_or_parse(
+        &self,
+        path: &Path,
+        parse: impl FnOnce(&[u8]) -> T,
+    ) -> Option<Arc<T>> {
+        let mtime = std::fs::metadata(path).and_then(|m| m.modified()).ok();
+
+        if let Some(mtime) = mtime {
+            let entries = self.entries.lock().unwrap_or_else(PoisonError::into_inner);
+            if let Some((cached_mtime, value)) = entries.get(path) {
+                if *cached_mtime == mtime {
+                    return Some(Arc::clone(value));
+                }
+            }
+        }
+
+        let bytes = std::fs::read(path).ok()?;
+        let value = Arc::new(parse(&bytes));
+
+        if let Some(mtime) = mtime {
+            let mut entries = self.entries.lock().unwrap_or_else(PoisonError::into_inner);
+            if entries.len() >= CACHE_CAPACITY {
+                entries.clear();
+            }
+            entries.insert(path.to_path_buf(), (mtime, Arc::clone(&value)));
+        }
+
+        Some(value)
+    }
+}
+
+impl<T> Default for FileCache<T> {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::time::Duration;
+
+    #[test]
+    fn reuses_parse_until_mtime_changes() {
+        let dir = tempfile::tempdir().unwrap();
+        let path = dir.path().join("App.csproj");
+        std::fs::write(&path, "first").unwrap();
+
+        let cache = FileCache::new();
+        let parse = |b: &[u8]| String::from_utf8_lossy(b).to_string();
+        let a = cache.get_or_parse(&path, parse).unwrap();
+        let b = cache.get_or_parse(&path, parse).unwrap();
+        assert!(Arc::ptr_eq(&a, &b));
+
+        std::fs::write(&path, "second").unwrap();
+        let file = std::fs::File::options().write(true).open(&path).unwrap();
+        file.set_modified(SystemTime::now() + Duration::from_secs(60))
+            .unwrap();
+        let c = cache.get_or_parse(&path, parse).unwrap();
+        assert_eq!(c.as_str(), "second");
+    }
+
+    #[test]
+    fn missing_file_is_none() {
+        let cache: FileCache<usize> = FileCache::new();
+        assert!(cache
+            .get_or_parse(Path::new("does/not/exist.csproj"), |b| b.len())
+            .is_none());
+    }
+}
@@ -1,3 +1,4 @@
 pub mod assembly;
+mod cache;
 pub mod project;
 pub mod solution;
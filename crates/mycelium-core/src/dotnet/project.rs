@@ -1,6 +1,9 @@
 //! .csproj/.vbproj XML parser.
 
 use std::path::Path;
+use std::sync::{Arc, LazyLock};
+
+use super::cache::FileCache;
 
 /// Parsed project file data.
 #[derive(Debug, Clone, Default)]
@@ -29,34 +32,52 @@ pub fn parse_project_file(content: &str, project_path: &str) -> ProjectFile {
     };
 
     // Simple XML parsing using quick approach — avoid pulling in a full XML library.
-    // We parse the key elements we need: PropertyGroup children, ProjectReference, PackageReference.
-
-    // Extract RootNamespace
-    if let Some(val) = extract_element_text(content, "RootNamespace") {
-        info.root_namespace = Some(val);
-    }
-
-    // Extract AssemblyName
-    if let Some(val) = extract_element_text(content, "AssemblyName") {
-        info.assembly_name = Some(val);
-    }
-
-    // Extract TargetFramework
-    if let Some(val) = extract_element_text(content, "TargetFramework") {
-        info.target_framework = Some(val);
-    } else if let Some(val) = extract_element_text(content, "TargetFrameworks") {
-        // Use the first framework listed
-        info.target_framework = Some(val.split(';').next().unwrap_or("").to_string());
-    }
-
-    // Extract ProjectReference Include attributes
-    for include in extract_include_attrs(content, "ProjectReference") {
-        info.project_references.push(include.replace('\\', "/"));
+    // A single forward scan visits each element start tag once and dispatches on
+    // the few tags we need; properties stop being searched once found.
+    let mut target_frameworks = None;
+    let mut pos = 0;
+    while let Some(offset) = content[pos..].find('<') {
+        let start = pos + offset;
+        pos = start + 1;
+        let rest = &content[start..];
+        let tag_end = rest[1..]
+            .find(|c: char| c.is_whitespace() || c == '>' || c == '/')
+            .map_or(rest.len(), |i| i + 1);
+
+        match &rest[1..tag_end] {
+            "RootNamespace" if info.root_namespace.is_none() => {
+                info.root_namespace = extract_element_text(rest, "RootNamespace");
+            }
+            "AssemblyName" if info.assembly_name.is_none() => {
+                info.assembly_name = extract_element_text(rest, "AssemblyName");
+            }
+            "TargetFramework" if info.target_framework.is_none() => {
+                info.target_framework = extract_element_text(rest, "TargetFramework");
+            }
+            "TargetFrameworks" if target_frameworks.is_none() => {
+                target_frameworks = extract_element_text(rest, "TargetFrameworks");
+            }
+            "ProjectReference" => {
+                if let Some(end) = rest.find('>') {
+                    if let Some(include) = extract_attr(&rest[..=end], "Include") {
+                        info.project_references.push(include.replace('\\', "/"));
+                    }
+                }
+            }
+            "PackageReference" => {
+                if let Some(pkg) = parse_package_ref(rest) {
+                    info.package_references.push(pkg);
+                }
+            }
+            _ => {}
+        }
     }
 
-    // Extract PackageReference Include + Version attributes
-    for (name, version) in extract_package_refs(content) {
-        info.package_references.push((name, version));
+    // Fall back to the first of multiple target frameworks
+    if info.target_framework.is_none() {
+        if let Some(val) = target_frameworks {
+            info.target_framework = Some(val.split(';').next().unwrap_or("").to_string());
+        }
     }
 
     // Defaults: if no RootNamespace/AssemblyName, derive from file name
@@ -70,6 +91,16 @@ pub fn parse_project_file(content: &str, project_path: &str) -> ProjectFile {
     info
 }
 
+static PROJECT_CACHE: LazyLock<FileCache<ProjectFile>> = LazyLock::new(FileCache::new);
+
+/// Read and parse a project file from disk, reusing the previous result while
+/// the file's modification time is unchanged. Returns `None` if it cannot be read.
+pub fn parse_project_path(full_path: &Path, project_path: &str) -> Option<Arc<ProjectFile>> {
+    PROJECT_CACHE.get_or_parse(full_path, |bytes| {
+        parse_project_file(&String::from_utf8_lossy(bytes), project_path)
+    })
+}
+
 /// Extract text content of a simple XML element like `<Tag>value</Tag>`.
 fn extract_element_text(content: &str, tag: &str) -> Option<String> {
     let open = format!("<{}>", tag);
@@ -87,77 +118,37 @@ fn extract_element_text(content: &str, tag: &str) -> Option<String> {
     None
 }
 
-/// Extract Include attribute values from elements like `<ProjectReference Include="..."/>`.
-fn extract_include_attrs(content: &str, tag: &str) -> Vec<String> {
-    let mut results = Vec::new();
-    let pattern = format!("<{}", tag);
-    let mut search_from = 0;
-
-    while let Some(pos) = content[search_from..].find(&pattern) {
-        let abs_pos = search_from + pos;
-        let rest = &content[abs_pos..];
-
-        // Find the end of this element (either /> or >)
-        if let Some(end) = rest.find('>') {
-            let element = &rest[..=end];
-            if let Some(include) = extract_attr(element, "Include") {
-                results.push(include);
-            }
-        }
-        search_from = abs_pos + pattern.len();
-    }
-    results
-}
+/// Parse a `<PackageReference ...>` element starting at the beginning of `rest`
+/// into its Include name and Version (attribute or child element).
+fn parse_package_ref(rest: &str) -> Option<(String, String)> {
+    // Find the end of this element — could be self-closing or have children
+    let end_pos = match (rest.find("/>"), rest.find('>')) {
+        (Some(sc), Some(gt)) if sc < gt => sc + 2,
+        (_, Some(gt)) => gt + 1,
+        (Some(sc), None) => sc + 2,
+        (None, None) => return None,
+    };
 
-/// Extract PackageReference entries with Include and Version attributes.
-fn extract_package_refs(content: &str) -> Vec<(String, String)> {
-    let mut results = Vec::new();
-    let pattern = "<PackageReference";
-    let mut search_from = 0;
-
-    while let Some(pos) = content[search_from..].find(pattern) {
-        let abs_pos = search_from + pos;
-        let rest = &content[abs_pos..];
-
-        // Find the end of this element — could be self-closing or have children
-        let end_pos = if let Some(sc) = rest.find("/>") {
-            if let Some(gt) = rest.find('>') {
-                if sc < gt {
-                    sc + 2
-                } else {
-                    gt + 1
-                }
-            } else {
-                sc + 2
-            }
-        } else if let Some(gt) = rest.find('>') {
-            gt + 1
-        } else {
-            search_from = abs_pos + pattern.len();
-            continue;
-        };
-
-        let element = &rest[..end_pos];
-        let name = extract_attr(element, "Include").unwrap_or_default();
-        let mut version = extract_attr(element, "Version").unwrap_or_default();
-
-        // If Version is not an attribute, check for child element
-        if version.is_empty() {
-            // Look for </PackageReference> closing tag
-            if let Some(close_pos) = rest.find("</PackageReference>") {
-                let inner = &rest[end_pos..close_pos];
-                if let Some(v) = extract_element_text(inner, "Version") {
-                    version = v;
-                }
+    let element = &rest[..end_pos];
+    let name = extract_attr(element, "Include").unwrap_or_default();
+    let mut version = extract_attr(element, "Version").unwrap_or_default();
+
+    // If Version is not an attribute, check for child element
+    if version.is_empty() {
+        // Look for </PackageReference> closing tag
+        if let Some(close_pos) = rest.find("</PackageReference>") {
+            let inner = &rest[end_pos..close_pos];
+            if let Some(v) = extract_element_text(inner, "Version") {
+                version = v;
             }
         }
+    }
 
-        if !name.is_empty() {
-            results.push((name, version));
-        }
-        search_from = abs_pos + pattern.len();
+    if name.is_empty() {
+        None
+    } else {
+        Some((name, version))
     }
-    results
 }
 
 /// Extract an attribute value from an XML element string.
@@ -231,4 +222,28 @@ mod tests {
         assert_eq!(info.root_namespace.as_deref(), Some("MyProject"));
         assert_eq!(info.assembly_name.as_deref(), Some("MyProject"));
     }
+
+    #[test]
+    fn parse_legacy_project_with_child_versions() {
+        let legacy = r#"<Project ToolsVersion="15.0">
+  <PropertyGroup>
+    <TargetFrameworks>net48;net8.0</TargetFrameworks>
+  </PropertyGroup>
+  <ItemGroup>
+    <PackageReference Include="Dapper">
+      <Version>2.1.0</Version>
+    </PackageReference>
+    <ProjectReference Include="..\Core\Core.vbproj">
+      <Name>Core</Name>
+    </ProjectReference>
+  </ItemGroup>
+</Project>"#;
+        let info = parse_project_file(legacy, "Legacy/Legacy.vbproj");
+        assert_eq!(info.target_framework.as_deref(), Some("net48"));
+        assert_eq!(
+            info.package_references,
+            vec![("Dapper".to_string(), "2.1.0".to_string())]
+        );
+        assert_eq!(info.project_references, vec!["../Core/Core.vbproj"]);
+    }
 }
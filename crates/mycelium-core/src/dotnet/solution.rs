@@ -1,6 +1,7 @@
 //! .sln text format parser.
 
 use regex::Regex;
+use std::path::Path;
 use std::sync::LazyLock;
 
 /// A project entry from a .sln file.
@@ -29,27 +30,33 @@ pub fn parse_solution(content: &str) -> Vec<SlnProject> {
     let mut projects = Vec::new();
 
     for cap in PROJECT_RE.captures_iter(content) {
-        let type_guid = cap[1].to_uppercase();
-        let name = cap[2].to_string();
-        let path = cap[3].replace('\\', "/");
-        let project_guid = cap[4].to_uppercase();
-
-        // Skip solution folders
-        if type_guid == SOLUTION_FOLDER_GUID {
+        // Skip solution folders before allocating any of the captures
+        if cap[1].eq_ignore_ascii_case(SOLUTION_FOLDER_GUID) {
             continue;
         }
 
         projects.push(SlnProject {
-            name,
-            path,
-            project_type_guid: type_guid,
-            project_guid,
+            name: cap[2].to_string(),
+            path: cap[3].replace('\\', "/"),
+            project_type_guid: cap[1].to_ascii_uppercase(),
+            project_guid: cap[4].to_ascii_uppercase(),
         });
     }
 
     projects
 }
 
+/// Read and parse a .sln file from disk in a single pass over its bytes.
+///
+/// Returns no projects if the file is missing or unreadable. Invalid UTF-8 is
+/// replaced rather than rejected, so a stray byte does not hide every project.
+pub fn parse_solution_file(path: &Path) -> Vec<SlnProject> {
+    match std::fs::read(path) {
+        Ok(bytes) => parse_solution(&String::from_utf8_lossy(&bytes)),
+        Err(_) => Vec::new(),
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -89,6 +96,23 @@ EndProject
         assert!(!projects[0].path.contains('\\'));
     }
 
+    #[test]
+    fn lowercase_folder_guid_skipped() {
+        let sln = SAMPLE_SLN.replace(SOLUTION_FOLDER_GUID, &SOLUTION_FOLDER_GUID.to_lowercase());
+        let projects = parse_solution(&sln);
+        assert_eq!(projects.len(), 2);
+        assert_eq!(
+            projects[0].project_type_guid,
+            "FAE04EC0-301F-11D3-BF4B-00C04F79EFBC"
+        );
+    }
+
+    #[test]
+    fn missing_solution_file() {
+        let projects = parse_solution_file(Path::new("does/not/exist.sln"));
+        assert!(projects.is_empty());
+    }
+
     #[test]
     fn empty_solution() {
         let projects = parse_solution("# empty file\n");
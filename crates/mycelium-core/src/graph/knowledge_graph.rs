@@ -1,12 +1,13 @@
 //! In-memory knowledge graph backed by petgraph::DiGraph.
 
-use petgraph::graph::{DiGraph, NodeIndex};
+use petgraph::graph::{DiGraph, EdgeIndex, NodeIndex};
 use petgraph::visit::EdgeRef;
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
+use std::sync::{Arc, OnceLock};
 
 use crate::config::{
     CallEdge, Community, FileNode, FolderNode, ImportEdge, PackageReference, Process,
-    ProjectReference, Symbol,
+    ProjectReference, Symbol, SymbolType, Visibility,
 };
 
 /// Node data stored in the graph.
@@ -25,10 +26,10 @@ pub enum NodeData {
     Symbol {
         id: String,
         name: String,
-        symbol_type: String,
+        symbol_type: SymbolType,
         file: String,
         line: usize,
-        visibility: String,
+        visibility: Visibility,
         exported: bool,
         parent: Option<String>,
         language: Option<String>,
@@ -113,8 +114,23 @@ impl EdgeData {
 /// Wrapper around petgraph::DiGraph with typed node/edge methods.
 pub struct KnowledgeGraph {
     graph: DiGraph<NodeData, EdgeData>,
-    /// O(1) string ID → NodeIndex lookup.
-    id_index: HashMap<String, NodeIndex>,
+    /// O(1) string ID → NodeIndex lookup. Keys are shared with `node_ids`.
+    id_index: HashMap<Arc<str>, NodeIndex>,
+    /// O(1) NodeIndex → string ID reverse lookup, indexed by node position.
+    node_ids: Vec<Arc<str>>,
+    /// Interned file paths named by import edges, shared by the import columns and indexes.
+    paths: HashSet<Arc<str>>,
+    /// O(1) import membership: from_file → set of to_file, maintained by add_import.
+    import_index: HashMap<Arc<str>, HashSet<Arc<str>>>,
+    /// Every file that is the target of at least one import edge.
+    import_targets: HashSet<Arc<str>>,
+    /// Import edges in insertion order, stored column-wise (from, to, graph edge).
+    /// The statement is owned by the `EdgeData::Imports` edge alone.
+    import_from: Vec<Arc<str>>,
+    import_to: Vec<Arc<str>>,
+    import_edges: Vec<EdgeIndex>,
+    /// Lazily built CSR view of call edges, dropped whenever nodes or calls are added.
+    call_csr: OnceLock<CallCsr>,
 }
 
 /// A flat dict-like representation of a symbol for queries.
@@ -132,6 +148,70 @@ pub struct SymbolInfo {
     pub parameter_types: Option<Vec<(String, String)>>,
 }
 
+/// A borrowed view of a symbol node, for queries that only read a few fields.
+#[derive(Debug, Clone, Copy)]
+pub struct SymbolRef<'a> {
+    pub id: &'a str,
+    pub name: &'a str,
+    pub symbol_type: SymbolType,
+    pub file: &'a str,
+    pub line: usize,
+    pub visibility: Visibility,
+    pub exported: bool,
+    pub parent: Option<&'a str>,
+    pub language: Option<&'a str>,
+    pub parameter_types: Option<&'a [(String, String)]>,
+}
+
+impl<'a> SymbolRef<'a> {
+    fn from_node(node: &'a NodeData) -> Option<Self> {
+        if let NodeData::Symbol {
+            id,
+            name,
+            symbol_type,
+            file,
+            line,
+            visibility,
+            exported,
+            parent,
+            language,
+            parameter_types,
+        } = node
+        {
+            Some(Self {
+                id,
+                name,
+                symbol_type: *symbol_type,
+                file,
+                line: *line,
+                visibility: *visibility,
+                exported: *exported,
+                parent: parent.as_deref(),
+                language: language.as_deref(),
+                parameter_types: parameter_types.as_deref(),
+            })
+        } else {
+            None
+        }
+    }
+
+    /// Copy the borrowed fields into an owned `SymbolInfo`.
+    pub fn to_info(&self) -> SymbolInfo {
+        SymbolInfo {
+            id: self.id.to_string(),
+            name: self.name.to_string(),
+            symbol_type: self.symbol_type.as_str().to_string(),
+            file: self.file.to_string(),
+            line: self.line,
+            visibility: self.visibility.as_str().to_string(),
+            exported: self.exported,
+            parent: self.parent.map(str::to_string),
+            language: self.language.map(str::to_string),
+            parameter_types: self.parameter_types.map(<[_]>::to_vec),
+        }
+    }
+}
+
 /// A flat representation of a caller/callee query result.
 #[derive(Debug, Clone)]
 pub struct CallInfo {
@@ -142,11 +222,104 @@ pub struct CallInfo {
     pub line: usize,
 }
 
+/// Compressed sparse row view of the call edges, indexed by node position.
+///
+/// Each node's callees sit in one contiguous slice, in the same order
+/// `get_callees` reports them, so traversals scan plain index arrays
+/// instead of walking petgraph edge lists and resolving string IDs.
+#[derive(Debug, Clone, Default)]
+pub struct CallCsr {
+    /// Node index → start of its callees; one extra trailing entry.
+    offsets: Vec<usize>,
+    targets: Vec<usize>,
+    confidence: Vec<f64>,
+}
+
+impl CallCsr {
+    fn build(graph: &DiGraph<NodeData, EdgeData>) -> Self {
+        let mut offsets = Vec::with_capacity(graph.node_count() + 1);
+        let mut targets = Vec::new();
+        let mut confidence = Vec::new();
+        offsets.push(0);
+        for node in graph.node_indices() {
+            for edge in graph.edges_directed(node, petgraph::Direction::Outgoing) {
+                if let EdgeData::Calls { confidence: c, .. } = edge.weight() {
+                    targets.push(edge.target().index());
+                    confidence.push(*c);
+                }
+            }
+            offsets.push(targets.len());
+        }
+        Self {
+            offsets,
+            targets,
+            confidence,
+        }
+    }
+
+    /// Number of nodes covered by the view.
+    pub fn node_count(&self) -> usize {
+        self.offsets.len().saturating_sub(1)
+    }
+
+    /// Callee node indices of `node`.
+    pub fn callees(&self, node: usize) -> &[usize] {
+        &self.targets[self.offsets[node]..self.offsets[node + 1]]
+    }
+
+    /// Confidences of `node`'s call edges, parallel to `callees`.
+    pub fn confidences(&self, node: usize) -> &[f64] {
+        &self.confidence[self.offsets[node]..self.offsets[node + 1]]
+    }
+
+    /// Number of call edges leaving `node`.
+    pub fn out_degree(&self, node: usize) -> usize {
+        self.offsets[node + 1] - self.offsets[node]
+    }
+
+    /// Number of call edges entering each node, in one pass over the targets.
+    pub fn in_degrees(&self) -> Vec<usize> {
+        let mut degrees = vec![0; self.node_count()];
+        for &target in &self.targets {
+            degrees[target] += 1;
+        }
+        degrees
+    }
+
+    /// Copy of this view with each node's callees ordered by confidence
+    /// descending; equal confidences keep their original order.
+    pub fn sorted_by_confidence(&self) -> Self {
+        let mut sorted = self.clone();
+        for node in 0..self.node_count() {
+            let range = self.offsets[node]..self.offsets[node + 1];
+            let mut row: Vec<(usize, f64)> = self.targets[range.clone()]
+                .iter()
+                .copied()
+                .zip(self.confidence[range.clone()].iter().copied())
+                .collect();
+            row.sort_by(|a, b| b.1.partial_cmp(&a.1).unwrap_or(std::cmp::Ordering::Equal));
+            for (slot, (target, conf)) in range.zip(row) {
+                sorted.targets[slot] = target;
+                sorted.confidence[slot] = conf;
+            }
+        }
+        sorted
+    }
+}
+
 impl KnowledgeGraph {
     pub fn new() -> Self {
         Self {
             graph: DiGraph::new(),
             id_index: HashMap::new(),
+            node_ids: Vec::new(),
+            paths: HashSet::new(),
+            import_index: HashMap::new(),
+            import_targets: HashSet::new(),
+            import_from: Vec::new(),
+            import_to: Vec::new(),
+            import_edges: Vec::new(),
+            call_csr: OnceLock::new(),
         }
     }
 
@@ -156,7 +329,10 @@ impl KnowledgeGraph {
             idx
         } else {
             let idx = self.graph.add_node(data);
-            self.id_index.insert(id.to_string(), idx);
+            let id: Arc<str> = Arc::from(id);
+            self.node_ids.push(Arc::clone(&id));
+            self.id_index.insert(id, idx);
+            self.call_csr.take();
             idx
         }
     }
@@ -178,6 +354,16 @@ impl KnowledgeGraph {
         self.id_index.contains_key(id)
     }
 
+    /// Return the shared copy of a file path, interning it on first sight.
+    fn intern_path(&mut self, path: &str) -> Arc<str> {
+        if let Some(existing) = self.paths.get(path) {
+            return Arc::clone(existing);
+        }
+        let interned: Arc<str> = Arc::from(path);
+        self.paths.insert(Arc::clone(&interned));
+        interned
+    }
+
     // --- Node addition ---
 
     pub fn add_file(&mut self, node: &FileNode) {
@@ -210,10 +396,10 @@ impl KnowledgeGraph {
             NodeData::Symbol {
                 id: symbol.id.clone(),
                 name: symbol.name.clone(),
-                symbol_type: symbol.symbol_type.as_str().to_string(),
+                symbol_type: symbol.symbol_type,
                 file: symbol.file.clone(),
                 line: symbol.line,
-                visibility: symbol.visibility.as_str().to_string(),
+                visibility: symbol.visibility,
                 exported: symbol.exported,
                 parent: symbol.parent.clone(),
                 language: symbol.language.clone(),
@@ -237,9 +423,10 @@ impl KnowledgeGraph {
 
     pub fn add_call(&mut self, edge: &CallEdge) {
         if let (Some(&from_idx), Some(&to_idx)) = (
-            self.id_index.get(&edge.from_symbol),
-            self.id_index.get(&edge.to_symbol),
+            self.id_index.get(edge.from_symbol.as_str()),
+            self.id_index.get(edge.to_symbol.as_str()),
         ) {
+            self.call_csr.take();
             self.graph.add_edge(
                 from_idx,
                 to_idx,
@@ -253,6 +440,26 @@ impl KnowledgeGraph {
         }
     }
 
+    /// Add many symbols at once, reserving node, edge and index capacity up front.
+    pub fn add_symbols(&mut self, symbols: &[Symbol]) {
+        let graph = &mut self.graph;
+        graph.reserve_nodes(symbols.len());
+        graph.reserve_edges(symbols.len());
+        self.id_index.reserve(symbols.len());
+        self.node_ids.reserve(symbols.len());
+        for symbol in symbols {
+            self.add_symbol(symbol);
+        }
+    }
+
+    /// Add many call edges at once, reserving edge capacity up front.
+    pub fn add_calls(&mut self, edges: &[CallEdge]) {
+        self.graph.reserve_edges(edges.len());
+        for edge in edges {
+            self.add_call(edge);
+        }
+    }
+
     pub fn add_import(&mut self, edge: &ImportEdge) {
         let from_id = format!("file:{}", edge.from_file);
         let to_id = format!("file:{}", edge.to_file);
@@ -274,13 +481,23 @@ impl KnowledgeGraph {
                 lines: 0,
             },
         );
-        self.graph.add_edge(
+        let edge_idx = self.graph.add_edge(
             from_idx,
             to_idx,
             EdgeData::Imports {
                 statement: edge.statement.clone(),
             },
         );
+        let from = self.intern_path(&edge.from_file);
+        let to = self.intern_path(&edge.to_file);
+        self.import_index
+            .entry(Arc::clone(&from))
+            .or_default()
+            .insert(Arc::clone(&to));
+        self.import_targets.insert(Arc::clone(&to));
+        self.import_from.push(from);
+        self.import_to.push(to);
+        self.import_edges.push(edge_idx);
     }
 
     pub fn add_project_reference(&mut self, reference: &ProjectReference) {
@@ -342,7 +559,7 @@ impl KnowledgeGraph {
             },
         );
         for member in &community.members {
-            if let Some(&member_idx) = self.id_index.get(member) {
+            if let Some(&member_idx) = self.id_index.get(member.as_str()) {
                 self.graph
                     .add_edge(member_idx, comm_idx, EdgeData::MemberOf);
             }
@@ -361,7 +578,7 @@ impl KnowledgeGraph {
             },
         );
         for (i, step) in process.steps.iter().enumerate() {
-            if let Some(&step_idx) = self.id_index.get(step) {
+            if let Some(&step_idx) = self.id_index.get(step.as_str()) {
                 self.graph
                     .add_edge(proc_idx, step_idx, EdgeData::Step { order: i });
             }
@@ -385,79 +602,32 @@ impl KnowledgeGraph {
     }
 
     pub fn get_symbols(&self) -> Vec<SymbolInfo> {
-        self.graph
-            .node_weights()
-            .filter_map(|n| {
-                if let NodeData::Symbol {
-                    id,
-                    name,
-                    symbol_type,
-                    file,
-                    line,
-                    visibility,
-                    exported,
-                    parent,
-                    language,
-                    parameter_types,
-                } = n
-                {
-                    Some(SymbolInfo {
-                        id: id.clone(),
-                        name: name.clone(),
-                        symbol_type: symbol_type.clone(),
-                        file: file.clone(),
-                        line: *line,
-                        visibility: visibility.clone(),
-                        exported: *exported,
-                        parent: parent.clone(),
-                        language: language.clone(),
-                        parameter_types: parameter_types.clone(),
-                    })
-                } else {
-                    None
-                }
-            })
-            .collect()
+        self.iter_symbols().map(|s| s.to_info()).collect()
+    }
+
+    /// Iterate symbols as borrowed views, without cloning any fields.
+    pub fn iter_symbols(&self) -> impl Iterator<Item = SymbolRef<'_>> + '_ {
+        self.graph.node_weights().filter_map(SymbolRef::from_node)
+    }
+
+    /// Look up a single symbol by id.
+    pub fn symbol(&self, id: &str) -> Option<SymbolRef<'_>> {
+        let &idx = self.id_index.get(id)?;
+        self.graph.node_weight(idx).and_then(SymbolRef::from_node)
     }
 
     pub fn get_symbols_in_file(&self, path: &str) -> Vec<SymbolInfo> {
         let file_id = format!("file:{path}");
-        let Some(&file_idx) = self.id_index.get(&file_id) else {
+        let Some(&file_idx) = self.id_index.get(file_id.as_str()) else {
             return Vec::new();
         };
-        let mut result = Vec::new();
-        for edge_idx in self.graph.edges(file_idx) {
-            if matches!(edge_idx.weight(), EdgeData::Defines) {
-                let target_idx = edge_idx.target();
-                if let Some(NodeData::Symbol {
-                    id,
-                    name,
-                    symbol_type,
-                    file,
-                    line,
-                    visibility,
-                    exported,
-                    parent,
-                    language,
-                    parameter_types,
-                }) = self.graph.node_weight(target_idx)
-                {
-                    result.push(SymbolInfo {
-                        id: id.clone(),
-                        name: name.clone(),
-                        symbol_type: symbol_type.clone(),
-                        file: file.clone(),
-                        line: *line,
-                        visibility: visibility.clone(),
-                        exported: *exported,
-                        parent: parent.clone(),
-                        language: language.clone(),
-                        parameter_types: parameter_types.clone(),
-                    });
-                }
-            }
-        }
-        result
+        self.graph
+            .edges(file_idx)
+            .filter(|edge| matches!(edge.weight(), EdgeData::Defines))
+            .filter_map(|edge| self.graph.node_weight(edge.target()))
+            .filter_map(SymbolRef::from_node)
+            .map(|s| s.to_info())
+            .collect()
     }
 
     pub fn get_callers(&self, symbol_id: &str) -> Vec<CallInfo> {
@@ -477,7 +647,6 @@ impl KnowledgeGraph {
             } = edge.weight()
             {
                 let source_idx = edge.source();
-                // Find the source ID from id_index (reverse lookup)
                 if let Some(source_id) = self.node_id(source_idx) {
                     result.push(CallInfo {
                         id: source_id,
@@ -523,6 +692,11 @@ impl KnowledgeGraph {
         result
     }
 
+    /// CSR view of the call edges, built on first use after a change.
+    pub fn call_csr(&self) -> &CallCsr {
+        self.call_csr.get_or_init(|| CallCsr::build(&self.graph))
+    }
+
     pub fn get_call_edges(&self) -> Vec<(String, String, f64, String, String, usize)> {
         let mut result = Vec::new();
         for edge in self.graph.edge_indices() {
@@ -551,23 +725,41 @@ impl KnowledgeGraph {
     }
 
     pub fn get_import_edges(&self) -> Vec<(String, String, String)> {
-        let mut result = Vec::new();
-        for edge in self.graph.edge_indices() {
-            if let Some(EdgeData::Imports { statement }) = self.graph.edge_weight(edge) {
-                let (src_idx, tgt_idx) = self.graph.edge_endpoints(edge).unwrap();
-                if let (Some(src_id), Some(tgt_id)) = (self.node_id(src_idx), self.node_id(tgt_idx))
-                {
-                    let src_path = src_id.strip_prefix("file:").unwrap_or(&src_id);
-                    let tgt_path = tgt_id.strip_prefix("file:").unwrap_or(&tgt_id);
-                    result.push((
-                        src_path.to_string(),
-                        tgt_path.to_string(),
-                        statement.clone(),
-                    ));
-                }
-            }
-        }
-        result
+        self.iter_import_edges()
+            .map(|(from, to, statement)| (from.to_string(), to.to_string(), statement.to_string()))
+            .collect()
+    }
+
+    /// Iterate import edges as borrowed (from_file, to_file, statement) tuples.
+    pub fn iter_import_edges(&self) -> impl Iterator<Item = (&str, &str, &str)> + '_ {
+        self.import_from
+            .iter()
+            .zip(&self.import_to)
+            .zip(&self.import_edges)
+            .map(|((from, to), &edge_idx)| {
+                let statement = match &self.graph[edge_idx] {
+                    EdgeData::Imports { statement } => statement.as_str(),
+                    _ => "",
+                };
+                (&**from, &**to, statement)
+            })
+    }
+
+    /// Import edges as parallel (from_file, to_file) columns, without copying.
+    pub fn get_import_edges_raw(&self) -> (&[Arc<str>], &[Arc<str>]) {
+        (&self.import_from, &self.import_to)
+    }
+
+    /// Check whether `from_file` imports `to_file` without scanning the edge list.
+    pub fn has_import_edge(&self, from_file: &str, to_file: &str) -> bool {
+        self.import_index
+            .get(from_file)
+            .is_some_and(|targets| targets.contains(to_file))
+    }
+
+    /// All resolved import target paths, deduplicated.
+    pub fn import_targets(&self) -> &HashSet<Arc<str>> {
+        &self.import_targets
     }
 
     pub fn get_project_references(&self) -> Vec<(String, String, String)> {
@@ -698,13 +890,7 @@ impl KnowledgeGraph {
 
     /// Reverse lookup: NodeIndex → String ID.
     fn node_id(&self, idx: NodeIndex) -> Option<String> {
-        // Build reverse lookup from id_index
-        for (id, &node_idx) in &self.id_index {
-            if node_idx == idx {
-                return Some(id.clone());
-            }
-        }
-        None
+        self.node_ids.get(idx.index()).map(|id| id.to_string())
     }
 
     /// Access the underlying petgraph for algorithms that need it.
@@ -713,9 +899,14 @@ impl KnowledgeGraph {
     }
 
     /// Access the ID index for external algorithms.
-    pub fn id_index(&self) -> &HashMap<String, NodeIndex> {
+    pub fn id_index(&self) -> &HashMap<Arc<str>, NodeIndex> {
         &self.id_index
     }
+
+    /// String IDs by node position, for algorithms working on `NodeIndex::index()`.
+    pub fn node_ids(&self) -> &[Arc<str>] {
+        &self.node_ids
+    }
 }
 
 impl Default for KnowledgeGraph {
@@ -769,6 +960,12 @@ mod tests {
         let syms = kg.get_symbols_in_file("src/main.cs");
         assert_eq!(syms.len(), 1);
         assert_eq!(syms[0].name, "Run");
+
+        let sym = kg.symbol("sym:MyClass.Run").unwrap();
+        assert_eq!(sym.symbol_type, SymbolType::Method);
+        assert_eq!(sym.parent, Some("MyClass"));
+        assert!(kg.symbol("file:src/main.cs").is_none());
+        assert_eq!(kg.iter_symbols().count(), 1);
     }
 
     #[test]
@@ -819,6 +1016,122 @@ mod tests {
         assert_eq!(callers[0].id, "sym:A");
     }
 
+    #[test]
+    fn call_csr_follows_callee_order_and_invalidates() {
+        let mut kg = KnowledgeGraph::new();
+        for id in ["sym:A", "sym:B", "sym:C"] {
+            kg.add_symbol(&Symbol {
+                id: id.to_string(),
+                name: id.to_string(),
+                symbol_type: SymbolType::Method,
+                file: "a.cs".to_string(),
+                line: 1,
+                visibility: Visibility::Public,
+                exported: true,
+                parent: None,
+                language: None,
+                byte_range: None,
+                parameter_types: None,
+            });
+        }
+        let call = |to: &str, confidence: f64| CallEdge {
+            from_symbol: "sym:A".to_string(),
+            to_symbol: to.to_string(),
+            confidence,
+            tier: "A".to_string(),
+            reason: "import-resolved".to_string(),
+            line: 1,
+        };
+        kg.add_call(&call("sym:B", 0.5));
+        let index = |kg: &KnowledgeGraph, id: &str| kg.get_node_index(id).unwrap().index();
+        let (a, b, c) = (
+            index(&kg, "sym:A"),
+            index(&kg, "sym:B"),
+            index(&kg, "sym:C"),
+        );
+        assert_eq!(kg.call_csr().callees(a), &[b]);
+
+        kg.add_call(&call("sym:C", 0.9));
+        let csr = kg.call_csr();
+        let expected: Vec<usize> = kg
+            .get_callees("sym:A")
+            .iter()
+            .map(|c| index(&kg, &c.id))
+            .collect();
+        assert_eq!(csr.callees(a), expected.as_slice());
+        assert!(csr.callees(b).is_empty());
+        assert_eq!(csr.out_degree(a), 2);
+        assert_eq!(csr.in_degrees()[b], 1);
+
+        let sorted = csr.sorted_by_confidence();
+        assert_eq!(sorted.callees(a), &[c, b]);
+        assert_eq!(sorted.confidences(a), &[0.9, 0.5]);
+    }
+
+    #[test]
+    fn node_ids_share_keys_with_id_index() {
+        let mut kg = KnowledgeGraph::new();
+        kg.add_file(&FileNode {
+            path: "src/a.cs".to_string(),
+            language: Some("C#".to_string()),
+            size: 1,
+            lines: 1,
+        });
+        kg.add_folder(&FolderNode {
+            path: "src".to_string(),
+            file_count: 1,
+        });
+        assert_eq!(kg.node_ids().len(), kg.id_index().len());
+        for (id, idx) in kg.id_index() {
+            let reverse = &kg.node_ids()[idx.index()];
+            assert!(Arc::ptr_eq(id, reverse), "{id} should be interned once");
+            assert_eq!(kg.node_id(*idx).as_deref(), Some(&**id));
+        }
+    }
+
+    #[test]
+    fn bulk_adds_match_individual_adds() {
+        let symbols: Vec<Symbol> = ["sym:A", "sym:B", "sym:C"]
+            .into_iter()
+            .map(|id| Symbol {
+                id: id.to_string(),
+                name: id.to_string(),
+                symbol_type: SymbolType::Method,
+                file: "a.cs".to_string(),
+                line: 1,
+                visibility: Visibility::Public,
+                exported: true,
+                parent: None,
+                language: None,
+                byte_range: None,
+                parameter_types: None,
+            })
+            .collect();
+        let calls: Vec<CallEdge> = [("sym:A", "sym:B"), ("sym:B", "sym:C"), ("sym:A", "sym:X")]
+            .into_iter()
+            .map(|(from, to)| CallEdge {
+                from_symbol: from.to_string(),
+                to_symbol: to.to_string(),
+                confidence: 0.85,
+                tier: "A".to_string(),
+                reason: "import-resolved".to_string(),
+                line: 1,
+            })
+            .collect();
+
+        let mut one_by_one = KnowledgeGraph::new();
+        symbols.iter().for_each(|s| one_by_one.add_symbol(s));
+        calls.iter().for_each(|c| one_by_one.add_call(c));
+
+        let mut bulk = KnowledgeGraph::new();
+        bulk.add_symbols(&symbols);
+        bulk.add_calls(&calls);
+
+        assert_eq!(bulk.symbol_count(), one_by_one.symbol_count());
+        assert_eq!(bulk.get_call_edges().len(), 2);
+        assert_eq!(bulk.node_ids(), one_by_one.node_ids());
+    }
+
     #[test]
     fn add_folder_and_query() {
         let mut kg = KnowledgeGraph::new();
@@ -844,6 +1157,44 @@ mod tests {
         assert_eq!(edges.len(), 1);
         assert_eq!(edges[0].0, "a.cs");
         assert_eq!(edges[0].1, "b.cs");
+        assert!(kg.has_import_edge("a.cs", "b.cs"));
+        assert!(!kg.has_import_edge("b.cs", "a.cs"));
+        assert!(!kg.has_import_edge("a.cs", "c.cs"));
+        assert_eq!(
+            kg.iter_import_edges().collect::<Vec<_>>(),
+            vec![("a.cs", "b.cs", "using B")]
+        );
+        let (from, to) = kg.get_import_edges_raw();
+        assert_eq!(from.len(), 1);
+        assert_eq!(&*from[0], "a.cs");
+        assert_eq!(&*to[0], "b.cs");
+        assert!(kg.import_targets().contains("b.cs"));
+        assert!(!kg.import_targets().contains("a.cs"));
+    }
+
+    #[test]
+    fn import_paths_are_interned() {
+        let mut kg = KnowledgeGraph::new();
+        for from in ["a.cs", "c.cs"] {
+            kg.add_import(&crate::config::ImportEdge {
+                from_file: from.to_string(),
+                to_file: "b.cs".to_string(),
+                statement: "using B".to_string(),
+            });
+        }
+        let (_, to) = kg.get_import_edges_raw();
+        assert!(Arc::ptr_eq(&to[0], &to[1]));
+        assert_eq!(kg.import_targets().len(), 1);
+
+        // Only import endpoints are interned; file nodes keep their own path
+        kg.add_file(&FileNode {
+            path: "d.cs".to_string(),
+            language: Some("C#".to_string()),
+            size: 0,
+            lines: 0,
+        });
+        assert_eq!(kg.paths.len(), 3);
+        assert!(!kg.paths.contains("d.cs"));
     }
 
     #[test]
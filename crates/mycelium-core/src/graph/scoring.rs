@@ -1,10 +1,11 @@
 //! Entry point scoring for process detection.
 
 use regex::Regex;
-use std::collections::HashSet;
+use std::collections::{HashMap, HashSet};
 use std::sync::LazyLock;
 
-use crate::graph::knowledge_graph::KnowledgeGraph;
+use crate::config::SymbolType;
+use crate::graph::knowledge_graph::{CallCsr, KnowledgeGraph};
 
 /// Name patterns that suggest entry points.
 static ENTRY_PATTERNS: LazyLock<Vec<Regex>> = LazyLock::new(|| {
@@ -39,16 +40,16 @@ static UTILITY_SEGMENTS: LazyLock<HashSet<&str>> = LazyLock::new(|| {
     .collect()
 });
 
-/// Path patterns that indicate test files.
-static TEST_PATH_PATTERNS: LazyLock<Vec<Regex>> = LazyLock::new(|| {
-    vec![
-        Regex::new(r"(?i)(?:^|[/\\])tests?[/\\]").unwrap(),
-        Regex::new(r"(?i)(?:^|[/\\])specs?[/\\]").unwrap(),
-        Regex::new(r"(?i)(?:^|[/\\])__tests__[/\\]").unwrap(),
-        Regex::new(r"(?i)(?:^|[/\\])TestHarness[/\\]").unwrap(),
-        Regex::new(r"(?i)(?:Tests?|Specs?|_test|_spec)\.").unwrap(),
-        Regex::new(r"(?i)\.Tests?[/\\]").unwrap(),
-    ]
+/// Path patterns that indicate test files, as one alternation so each path
+/// is scanned once: test/spec/__tests__/TestHarness directories, test-named
+/// files, and dot-separated test projects.
+static TEST_PATH_PATTERN: LazyLock<Regex> = LazyLock::new(|| {
+    Regex::new(concat!(
+        r"(?i)(?:^|[/\\])(?:tests?|specs?|__tests__|TestHarness)[/\\]",
+        r"|(?:Tests?|Specs?|_test|_spec)\.",
+        r"|\.Tests?[/\\]",
+    ))
+    .unwrap()
 });
 
 /// Framework types that should never be entry points.
@@ -68,29 +69,56 @@ static FRAMEWORK_TYPE_EXCLUSIONS: LazyLock<HashSet<&str>> = LazyLock::new(|| {
 });
 
 /// Quick BFS probe to measure reachable depth from a symbol.
-fn probe_depth(kg: &KnowledgeGraph, sym_id: &str, max_hops: usize) -> usize {
-    let mut visited = HashSet::new();
-    visited.insert(sym_id.to_string());
-    let mut frontier: Vec<String> = vec![sym_id.to_string()];
-    let mut depth = 0;
-
-    for _ in 0..max_hops {
-        let mut next_frontier = Vec::new();
-        for node in &frontier {
-            for callee in kg.get_callees(node) {
-                if !visited.contains(&callee.id) {
-                    visited.insert(callee.id.clone());
-                    next_frontier.push(callee.id);
+///
+/// Walks the graph's CSR call view and reuses its visited buffer across
+/// probes via a generation stamp, so each probe only touches the nodes it
+/// reaches.
+struct DepthProbe<'a> {
+    calls: &'a CallCsr,
+    /// Node index → stamp of the last probe that visited it.
+    seen: Vec<u32>,
+    stamp: u32,
+    frontier: Vec<usize>,
+    next_frontier: Vec<usize>,
+}
+
+impl<'a> DepthProbe<'a> {
+    fn new(kg: &'a KnowledgeGraph) -> Self {
+        let calls = kg.call_csr();
+        Self {
+            calls,
+            seen: vec![0; calls.node_count()],
+            stamp: 0,
+            frontier: Vec::new(),
+            next_frontier: Vec::new(),
+        }
+    }
+
+    fn depth(&mut self, start: usize, max_hops: usize) -> usize {
+        self.stamp += 1;
+        self.seen[start] = self.stamp;
+        self.frontier.clear();
+        self.frontier.push(start);
+        let mut depth = 0;
+
+        for _ in 0..max_hops {
+            self.next_frontier.clear();
+            for &node in &self.frontier {
+                for &callee in self.calls.callees(node) {
+                    if self.seen[callee] != self.stamp {
+                        self.seen[callee] = self.stamp;
+                        self.next_frontier.push(callee);
+                    }
                 }
             }
+            if self.next_frontier.is_empty() {
+                break;
+            }
+            std::mem::swap(&mut self.frontier, &mut self.next_frontier);
+            depth += 1;
         }
-        if next_frontier.is_empty() {
-            break;
-        }
-        frontier = next_frontier;
-        depth += 1;
+        depth
     }
-    depth
 }
 
 /// Score all symbols as potential entry points.
@@ -100,31 +128,40 @@ fn probe_depth(kg: &KnowledgeGraph, sym_id: &str, max_hops: usize) -> usize {
 /// score = base_score * export_multiplier * name_multiplier * utility_penalty * depth_bonus
 pub fn score_entry_points(kg: &KnowledgeGraph) -> Vec<(String, f64)> {
     let mut scores: Vec<(String, f64)> = Vec::new();
+    let mut probe = DepthProbe::new(kg);
+    let calls = kg.call_csr();
+    let in_degrees = calls.in_degrees();
+    let mut test_files: HashMap<&str, bool> = HashMap::new();
 
-    for sym in kg.get_symbols() {
+    for sym in kg.iter_symbols() {
         // Only score methods, functions, constructors
-        if sym.symbol_type != "Method"
-            && sym.symbol_type != "Function"
-            && sym.symbol_type != "Constructor"
-        {
+        if !matches!(
+            sym.symbol_type,
+            SymbolType::Method | SymbolType::Function | SymbolType::Constructor
+        ) {
             continue;
         }
 
         // Skip framework types
-        if FRAMEWORK_TYPE_EXCLUSIONS.contains(sym.name.as_str()) {
+        if FRAMEWORK_TYPE_EXCLUSIONS.contains(sym.name) {
             continue;
         }
 
         // Skip test file symbols
-        if TEST_PATH_PATTERNS.iter().any(|p| p.is_match(&sym.file)) {
+        let is_test = *test_files
+            .entry(sym.file)
+            .or_insert_with(|| TEST_PATH_PATTERN.is_match(sym.file));
+        if is_test {
             continue;
         }
 
+        let Some(node) = kg.get_node_index(sym.id).map(|idx| idx.index()) else {
+            continue;
+        };
+
         // Base score: callees / (callers + 1)
-        let callees = kg.get_callees(&sym.id);
-        let callers = kg.get_callers(&sym.id);
-        let out_degree = callees.len() as f64;
-        let in_degree = callers.len() as f64;
+        let out_degree = calls.out_degree(node) as f64;
+        let in_degree = in_degrees[node] as f64;
         let base_score = out_degree / (in_degree + 1.0);
 
         if base_score == 0.0 {
@@ -137,14 +174,14 @@ pub fn score_entry_points(kg: &KnowledgeGraph) -> Vec<(String, f64)> {
         // Name multiplier
         let mut name_mult: f64 = 1.0;
         for pattern in ENTRY_PATTERNS.iter() {
-            if pattern.is_match(&sym.name) {
+            if pattern.is_match(sym.name) {
                 name_mult = 1.5;
                 break;
             }
         }
 
         // Also check parent class name for controller patterns
-        if let Some(ref parent) = sym.parent {
+        if let Some(parent) = sym.parent {
             for pattern in ENTRY_PATTERNS.iter() {
                 if pattern.is_match(parent) {
                     name_mult = name_mult.max(1.3);
@@ -164,11 +201,11 @@ pub fn score_entry_points(kg: &KnowledgeGraph) -> Vec<(String, f64)> {
         }
 
         // Depth bonus: reward symbols that can reach deeper call chains
-        let depth = probe_depth(kg, &sym.id, 3);
+        let depth = probe.depth(node, 3);
         let depth_bonus = 1.0 + (depth as f64 * 0.5);
 
         let score = base_score * export_mult * name_mult * utility_penalty * depth_bonus;
-        scores.push((sym.id.clone(), score));
+        scores.push((sym.id.to_string(), score));
     }
 
     scores.sort_by(|a, b| b.1.partial_cmp(&a.1).unwrap_or(std::cmp::Ordering::Equal));
@@ -499,4 +536,48 @@ mod tests {
             "Parent controller pattern should boost score"
         );
     }
+
+    #[test]
+    fn depth_probe_reuses_buffers_across_cycles() {
+        let mut kg = KnowledgeGraph::new();
+        kg.add_symbol(&make_method("sym:A", "Run", "src/a.cs", true));
+        kg.add_symbol(&make_method("sym:B", "Step", "src/b.cs", true));
+        kg.add_symbol(&make_method("sym:C", "Leaf", "src/c.cs", true));
+        for (from, to) in [("sym:A", "sym:B"), ("sym:B", "sym:A"), ("sym:B", "sym:C")] {
+            kg.add_call(&CallEdge {
+                from_symbol: from.to_string(),
+                to_symbol: to.to_string(),
+                confidence: 0.85,
+                tier: "A".to_string(),
+                reason: "import".to_string(),
+                line: 1,
+            });
+        }
+        let index = |id: &str| kg.get_node_index(id).unwrap().index();
+
+        let mut probe = DepthProbe::new(&kg);
+        assert_eq!(probe.depth(index("sym:A"), 3), 2);
+        assert_eq!(probe.depth(index("sym:B"), 3), 1);
+        assert_eq!(probe.depth(index("sym:C"), 3), 0);
+        assert_eq!(probe.depth(index("sym:A"), 1), 1);
+    }
+
+    #[test]
+    fn test_path_pattern_matches_each_convention() {
+        for path in [
+            "tests/main.cs",
+            "src/Spec/runner.cs",
+            "web/__tests__/app.ts",
+            "App/TestHarness/Run.cs",
+            "src/OrderServiceTests.cs",
+            "pkg/handler_test.go",
+            "App.Tests/Startup.cs",
+            "src\\test\\Main.java",
+        ] {
+            assert!(TEST_PATH_PATTERN.is_match(path), "{path} should match");
+        }
+        for path in ["src/main.cs", "src/contest/entry.cs", "src/Testing.cs"] {
+            assert!(!TEST_PATH_PATTERN.is_match(path), "{path} should not match");
+        }
+    }
 }
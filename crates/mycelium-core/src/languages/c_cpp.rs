@@ -5,7 +5,7 @@ use std::sync::LazyLock;
 
 use tree_sitter::{Language, Node, Tree};
 
-use super::LanguageAnalyser;
+use super::{is_builtin_call, kind_ids, walk_tree, LanguageAnalyser};
 use crate::config::{ImportStatement, RawCall, Symbol, SymbolType, Visibility};
 
 static C_BUILTIN_EXCLUSIONS: LazyLock<HashSet<String>> = LazyLock::new(|| {
@@ -72,37 +72,34 @@ fn is_preproc_container(kind: &str) -> bool {
 // ---- Shared C/C++ helpers ----
 
 fn get_func_name(node: &Node, source: &[u8]) -> Option<String> {
-    for i in 0..node.child_count() {
-        if let Some(child) = node.child(i) {
-            if child.kind() == "function_declarator" {
-                for j in 0..child.child_count() {
-                    if let Some(c) = child.child(j) {
-                        if c.kind() == "identifier" {
-                            return c.utf8_text(source).ok().map(|s| s.to_string());
-                        }
-                    }
-                }
-            }
-            if child.kind() == "pointer_declarator" {
-                let result = get_func_name(&child, source);
-                if result.is_some() {
-                    return result;
+    let mut cursor = node.walk();
+    for child in node.children(&mut cursor) {
+        if child.kind() == "function_declarator" {
+            let mut cursor = child.walk();
+            for c in child.children(&mut cursor) {
+                if c.kind() == "identifier" {
+                    return c.utf8_text(source).ok().map(|s| s.to_string());
                 }
             }
-            if child.kind() == "identifier" {
-                return child.utf8_text(source).ok().map(|s| s.to_string());
+        }
+        if child.kind() == "pointer_declarator" {
+            let result = get_func_name(&child, source);
+            if result.is_some() {
+                return result;
             }
         }
+        if child.kind() == "identifier" {
+            return child.utf8_text(source).ok().map(|s| s.to_string());
+        }
     }
     None
 }
 
 fn get_type_name(node: &Node, source: &[u8]) -> Option<String> {
-    for i in 0..node.child_count() {
-        if let Some(child) = node.child(i) {
-            if child.kind() == "type_identifier" {
-                return child.utf8_text(source).ok().map(|s| s.to_string());
-            }
+    let mut cursor = node.walk();
+    for child in node.children(&mut cursor) {
+        if child.kind() == "type_identifier" {
+            return child.utf8_text(source).ok().map(|s| s.to_string());
         }
     }
     None
@@ -116,12 +113,8 @@ fn extract_c_symbols(
     parent_id: Option<&str>,
     lang: &str,
 ) {
-    for i in 0..node.child_count() {
-        let child = match node.child(i) {
-            Some(c) => c,
-            None => continue,
-        };
-
+    let mut cursor = node.walk();
+    for child in node.children(&mut cursor) {
         if child.kind() == "function_definition" {
             if let Some(name) = get_func_name(&child, source) {
                 symbols.push(Symbol {
@@ -213,36 +206,32 @@ fn extract_c_symbols(
 fn extract_includes(tree: &Tree, source: &[u8], file_path: &str) -> Vec<ImportStatement> {
     let mut imports = Vec::new();
     let root = tree.root_node();
-    for i in 0..root.child_count() {
-        if let Some(child) = root.child(i) {
-            if child.kind() == "preproc_include" {
-                let mut path = None;
-                for j in 0..child.child_count() {
-                    if let Some(c) = child.child(j) {
-                        if c.kind() == "string_literal" {
-                            for k in 0..c.child_count() {
-                                if let Some(sc) = c.child(k) {
-                                    if sc.kind() == "string_content" {
-                                        path = sc.utf8_text(source).ok().map(|s| s.to_string());
-                                    }
-                                }
-                            }
-                        } else if c.kind() == "system_lib_string" {
-                            if let Ok(text) = c.utf8_text(source) {
-                                path =
-                                    Some(text.trim_matches(|c| c == '<' || c == '>').to_string());
-                            }
+    let mut cursor = root.walk();
+    for child in root.children(&mut cursor) {
+        if child.kind() == "preproc_include" {
+            let mut path = None;
+            let mut cursor = child.walk();
+            for c in child.children(&mut cursor) {
+                if c.kind() == "string_literal" {
+                    let mut cursor = c.walk();
+                    for sc in c.children(&mut cursor) {
+                        if sc.kind() == "string_content" {
+                            path = sc.utf8_text(source).ok().map(|s| s.to_string());
                         }
                     }
+                } else if c.kind() == "system_lib_string" {
+                    if let Ok(text) = c.utf8_text(source) {
+                        path = Some(text.trim_matches(|c| c == '<' || c == '>').to_string());
+                    }
                 }
-                if let Some(path) = path {
-                    imports.push(ImportStatement {
-                        file: file_path.to_string(),
-                        statement: child.utf8_text(source).unwrap_or("").trim().to_string(),
-                        target_name: path,
-                        line: child.start_position().row + 1,
-                    });
-                }
+            }
+            if let Some(path) = path {
+                imports.push(ImportStatement {
+                    file: file_path.to_string(),
+                    statement: child.utf8_text(source).unwrap_or("").trim().to_string(),
+                    target_name: path,
+                    line: child.start_position().row + 1,
+                });
             }
         }
     }
@@ -256,16 +245,12 @@ fn find_c_calls(
     calls: &mut Vec<RawCall>,
     exclusions: &HashSet<String>,
 ) {
-    if node.kind() == "call_expression" {
-        let (callee_name, qualifier) = extract_c_callee(node, source);
-        if let Some(ref name) = callee_name {
-            if !exclusions.contains(name) {
-                let qualified = if let Some(ref q) = qualifier {
-                    format!("{}.{}", q, name)
-                } else {
-                    name.clone()
-                };
-                if !exclusions.contains(&qualified) {
+    let [call_kind] = kind_ids(node, ["call_expression"]);
+    walk_tree(node, |node| {
+        if node.kind_id() == call_kind {
+            let (callee_name, qualifier) = extract_c_callee(node, source);
+            if let Some(ref name) = callee_name {
+                if !is_builtin_call(exclusions, name, qualifier.as_deref(), ".") {
                     let caller = find_enclosing_func(node, source);
                     calls.push(RawCall {
                         caller_file: file_path.to_string(),
@@ -277,12 +262,7 @@ fn find_c_calls(
                 }
             }
         }
-    }
-    for i in 0..node.child_count() {
-        if let Some(child) = node.child(i) {
-            find_c_calls(&child, source, file_path, calls, exclusions);
-        }
-    }
+    });
 }
 
 fn extract_c_callee(node: &Node, source: &[u8]) -> (Option<String>, Option<String>) {
@@ -297,12 +277,11 @@ fn extract_c_callee(node: &Node, source: &[u8]) -> (Option<String>, Option<Strin
 
     if first.kind() == "field_expression" {
         let mut parts = Vec::new();
-        for i in 0..first.child_count() {
-            if let Some(c) = first.child(i) {
-                if c.kind() == "identifier" || c.kind() == "field_identifier" {
-                    if let Ok(text) = c.utf8_text(source) {
-                        parts.push(text.to_string());
-                    }
+        let mut cursor = first.walk();
+        for c in first.children(&mut cursor) {
+            if c.kind() == "identifier" || c.kind() == "field_identifier" {
+                if let Ok(text) = c.utf8_text(source) {
+                    parts.push(text.to_string());
                 }
             }
         }
@@ -429,12 +408,8 @@ impl CppAnalyser {
         extract_c_symbols(node, source, file_path, symbols, parent_id, "C++");
 
         // C++-specific: classes and namespaces
-        for i in 0..node.child_count() {
-            let child = match node.child(i) {
-                Some(c) => c,
-                None => continue,
-            };
-
+        let mut cursor = node.walk();
+        for child in node.children(&mut cursor) {
             if child.kind() == "class_specifier" {
                 if let Some(name) = get_type_name(&child, source) {
                     symbols.push(Symbol {
@@ -453,12 +428,11 @@ impl CppAnalyser {
                 }
             } else if child.kind() == "namespace_definition" {
                 let mut name = None;
-                for j in 0..child.child_count() {
-                    if let Some(c) = child.child(j) {
-                        if c.kind() == "namespace_identifier" {
-                            name = c.utf8_text(source).ok().map(|s| s.to_string());
-                            break;
-                        }
+                let mut cursor = child.walk();
+                for c in child.children(&mut cursor) {
+                    if c.kind() == "namespace_identifier" {
+                        name = c.utf8_text(source).ok().map(|s| s.to_string());
+                        break;
                     }
                 }
                 if let Some(ref ns_name) = name {
@@ -476,17 +450,10 @@ impl CppAnalyser {
                         parameter_types: None,
                     });
                     // Recurse into namespace body
-                    for j in 0..child.child_count() {
-                        if let Some(c) = child.child(j) {
-                            if c.kind() == "declaration_list" {
-                                self.extract_cpp_symbols(
-                                    &c,
-                                    source,
-                                    file_path,
-                                    symbols,
-                                    Some(ns_name),
-                                );
-                            }
+                    let mut cursor = child.walk();
+                    for c in child.children(&mut cursor) {
+                        if c.kind() == "declaration_list" {
+                            self.extract_cpp_symbols(&c, source, file_path, symbols, Some(ns_name));
                         }
                     }
                 }
@@ -5,7 +5,7 @@ use std::sync::LazyLock;
 
 use tree_sitter::{Language, Node, Tree};
 
-use super::LanguageAnalyser;
+use super::{is_builtin_call, kind_ids, walk_tree, LanguageAnalyser};
 use crate::config::{ImportStatement, RawCall, Symbol, SymbolType, Visibility};
 
 static BUILTIN_EXCLUSIONS: LazyLock<HashSet<String>> = LazyLock::new(|| {
@@ -161,17 +161,16 @@ fn is_container(node_type: &str) -> bool {
 }
 
 fn get_visibility(node: &Node, source: &[u8]) -> Visibility {
-    for i in 0..node.child_count() {
-        if let Some(child) = node.child(i) {
-            if child.kind() == "modifier" {
-                let mod_text = child.utf8_text(source).unwrap_or("").to_lowercase();
-                match mod_text.as_str() {
-                    "public" => return Visibility::Public,
-                    "private" => return Visibility::Private,
-                    "internal" => return Visibility::Internal,
-                    "protected" => return Visibility::Protected,
-                    _ => {}
-                }
+    let mut cursor = node.walk();
+    for child in node.children(&mut cursor) {
+        if child.kind() == "modifier" {
+            let mod_text = child.utf8_text(source).unwrap_or("").to_lowercase();
+            match mod_text.as_str() {
+                "public" => return Visibility::Public,
+                "private" => return Visibility::Private,
+                "internal" => return Visibility::Internal,
+                "protected" => return Visibility::Protected,
+                _ => {}
             }
         }
     }
@@ -182,11 +181,10 @@ fn get_name(node: &Node, source: &[u8]) -> Option<String> {
     if let Some(name_node) = node.child_by_field_name("name") {
         return name_node.utf8_text(source).ok().map(|s| s.to_string());
     }
-    for i in 0..node.child_count() {
-        if let Some(child) = node.child(i) {
-            if child.kind() == "identifier" {
-                return child.utf8_text(source).ok().map(|s| s.to_string());
-            }
+    let mut cursor = node.walk();
+    for child in node.children(&mut cursor) {
+        if child.kind() == "identifier" {
+            return child.utf8_text(source).ok().map(|s| s.to_string());
         }
     }
     None
@@ -213,12 +211,8 @@ impl CSharpAnalyser {
         symbols: &mut Vec<Symbol>,
         parent_id: Option<&str>,
     ) {
-        for i in 0..node.child_count() {
-            let child = match node.child(i) {
-                Some(c) => c,
-                None => continue,
-            };
-
+        let mut cursor = node.walk();
+        for child in node.children(&mut cursor) {
             let sym_type = match node_to_symbol_type(child.kind()) {
                 Some(t) => t,
                 None => continue,
@@ -261,12 +255,11 @@ impl CSharpAnalyser {
 
             // Recurse into containers
             if is_container(child.kind()) {
-                for j in 0..child.child_count() {
-                    if let Some(c) = child.child(j) {
-                        if c.kind() == "declaration_list" {
-                            self.walk_node(&c, source, file_path, symbols, Some(&name));
-                            break;
-                        }
+                let mut cursor = child.walk();
+                for c in child.children(&mut cursor) {
+                    if c.kind() == "declaration_list" {
+                        self.walk_node(&c, source, file_path, symbols, Some(&name));
+                        break;
                     }
                 }
             }
@@ -280,15 +273,14 @@ impl CSharpAnalyser {
         file_path: &str,
     ) -> Option<ImportStatement> {
         let mut name_node = None;
-        for i in 0..node.child_count() {
-            if let Some(child) = node.child(i) {
-                match child.kind() {
-                    "identifier" | "qualified_name" | "name" => {
-                        name_node = Some(child);
-                        break;
-                    }
-                    _ => {}
+        let mut cursor = node.walk();
+        for child in node.children(&mut cursor) {
+            match child.kind() {
+                "identifier" | "qualified_name" | "name" => {
+                    name_node = Some(child);
+                    break;
                 }
+                _ => {}
             }
         }
         let name_node = name_node?;
@@ -315,16 +307,12 @@ impl CSharpAnalyser {
         calls: &mut Vec<RawCall>,
         exclusions: &HashSet<String>,
     ) {
-        if node.kind() == "invocation_expression" {
-            let (callee_name, qualifier) = extract_callee(node, source);
-            if let Some(ref name) = callee_name {
-                if !exclusions.contains(name) {
-                    let qualified = if let Some(ref q) = qualifier {
-                        format!("{}.{}", q, name)
-                    } else {
-                        name.clone()
-                    };
-                    if !exclusions.contains(&qualified) {
+        let [call_kind] = kind_ids(node, ["invocation_expression"]);
+        walk_tree(node, |node| {
+            if node.kind_id() == call_kind {
+                let (callee_name, qualifier) = extract_callee(node, source);
+                if let Some(ref name) = callee_name {
+                    if !is_builtin_call(exclusions, name, qualifier.as_deref(), ".") {
                         let caller = find_enclosing_method(node, source);
                         calls.push(RawCall {
                             caller_file: file_path.to_string(),
@@ -335,53 +323,45 @@ impl CSharpAnalyser {
                         });
                     }
                 }
-            }
-        } else if node.kind() == "object_creation_expression" {
-            let mut callee_name = None;
-            for i in 0..node.child_count() {
-                if let Some(child) = node.child(i) {
+            } else if node.kind() == "object_creation_expression" {
+                let mut callee_name = None;
+                let mut cursor = node.walk();
+                for child in node.children(&mut cursor) {
                     if child.kind() == "identifier" || child.kind() == "qualified_name" {
                         callee_name = child.utf8_text(source).ok().map(|s| s.to_string());
                         break;
                     }
                 }
-            }
-            if let Some(ref name) = callee_name {
-                if !exclusions.contains(name) {
-                    let caller = find_enclosing_method(node, source);
-                    calls.push(RawCall {
-                        caller_file: file_path.to_string(),
-                        caller_name: caller.unwrap_or_else(|| "<module>".to_string()),
-                        callee_name: name.clone(),
-                        line: node.start_position().row + 1,
-                        qualifier: None,
-                    });
+                if let Some(ref name) = callee_name {
+                    if !exclusions.contains(name) {
+                        let caller = find_enclosing_method(node, source);
+                        calls.push(RawCall {
+                            caller_file: file_path.to_string(),
+                            caller_name: caller.unwrap_or_else(|| "<module>".to_string()),
+                            callee_name: name.clone(),
+                            line: node.start_position().row + 1,
+                            qualifier: None,
+                        });
+                    }
                 }
             }
-        }
-
-        for i in 0..node.child_count() {
-            if let Some(child) = node.child(i) {
-                self.find_calls(&child, source, file_path, calls, exclusions);
-            }
-        }
+        });
     }
 }
 
 fn extract_parameter_types(node: &Node, source: &[u8]) -> Option<Vec<(String, String)>> {
     let param_list = node.child_by_field_name("parameters")?;
     let mut params = Vec::new();
-    for i in 0..param_list.child_count() {
-        if let Some(child) = param_list.child(i) {
-            if child.kind() == "parameter" {
-                let type_node = child.child_by_field_name("type");
-                let name_node = child.child_by_field_name("name");
-                if let (Some(tn), Some(nn)) = (type_node, name_node) {
-                    if let (Ok(type_name), Ok(param_name)) =
-                        (tn.utf8_text(source), nn.utf8_text(source))
-                    {
-                        params.push((param_name.to_string(), type_name.to_string()));
-                    }
+    let mut cursor = param_list.walk();
+    for child in param_list.children(&mut cursor) {
+        if child.kind() == "parameter" {
+            let type_node = child.child_by_field_name("type");
+            let name_node = child.child_by_field_name("name");
+            if let (Some(tn), Some(nn)) = (type_node, name_node) {
+                if let (Ok(type_name), Ok(param_name)) =
+                    (tn.utf8_text(source), nn.utf8_text(source))
+                {
+                    params.push((param_name.to_string(), type_name.to_string()));
                 }
             }
         }
@@ -406,12 +386,11 @@ fn extract_callee(inv_node: &Node, source: &[u8]) -> (Option<String>, Option<Str
         }
         "member_access_expression" => {
             let mut parts = Vec::new();
-            for i in 0..first_child.child_count() {
-                if let Some(child) = first_child.child(i) {
-                    if child.kind() == "identifier" {
-                        if let Ok(text) = child.utf8_text(source) {
-                            parts.push(text.to_string());
-                        }
+            let mut cursor = first_child.walk();
+            for child in first_child.children(&mut cursor) {
+                if child.kind() == "identifier" {
+                    if let Ok(text) = child.utf8_text(source) {
+                        parts.push(text.to_string());
                     }
                 }
             }
@@ -448,11 +427,10 @@ fn find_enclosing_method(node: &Node, source: &[u8]) -> Option<String> {
                 if let Some(name_node) = n.child_by_field_name("name") {
                     return name_node.utf8_text(source).ok().map(|s| s.to_string());
                 }
-                for i in 0..n.child_count() {
-                    if let Some(child) = n.child(i) {
-                        if child.kind() == "identifier" {
-                            return child.utf8_text(source).ok().map(|s| s.to_string());
-                        }
+                let mut cursor = n.walk();
+                for child in n.children(&mut cursor) {
+                    if child.kind() == "identifier" {
+                        return child.utf8_text(source).ok().map(|s| s.to_string());
                     }
                 }
             }
@@ -492,29 +470,26 @@ impl LanguageAnalyser for CSharpAnalyser {
     fn extract_imports(&self, tree: &Tree, source: &[u8], file_path: &str) -> Vec<ImportStatement> {
         let mut imports = Vec::new();
         let root = tree.root_node();
-        for i in 0..root.child_count() {
-            if let Some(child) = root.child(i) {
-                if child.kind() == "using_directive" {
-                    if let Some(imp) = self.extract_using(&child, source, file_path) {
-                        imports.push(imp);
-                    }
-                } else if child.kind() == "namespace_declaration"
-                    || child.kind() == "file_scoped_namespace_declaration"
-                {
-                    // Check for using directives inside namespace
-                    for j in 0..child.child_count() {
-                        if let Some(ns_child) = child.child(j) {
-                            if ns_child.kind() == "declaration_list" {
-                                for k in 0..ns_child.child_count() {
-                                    if let Some(decl_child) = ns_child.child(k) {
-                                        if decl_child.kind() == "using_directive" {
-                                            if let Some(imp) =
-                                                self.extract_using(&decl_child, source, file_path)
-                                            {
-                                                imports.push(imp);
-                                            }
-                                        }
-                                    }
+        let mut cursor = root.walk();
+        for child in root.children(&mut cursor) {
+            if child.kind() == "using_directive" {
+                if let Some(imp) = self.extract_using(&child, source, file_path) {
+                    imports.push(imp);
+                }
+            } else if child.kind() == "namespace_declaration"
+                || child.kind() == "file_scoped_namespace_declaration"
+            {
+                // Check for using directives inside namespace
+                let mut cursor = child.walk();
+                for ns_child in child.children(&mut cursor) {
+                    if ns_child.kind() == "declaration_list" {
+                        let mut cursor = ns_child.walk();
+                        for decl_child in ns_child.children(&mut cursor) {
+                            if decl_child.kind() == "using_directive" {
+                                if let Some(imp) =
+                                    self.extract_using(&decl_child, source, file_path)
+                                {
+                                    imports.push(imp);
                                 }
                             }
                         }
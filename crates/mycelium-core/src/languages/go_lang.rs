@@ -5,7 +5,7 @@ use std::sync::LazyLock;
 
 use tree_sitter::{Language, Node, Tree};
 
-use super::LanguageAnalyser;
+use super::{is_builtin_call, kind_ids, walk_tree, LanguageAnalyser};
 use crate::config::{ImportStatement, RawCall, Symbol, SymbolType, Visibility};
 
 static BUILTIN_EXCLUSIONS: LazyLock<HashSet<String>> = LazyLock::new(|| {
@@ -77,11 +77,10 @@ impl GoAnalyser {
     }
 
     fn get_name_by_kind(node: &Node, target_kind: &str, source: &[u8]) -> Option<String> {
-        for i in 0..node.child_count() {
-            if let Some(child) = node.child(i) {
-                if child.kind() == target_kind {
-                    return child.utf8_text(source).ok().map(|s| s.to_string());
-                }
+        let mut cursor = node.walk();
+        for child in node.children(&mut cursor) {
+            if child.kind() == target_kind {
+                return child.utf8_text(source).ok().map(|s| s.to_string());
             }
         }
         None
@@ -95,22 +94,20 @@ impl GoAnalyser {
     }
 
     fn extract_string(node: &Node, source: &[u8]) -> Option<String> {
-        for i in 0..node.child_count() {
-            if let Some(child) = node.child(i) {
-                if child.kind() == "interpreted_string_literal" {
-                    return Self::extract_string_content(&child, source);
-                }
+        let mut cursor = node.walk();
+        for child in node.children(&mut cursor) {
+            if child.kind() == "interpreted_string_literal" {
+                return Self::extract_string_content(&child, source);
             }
         }
         None
     }
 
     fn extract_string_content(node: &Node, source: &[u8]) -> Option<String> {
-        for i in 0..node.child_count() {
-            if let Some(child) = node.child(i) {
-                if child.kind() == "interpreted_string_literal_content" {
-                    return child.utf8_text(source).ok().map(|s| s.to_string());
-                }
+        let mut cursor = node.walk();
+        for child in node.children(&mut cursor) {
+            if child.kind() == "interpreted_string_literal_content" {
+                return child.utf8_text(source).ok().map(|s| s.to_string());
             }
         }
         None
@@ -124,16 +121,12 @@ impl GoAnalyser {
         calls: &mut Vec<RawCall>,
         exclusions: &HashSet<String>,
     ) {
-        if node.kind() == "call_expression" {
-            let (callee_name, qualifier) = self.extract_callee(node, source);
-            if let Some(ref name) = callee_name {
-                if !exclusions.contains(name) {
-                    let qualified = if let Some(ref q) = qualifier {
-                        format!("{}.{}", q, name)
-                    } else {
-                        name.clone()
-                    };
-                    if !exclusions.contains(&qualified) {
+        let [call_kind] = kind_ids(node, ["call_expression"]);
+        walk_tree(node, |node| {
+            if node.kind_id() == call_kind {
+                let (callee_name, qualifier) = self.extract_callee(node, source);
+                if let Some(ref name) = callee_name {
+                    if !is_builtin_call(exclusions, name, qualifier.as_deref(), ".") {
                         let caller = self.find_enclosing(node, source);
                         calls.push(RawCall {
                             caller_file: file_path.to_string(),
@@ -145,12 +138,7 @@ impl GoAnalyser {
                     }
                 }
             }
-        }
-        for i in 0..node.child_count() {
-            if let Some(child) = node.child(i) {
-                self.find_calls(&child, source, file_path, calls, exclusions);
-            }
-        }
+        });
     }
 
     fn extract_callee(&self, node: &Node, source: &[u8]) -> (Option<String>, Option<String>) {
@@ -165,12 +153,11 @@ impl GoAnalyser {
 
         if first.kind() == "selector_expression" {
             let mut parts = Vec::new();
-            for i in 0..first.child_count() {
-                if let Some(c) = first.child(i) {
-                    if c.kind() == "identifier" || c.kind() == "field_identifier" {
-                        if let Ok(text) = c.utf8_text(source) {
-                            parts.push(text.to_string());
-                        }
+            let mut cursor = first.walk();
+            for c in first.children(&mut cursor) {
+                if c.kind() == "identifier" || c.kind() == "field_identifier" {
+                    if let Ok(text) = c.utf8_text(source) {
+                        parts.push(text.to_string());
                     }
                 }
             }
@@ -218,12 +205,8 @@ impl LanguageAnalyser for GoAnalyser {
         let mut symbols = Vec::new();
         let root = tree.root_node();
 
-        for i in 0..root.child_count() {
-            let child = match root.child(i) {
-                Some(c) => c,
-                None => continue,
-            };
-
+        let mut cursor = root.walk();
+        for child in root.children(&mut cursor) {
             if child.kind() == "function_declaration" {
                 if let Some(name) = Self::get_name_by_kind(&child, "identifier", source) {
                     let exported = Self::is_exported(&name);
@@ -267,75 +250,64 @@ impl LanguageAnalyser for GoAnalyser {
                     });
                 }
             } else if child.kind() == "type_declaration" {
-                for j in 0..child.child_count() {
-                    if let Some(spec) = child.child(j) {
-                        if spec.kind() == "type_spec" {
-                            if let Some(name) =
-                                Self::get_name_by_kind(&spec, "type_identifier", source)
-                            {
-                                let mut sym_type = SymbolType::TypeAlias;
-                                for k in 0..spec.child_count() {
-                                    if let Some(c) = spec.child(k) {
-                                        if c.kind() == "struct_type" {
-                                            sym_type = SymbolType::Struct;
-                                        } else if c.kind() == "interface_type" {
-                                            sym_type = SymbolType::Interface;
-                                        }
-                                    }
+                let mut cursor = child.walk();
+                for spec in child.children(&mut cursor) {
+                    if spec.kind() == "type_spec" {
+                        if let Some(name) = Self::get_name_by_kind(&spec, "type_identifier", source)
+                        {
+                            let mut sym_type = SymbolType::TypeAlias;
+                            let mut cursor = spec.walk();
+                            for c in spec.children(&mut cursor) {
+                                if c.kind() == "struct_type" {
+                                    sym_type = SymbolType::Struct;
+                                } else if c.kind() == "interface_type" {
+                                    sym_type = SymbolType::Interface;
                                 }
-                                let exported = Self::is_exported(&name);
-                                symbols.push(Symbol {
-                                    id: format!("_pending_{}", symbols.len()),
-                                    name,
-                                    symbol_type: sym_type,
-                                    file: file_path.to_string(),
-                                    line: spec.start_position().row + 1,
-                                    visibility: if exported {
-                                        Visibility::Public
-                                    } else {
-                                        Visibility::Private
-                                    },
-                                    exported,
-                                    parent: None,
-                                    language: Some("Go".to_string()),
-                                    byte_range: Some((
-                                        spec.byte_range().start,
-                                        spec.byte_range().end,
-                                    )),
-                                    parameter_types: None,
-                                });
                             }
+                            let exported = Self::is_exported(&name);
+                            symbols.push(Symbol {
+                                id: format!("_pending_{}", symbols.len()),
+                                name,
+                                symbol_type: sym_type,
+                                file: file_path.to_string(),
+                                line: spec.start_position().row + 1,
+                                visibility: if exported {
+                                    Visibility::Public
+                                } else {
+                                    Visibility::Private
+                                },
+                                exported,
+                                parent: None,
+                                language: Some("Go".to_string()),
+                                byte_range: Some((spec.byte_range().start, spec.byte_range().end)),
+                                parameter_types: None,
+                            });
                         }
                     }
                 }
             } else if child.kind() == "const_declaration" {
-                for j in 0..child.child_count() {
-                    if let Some(spec) = child.child(j) {
-                        if spec.kind() == "const_spec" {
-                            if let Some(name) = Self::get_name_by_kind(&spec, "identifier", source)
-                            {
-                                let exported = Self::is_exported(&name);
-                                symbols.push(Symbol {
-                                    id: format!("_pending_{}", symbols.len()),
-                                    name,
-                                    symbol_type: SymbolType::Constant,
-                                    file: file_path.to_string(),
-                                    line: spec.start_position().row + 1,
-                                    visibility: if exported {
-                                        Visibility::Public
-                                    } else {
-                                        Visibility::Private
-                                    },
-                                    exported,
-                                    parent: None,
-                                    language: Some("Go".to_string()),
-                                    byte_range: Some((
-                                        spec.byte_range().start,
-                                        spec.byte_range().end,
-                                    )),
-                                    parameter_types: None,
-                                });
-                            }
+                let mut cursor = child.walk();
+                for spec in child.children(&mut cursor) {
+                    if spec.kind() == "const_spec" {
+                        if let Some(name) = Self::get_name_by_kind(&spec, "identifier", source) {
+                            let exported = Self::is_exported(&name);
+                            symbols.push(Symbol {
+                                id: format!("_pending_{}", symbols.len()),
+                                name,
+                                symbol_type: SymbolType::Constant,
+                                file: file_path.to_string(),
+                                line: spec.start_position().row + 1,
+                                visibility: if exported {
+                                    Visibility::Public
+                                } else {
+                                    Visibility::Private
+                                },
+                                exported,
+                                parent: None,
+                                language: Some("Go".to_string()),
+                                byte_range: Some((spec.byte_range().start, spec.byte_range().end)),
+                                parameter_types: None,
+                            });
                         }
                     }
                 }
@@ -348,46 +320,43 @@ impl LanguageAnalyser for GoAnalyser {
         let mut imports = Vec::new();
         let root = tree.root_node();
 
-        for i in 0..root.child_count() {
-            if let Some(child) = root.child(i) {
-                if child.kind() == "import_declaration" {
-                    for j in 0..child.child_count() {
-                        if let Some(spec) = child.child(j) {
-                            if spec.kind() == "import_spec" {
-                                if let Some(path) = Self::extract_string(&spec, source) {
-                                    imports.push(ImportStatement {
-                                        file: file_path.to_string(),
-                                        statement: format!("import \"{}\"", path),
-                                        target_name: path,
-                                        line: spec.start_position().row + 1,
-                                    });
-                                }
-                            } else if spec.kind() == "import_spec_list" {
-                                for k in 0..spec.child_count() {
-                                    if let Some(sub) = spec.child(k) {
-                                        if sub.kind() == "import_spec" {
-                                            if let Some(path) = Self::extract_string(&sub, source) {
-                                                imports.push(ImportStatement {
-                                                    file: file_path.to_string(),
-                                                    statement: format!("import \"{}\"", path),
-                                                    target_name: path,
-                                                    line: sub.start_position().row + 1,
-                                                });
-                                            }
-                                        }
-                                    }
-                                }
-                            } else if spec.kind() == "interpreted_string_literal" {
-                                if let Some(path) = Self::extract_string_content(&spec, source) {
+        let mut cursor = root.walk();
+        for child in root.children(&mut cursor) {
+            if child.kind() == "import_declaration" {
+                let mut cursor = child.walk();
+                for spec in child.children(&mut cursor) {
+                    if spec.kind() == "import_spec" {
+                        if let Some(path) = Self::extract_string(&spec, source) {
+                            imports.push(ImportStatement {
+                                file: file_path.to_string(),
+                                statement: format!("import \"{}\"", path),
+                                target_name: path,
+                                line: spec.start_position().row + 1,
+                            });
+                        }
+                    } else if spec.kind() == "import_spec_list" {
+                        let mut cursor = spec.walk();
+                        for sub in spec.children(&mut cursor) {
+                            if sub.kind() == "import_spec" {
+                                if let Some(path) = Self::extract_string(&sub, source) {
                                     imports.push(ImportStatement {
                                         file: file_path.to_string(),
                                         statement: format!("import \"{}\"", path),
                                         target_name: path,
-                                        line: spec.start_position().row + 1,
+                                        line: sub.start_position().row + 1,
                                     });
                                 }
                             }
                         }
+                    } else if spec.kind() == "interpreted_string_literal" {
+                        if let Some(path) = Self::extract_string_content(&spec, source) {
+                            imports.push(ImportStatement {
+                                file: file_path.to_string(),
+                                statement: format!("import \"{}\"", path),
+                                target_name: path,
+                                line: spec.start_position().row + 1,
+                            });
+                        }
                     }
                 }
             }
@@ -5,7 +5,7 @@ use std::sync::LazyLock;
 
 use tree_sitter::{Language, Node, Tree};
 
-use super::LanguageAnalyser;
+use super::{is_builtin_call, kind_ids, walk_tree, LanguageAnalyser};
 use crate::config::{ImportStatement, RawCall, Symbol, SymbolType, Visibility};
 
 static BUILTIN_EXCLUSIONS: LazyLock<HashSet<String>> = LazyLock::new(|| {
@@ -83,20 +83,18 @@ fn is_container(node_type: &str) -> bool {
 }
 
 fn get_visibility(node: &Node, source: &[u8]) -> Visibility {
-    for i in 0..node.child_count() {
-        if let Some(child) = node.child(i) {
-            if child.kind() == "modifiers" {
-                for j in 0..child.child_count() {
-                    if let Some(m) = child.child(j) {
-                        if m.child_count() == 0 {
-                            let text = m.utf8_text(source).unwrap_or("").to_lowercase();
-                            match text.as_str() {
-                                "public" => return Visibility::Public,
-                                "private" => return Visibility::Private,
-                                "protected" => return Visibility::Protected,
-                                _ => {}
-                            }
-                        }
+    let mut cursor = node.walk();
+    for child in node.children(&mut cursor) {
+        if child.kind() == "modifiers" {
+            let mut cursor = child.walk();
+            for m in child.children(&mut cursor) {
+                if m.child_count() == 0 {
+                    let text = m.utf8_text(source).unwrap_or("").to_lowercase();
+                    match text.as_str() {
+                        "public" => return Visibility::Public,
+                        "private" => return Visibility::Private,
+                        "protected" => return Visibility::Protected,
+                        _ => {}
                     }
                 }
             }
@@ -106,11 +104,10 @@ fn get_visibility(node: &Node, source: &[u8]) -> Visibility {
 }
 
 fn get_name(node: &Node, source: &[u8]) -> Option<String> {
-    for i in 0..node.child_count() {
-        if let Some(child) = node.child(i) {
-            if child.kind() == "identifier" {
-                return child.utf8_text(source).ok().map(|s| s.to_string());
-            }
+    let mut cursor = node.walk();
+    for child in node.children(&mut cursor) {
+        if child.kind() == "identifier" {
+            return child.utf8_text(source).ok().map(|s| s.to_string());
         }
     }
     None
@@ -137,12 +134,8 @@ impl JavaAnalyser {
         symbols: &mut Vec<Symbol>,
         parent_id: Option<&str>,
     ) {
-        for i in 0..node.child_count() {
-            let child = match node.child(i) {
-                Some(c) => c,
-                None => continue,
-            };
-
+        let mut cursor = node.walk();
+        for child in node.children(&mut cursor) {
             let sym_type = match node_to_symbol_type(child.kind()) {
                 Some(t) => t,
                 None => continue,
@@ -172,14 +165,13 @@ impl JavaAnalyser {
 
             // Recurse into container bodies
             if is_container(child.kind()) {
-                for j in 0..child.child_count() {
-                    if let Some(c) = child.child(j) {
-                        if c.kind() == "class_body"
-                            || c.kind() == "interface_body"
-                            || c.kind() == "enum_body"
-                        {
-                            self.walk_node(&c, source, file_path, symbols, Some(&name));
-                        }
+                let mut cursor = child.walk();
+                for c in child.children(&mut cursor) {
+                    if c.kind() == "class_body"
+                        || c.kind() == "interface_body"
+                        || c.kind() == "enum_body"
+                    {
+                        self.walk_node(&c, source, file_path, symbols, Some(&name));
                     }
                 }
             }
@@ -194,16 +186,12 @@ impl JavaAnalyser {
         calls: &mut Vec<RawCall>,
         exclusions: &HashSet<String>,
     ) {
-        if node.kind() == "method_invocation" {
-            let (callee_name, qualifier) = self.extract_callee(node, source);
-            if let Some(ref name) = callee_name {
-                if !exclusions.contains(name) {
-                    let qualified = if let Some(ref q) = qualifier {
-                        format!("{}.{}", q, name)
-                    } else {
-                        name.clone()
-                    };
-                    if !exclusions.contains(&qualified) {
+        let [call_kind] = kind_ids(node, ["method_invocation"]);
+        walk_tree(node, |node| {
+            if node.kind_id() == call_kind {
+                let (callee_name, qualifier) = self.extract_callee(node, source);
+                if let Some(ref name) = callee_name {
+                    if !is_builtin_call(exclusions, name, qualifier.as_deref(), ".") {
                         let caller = self.find_enclosing(node, source);
                         calls.push(RawCall {
                             caller_file: file_path.to_string(),
@@ -214,10 +202,9 @@ impl JavaAnalyser {
                         });
                     }
                 }
-            }
-        } else if node.kind() == "object_creation_expression" {
-            for i in 0..node.child_count() {
-                if let Some(child) = node.child(i) {
+            } else if node.kind() == "object_creation_expression" {
+                let mut cursor = node.walk();
+                for child in node.children(&mut cursor) {
                     if child.kind() == "identifier" || child.kind() == "type_identifier" {
                         if let Ok(name) = child.utf8_text(source) {
                             let name = name.to_string();
@@ -236,13 +223,7 @@ impl JavaAnalyser {
                     }
                 }
             }
-        }
-
-        for i in 0..node.child_count() {
-            if let Some(child) = node.child(i) {
-                self.find_calls(&child, source, file_path, calls, exclusions);
-            }
-        }
+        });
     }
 
     fn extract_callee(&self, node: &Node, source: &[u8]) -> (Option<String>, Option<String>) {
@@ -253,12 +234,11 @@ impl JavaAnalyser {
 
         if has_dot {
             let mut parts = Vec::new();
-            for i in 0..node.child_count() {
-                if let Some(child) = node.child(i) {
-                    if child.kind() == "identifier" || child.kind() == "field_access" {
-                        if let Ok(text) = child.utf8_text(source) {
-                            parts.push(text.to_string());
-                        }
+            let mut cursor = node.walk();
+            for child in node.children(&mut cursor) {
+                if child.kind() == "identifier" || child.kind() == "field_access" {
+                    if let Ok(text) = child.utf8_text(source) {
+                        parts.push(text.to_string());
                     }
                 }
             }
@@ -270,11 +250,10 @@ impl JavaAnalyser {
                 return (Some(parts.remove(0)), None);
             }
         } else {
-            for i in 0..node.child_count() {
-                if let Some(child) = node.child(i) {
-                    if child.kind() == "identifier" {
-                        return (child.utf8_text(source).ok().map(|s| s.to_string()), None);
-                    }
+            let mut cursor = node.walk();
+            for child in node.children(&mut cursor) {
+                if child.kind() == "identifier" {
+                    return (child.utf8_text(source).ok().map(|s| s.to_string()), None);
                 }
             }
         }
@@ -315,31 +294,29 @@ impl LanguageAnalyser for JavaAnalyser {
     fn extract_imports(&self, tree: &Tree, source: &[u8], file_path: &str) -> Vec<ImportStatement> {
         let mut imports = Vec::new();
         let root = tree.root_node();
-        for i in 0..root.child_count() {
-            if let Some(child) = root.child(i) {
-                if child.kind() == "import_declaration" {
-                    let mut target = None;
-                    for j in 0..child.child_count() {
-                        if let Some(c) = child.child(j) {
-                            if c.kind() == "scoped_identifier" {
-                                target = c.utf8_text(source).ok().map(|s| s.to_string());
-                            }
-                        }
-                    }
-                    if let Some(target) = target {
-                        imports.push(ImportStatement {
-                            file: file_path.to_string(),
-                            statement: child
-                                .utf8_text(source)
-                                .unwrap_or("")
-                                .trim_end_matches(';')
-                                .trim()
-                                .to_string(),
-                            target_name: target,
-                            line: child.start_position().row + 1,
-                        });
+        let mut cursor = root.walk();
+        for child in root.children(&mut cursor) {
+            if child.kind() == "import_declaration" {
+                let mut target = None;
+                let mut cursor = child.walk();
+                for c in child.children(&mut cursor) {
+                    if c.kind() == "scoped_identifier" {
+                        target = c.utf8_text(source).ok().map(|s| s.to_string());
                     }
                 }
+                if let Some(target) = target {
+                    imports.push(ImportStatement {
+                        file: file_path.to_string(),
+                        statement: child
+                            .utf8_text(source)
+                            .unwrap_or("")
+                            .trim_end_matches(';')
+                            .trim()
+                            .to_string(),
+                        target_name: target,
+                        line: child.start_position().row + 1,
+                    });
+                }
             }
         }
         imports
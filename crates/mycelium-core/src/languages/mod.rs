@@ -1,8 +1,10 @@
 //! Language analyser trait and registry.
 
+use std::cell::RefCell;
 use std::collections::{HashMap, HashSet};
+use std::sync::LazyLock;
 
-use tree_sitter::{Language, Tree};
+use tree_sitter::{Language, Node, Tree};
 
 use crate::config::{ImportStatement, RawCall, Symbol};
 
@@ -15,6 +17,62 @@ pub mod rust_lang;
 pub mod typescript;
 pub mod vbnet;
 
+/// Visit `node` and all of its descendants in pre-order using a single
+/// tree cursor, instead of recursing with a fresh child iterator per node.
+pub(crate) fn walk_tree<'tree>(node: &Node<'tree>, mut visit: impl FnMut(&Node<'tree>)) {
+    let mut cursor = node.walk();
+    loop {
+        visit(&cursor.node());
+        if cursor.goto_first_child() {
+            continue;
+        }
+        // A cursor cannot move past the node it was created from, so this
+        // terminates once the walk climbs back to `node`.
+        while !cursor.goto_next_sibling() {
+            if !cursor.goto_parent() {
+                return;
+            }
+        }
+    }
+}
+
+/// Resolve named node kinds to their numeric ids in the grammar `node` was
+/// parsed with. Comparing `Node::kind_id` against these in a traversal avoids
+/// the C-string conversion `Node::kind` performs on every visited node.
+pub(crate) fn kind_ids<const N: usize>(node: &Node, kinds: [&str; N]) -> [u16; N] {
+    let language = node.language();
+    kinds.map(|kind| language.id_for_node_kind(kind, true))
+}
+
+thread_local! {
+    /// Scratch buffer for building `qualifier{sep}name` keys without a
+    /// fresh allocation per call site.
+    static QUALIFIED_NAME: RefCell<String> = const { RefCell::new(String::new()) };
+}
+
+/// Whether a call to `name`, or to `qualifier{sep}name` when qualified, is
+/// in `exclusions`. The qualified form is only built when there is a qualifier.
+pub(crate) fn is_builtin_call(
+    exclusions: &HashSet<String>,
+    name: &str,
+    qualifier: Option<&str>,
+    sep: &str,
+) -> bool {
+    if exclusions.contains(name) {
+        return true;
+    }
+    let Some(q) = qualifier else {
+        return false;
+    };
+    QUALIFIED_NAME.with_borrow_mut(|key| {
+        key.clear();
+        key.push_str(q);
+        key.push_str(sep);
+        key.push_str(name);
+        exclusions.contains(key.as_str())
+    })
+}
+
 /// Trait that all language analysers implement.
 pub trait LanguageAnalyser: Send + Sync {
     /// File extensions this analyser handles (e.g. &["cs"]).
@@ -50,10 +108,15 @@ pub trait LanguageAnalyser: Send + Sync {
     }
 }
 
+/// Analysers hold no per-run state, so every phase can share one registry.
+static SHARED_REGISTRY: LazyLock<AnalyserRegistry> = LazyLock::new(AnalyserRegistry::new);
+
 /// Registry mapping file extensions to analysers.
 pub struct AnalyserRegistry {
     analysers: Vec<Box<dyn LanguageAnalyser>>,
     extension_map: HashMap<String, usize>,
+    /// tree-sitter Language handles, resolved once per extension.
+    languages: HashMap<String, Language>,
 }
 
 impl AnalyserRegistry {
@@ -73,10 +136,12 @@ impl AnalyserRegistry {
         ];
 
         let mut extension_map = HashMap::new();
+        let mut languages = HashMap::new();
         for (i, analyser) in analysers.iter().enumerate() {
             if analyser.is_available() {
                 for ext in analyser.extensions() {
                     extension_map.insert(ext.to_string(), i);
+                    languages.insert(ext.to_string(), analyser.get_language_for_ext(ext));
                 }
             }
         }
@@ -84,9 +149,15 @@ impl AnalyserRegistry {
         Self {
             analysers,
             extension_map,
+            languages,
         }
     }
 
+    /// The process-wide registry, built on first use.
+    pub fn shared() -> &'static Self {
+        &SHARED_REGISTRY
+    }
+
     /// Get the analyser for a given file extension, if one exists.
     pub fn get_by_extension(&self, ext: &str) -> Option<&dyn LanguageAnalyser> {
         self.extension_map
@@ -94,6 +165,11 @@ impl AnalyserRegistry {
             .map(|&i| self.analysers[i].as_ref())
     }
 
+    /// Get the cached tree-sitter Language for a file extension.
+    pub fn language_for_ext(&self, ext: &str) -> Option<&Language> {
+        self.languages.get(ext)
+    }
+
     /// Get the language name for a file extension.
     pub fn language_for_extension(&self, ext: &str) -> Option<&str> {
         self.get_by_extension(ext).map(|a| a.language_name())
@@ -5,7 +5,7 @@ use std::sync::LazyLock;
 
 use tree_sitter::{Language, Node, Tree};
 
-use super::LanguageAnalyser;
+use super::{is_builtin_call, kind_ids, walk_tree, LanguageAnalyser};
 use crate::config::{ImportStatement, RawCall, Symbol, SymbolType, Visibility};
 
 static BUILTIN_EXCLUSIONS: LazyLock<HashSet<String>> = LazyLock::new(|| {
@@ -104,11 +104,10 @@ impl PythonAnalyser {
     }
 
     fn get_name(node: &Node, source: &[u8]) -> Option<String> {
-        for i in 0..node.child_count() {
-            if let Some(child) = node.child(i) {
-                if child.kind() == "identifier" {
-                    return child.utf8_text(source).ok().map(|s| s.to_string());
-                }
+        let mut cursor = node.walk();
+        for child in node.children(&mut cursor) {
+            if child.kind() == "identifier" {
+                return child.utf8_text(source).ok().map(|s| s.to_string());
             }
         }
         None
@@ -122,12 +121,8 @@ impl PythonAnalyser {
         symbols: &mut Vec<Symbol>,
         parent_id: Option<&str>,
     ) {
-        for i in 0..node.child_count() {
-            let child = match node.child(i) {
-                Some(c) => c,
-                None => continue,
-            };
-
+        let mut cursor = node.walk();
+        for child in node.children(&mut cursor) {
             if child.kind() == "class_definition" {
                 if let Some(name) = Self::get_name(&child, source) {
                     symbols.push(Symbol {
@@ -145,11 +140,10 @@ impl PythonAnalyser {
                     });
 
                     // Recurse into class body
-                    for j in 0..child.child_count() {
-                        if let Some(c) = child.child(j) {
-                            if c.kind() == "block" {
-                                self.walk_node(&c, source, file_path, symbols, Some(&name));
-                            }
+                    let mut cursor = child.walk();
+                    for c in child.children(&mut cursor) {
+                        if c.kind() == "block" {
+                            self.walk_node(&c, source, file_path, symbols, Some(&name));
                         }
                     }
                 }
@@ -189,12 +183,11 @@ impl PythonAnalyser {
             } else if child.kind() == "decorated_definition" {
                 // Decorated class or function — recurse into the decorated_definition
                 // which contains the actual class_definition or function_definition
-                for j in 0..child.child_count() {
-                    if let Some(c) = child.child(j) {
-                        if c.kind() == "class_definition" || c.kind() == "function_definition" {
-                            self.walk_node(&child, source, file_path, symbols, parent_id);
-                            break;
-                        }
+                let mut cursor = child.walk();
+                for c in child.children(&mut cursor) {
+                    if c.kind() == "class_definition" || c.kind() == "function_definition" {
+                        self.walk_node(&child, source, file_path, symbols, parent_id);
+                        break;
                     }
                 }
             }
@@ -209,16 +202,12 @@ impl PythonAnalyser {
         calls: &mut Vec<RawCall>,
         exclusions: &HashSet<String>,
     ) {
-        if node.kind() == "call" {
-            let (callee_name, qualifier) = Self::extract_callee(node, source);
-            if let Some(ref name) = callee_name {
-                if !exclusions.contains(name) {
-                    let qualified = if let Some(ref q) = qualifier {
-                        format!("{}.{}", q, name)
-                    } else {
-                        name.clone()
-                    };
-                    if !exclusions.contains(&qualified) {
+        let [call_kind] = kind_ids(node, ["call"]);
+        walk_tree(node, |node| {
+            if node.kind_id() == call_kind {
+                let (callee_name, qualifier) = Self::extract_callee(node, source);
+                if let Some(ref name) = callee_name {
+                    if !is_builtin_call(exclusions, name, qualifier.as_deref(), ".") {
                         let caller = Self::find_enclosing(node, source);
                         calls.push(RawCall {
                             caller_file: file_path.to_string(),
@@ -230,12 +219,7 @@ impl PythonAnalyser {
                     }
                 }
             }
-        }
-        for i in 0..node.child_count() {
-            if let Some(child) = node.child(i) {
-                self.find_calls(&child, source, file_path, calls, exclusions);
-            }
-        }
+        });
     }
 
     fn extract_callee(node: &Node, source: &[u8]) -> (Option<String>, Option<String>) {
@@ -250,12 +234,11 @@ impl PythonAnalyser {
 
         if first.kind() == "attribute" {
             let mut parts = Vec::new();
-            for i in 0..first.child_count() {
-                if let Some(c) = first.child(i) {
-                    if c.kind() == "identifier" {
-                        if let Ok(text) = c.utf8_text(source) {
-                            parts.push(text.to_string());
-                        }
+            let mut cursor = first.walk();
+            for c in first.children(&mut cursor) {
+                if c.kind() == "identifier" {
+                    if let Ok(text) = c.utf8_text(source) {
+                        parts.push(text.to_string());
                     }
                 }
             }
@@ -275,11 +258,10 @@ impl PythonAnalyser {
         let mut current = node.parent();
         while let Some(n) = current {
             if n.kind() == "function_definition" {
-                for i in 0..n.child_count() {
-                    if let Some(c) = n.child(i) {
-                        if c.kind() == "identifier" {
-                            return c.utf8_text(source).ok().map(|s| s.to_string());
-                        }
+                let mut cursor = n.walk();
+                for c in n.children(&mut cursor) {
+                    if c.kind() == "identifier" {
+                        return c.utf8_text(source).ok().map(|s| s.to_string());
                     }
                 }
             }
@@ -311,47 +293,42 @@ impl LanguageAnalyser for PythonAnalyser {
     fn extract_imports(&self, tree: &Tree, source: &[u8], file_path: &str) -> Vec<ImportStatement> {
         let mut imports = Vec::new();
         let root = tree.root_node();
-        for i in 0..root.child_count() {
-            if let Some(child) = root.child(i) {
-                if child.kind() == "import_statement" {
-                    // import foo, import foo.bar
-                    for j in 0..child.child_count() {
-                        if let Some(c) = child.child(j) {
-                            if c.kind() == "dotted_name" {
-                                if let Ok(target) = c.utf8_text(source) {
-                                    imports.push(ImportStatement {
-                                        file: file_path.to_string(),
-                                        statement: child
-                                            .utf8_text(source)
-                                            .unwrap_or("")
-                                            .to_string(),
-                                        target_name: target.to_string(),
-                                        line: child.start_position().row + 1,
-                                    });
-                                }
-                            }
+        let mut cursor = root.walk();
+        for child in root.children(&mut cursor) {
+            if child.kind() == "import_statement" {
+                // import foo, import foo.bar
+                let statement = child.utf8_text(source).unwrap_or("");
+                let mut cursor = child.walk();
+                for c in child.children(&mut cursor) {
+                    if c.kind() == "dotted_name" {
+                        if let Ok(target) = c.utf8_text(source) {
+                            imports.push(ImportStatement {
+                                file: file_path.to_string(),
+                                statement: statement.to_string(),
+                                target_name: target.to_string(),
+                                line: child.start_position().row + 1,
+                            });
                         }
                     }
-                } else if child.kind() == "import_from_statement" {
-                    // from foo import bar
-                    let mut module = None;
-                    for j in 0..child.child_count() {
-                        if let Some(c) = child.child(j) {
-                            if c.kind() == "dotted_name" || c.kind() == "relative_import" {
-                                module = c.utf8_text(source).ok().map(|s| s.to_string());
-                                break;
-                            }
-                        }
-                    }
-                    if let Some(module) = module {
-                        imports.push(ImportStatement {
-                            file: file_path.to_string(),
-                            statement: child.utf8_text(source).unwrap_or("").to_string(),
-                            target_name: module,
-                            line: child.start_position().row + 1,
-                        });
+                }
+            } else if child.kind() == "import_from_statement" {
+                // from foo import bar
+                let mut module = None;
+                let mut cursor = child.walk();
+                for c in child.children(&mut cursor) {
+                    if c.kind() == "dotted_name" || c.kind() == "relative_import" {
+                        module = c.utf8_text(source).ok().map(|s| s.to_string());
+                        break;
                     }
                 }
+                if let Some(module) = module {
+                    imports.push(ImportStatement {
+                        file: file_path.to_string(),
+                        statement: child.utf8_text(source).unwrap_or("").to_string(),
+                        target_name: module,
+                        line: child.start_position().row + 1,
+                    });
+                }
             }
         }
         imports
@@ -5,7 +5,7 @@ use std::sync::LazyLock;
 
 use tree_sitter::{Language, Node, Tree};
 
-use super::LanguageAnalyser;
+use super::{is_builtin_call, kind_ids, walk_tree, LanguageAnalyser};
 use crate::config::{ImportStatement, RawCall, Symbol, SymbolType, Visibility};
 
 static BUILTIN_EXCLUSIONS: LazyLock<HashSet<String>> = LazyLock::new(|| {
@@ -122,22 +122,20 @@ impl RustAnalyser {
     }
 
     fn get_name(node: &Node, source: &[u8]) -> Option<String> {
-        for i in 0..node.child_count() {
-            if let Some(child) = node.child(i) {
-                if child.kind() == "identifier" || child.kind() == "type_identifier" {
-                    return child.utf8_text(source).ok().map(|s| s.to_string());
-                }
+        let mut cursor = node.walk();
+        for child in node.children(&mut cursor) {
+            if child.kind() == "identifier" || child.kind() == "type_identifier" {
+                return child.utf8_text(source).ok().map(|s| s.to_string());
             }
         }
         None
     }
 
     fn is_pub(node: &Node) -> bool {
-        for i in 0..node.child_count() {
-            if let Some(child) = node.child(i) {
-                if child.kind() == "visibility_modifier" {
-                    return true;
-                }
+        let mut cursor = node.walk();
+        for child in node.children(&mut cursor) {
+            if child.kind() == "visibility_modifier" {
+                return true;
             }
         }
         false
@@ -151,12 +149,8 @@ impl RustAnalyser {
         symbols: &mut Vec<Symbol>,
         parent_id: Option<&str>,
     ) {
-        for i in 0..node.child_count() {
-            let child = match node.child(i) {
-                Some(c) => c,
-                None => continue,
-            };
-
+        let mut cursor = node.walk();
+        for child in node.children(&mut cursor) {
             let sym_type = match node_to_symbol_type(child.kind()) {
                 Some(t) => t,
                 None => continue,
@@ -189,11 +183,10 @@ impl RustAnalyser {
 
             // Recurse into impl blocks and mod blocks
             if child.kind() == "impl_item" || child.kind() == "mod_item" {
-                for j in 0..child.child_count() {
-                    if let Some(c) = child.child(j) {
-                        if c.kind() == "declaration_list" {
-                            self.walk_node(&c, source, file_path, symbols, Some(&name));
-                        }
+                let mut cursor = child.walk();
+                for c in child.children(&mut cursor) {
+                    if c.kind() == "declaration_list" {
+                        self.walk_node(&c, source, file_path, symbols, Some(&name));
                     }
                 }
             }
@@ -208,16 +201,12 @@ impl RustAnalyser {
         calls: &mut Vec<RawCall>,
         exclusions: &HashSet<String>,
     ) {
-        if node.kind() == "call_expression" {
-            let (callee_name, qualifier) = Self::extract_callee(node, source);
-            if let Some(ref name) = callee_name {
-                if !exclusions.contains(name) {
-                    let qualified = if let Some(ref q) = qualifier {
-                        format!("{}::{}", q, name)
-                    } else {
-                        name.clone()
-                    };
-                    if !exclusions.contains(&qualified) {
+        let [call_kind] = kind_ids(node, ["call_expression"]);
+        walk_tree(node, |node| {
+            if node.kind_id() == call_kind {
+                let (callee_name, qualifier) = Self::extract_callee(node, source);
+                if let Some(ref name) = callee_name {
+                    if !is_builtin_call(exclusions, name, qualifier.as_deref(), "::") {
                         let caller = self.find_enclosing(node, source);
                         calls.push(RawCall {
                             caller_file: file_path.to_string(),
@@ -228,11 +217,10 @@ impl RustAnalyser {
                         });
                     }
                 }
-            }
-        } else if node.kind() == "macro_invocation" {
-            // macro_invocation: identifier ! token_tree
-            for i in 0..node.child_count() {
-                if let Some(child) = node.child(i) {
+            } else if node.kind() == "macro_invocation" {
+                // macro_invocation: identifier ! token_tree
+                let mut cursor = node.walk();
+                for child in node.children(&mut cursor) {
                     if child.kind() == "identifier" {
                         if let Ok(name) = child.utf8_text(source) {
                             let name = name.to_string();
@@ -252,13 +240,7 @@ impl RustAnalyser {
                     }
                 }
             }
-        }
-
-        for i in 0..node.child_count() {
-            if let Some(child) = node.child(i) {
-                self.find_calls(&child, source, file_path, calls, exclusions);
-            }
-        }
+        });
     }
 
     fn extract_callee(node: &Node, source: &[u8]) -> (Option<String>, Option<String>) {
@@ -273,12 +255,11 @@ impl RustAnalyser {
 
         if first.kind() == "scoped_identifier" {
             let mut parts = Vec::new();
-            for i in 0..first.child_count() {
-                if let Some(c) = first.child(i) {
-                    if c.kind() == "identifier" || c.kind() == "type_identifier" {
-                        if let Ok(text) = c.utf8_text(source) {
-                            parts.push(text.to_string());
-                        }
+            let mut cursor = first.walk();
+            for c in first.children(&mut cursor) {
+                if c.kind() == "identifier" || c.kind() == "type_identifier" {
+                    if let Ok(text) = c.utf8_text(source) {
+                        parts.push(text.to_string());
                     }
                 }
             }
@@ -293,12 +274,11 @@ impl RustAnalyser {
 
         if first.kind() == "field_expression" {
             let mut parts = Vec::new();
-            for i in 0..first.child_count() {
-                if let Some(c) = first.child(i) {
-                    if c.kind() == "identifier" || c.kind() == "field_identifier" {
-                        if let Ok(text) = c.utf8_text(source) {
-                            parts.push(text.to_string());
-                        }
+            let mut cursor = first.walk();
+            for c in first.children(&mut cursor) {
+                if c.kind() == "identifier" || c.kind() == "field_identifier" {
+                    if let Ok(text) = c.utf8_text(source) {
+                        parts.push(text.to_string());
                     }
                 }
             }
@@ -348,36 +328,34 @@ impl LanguageAnalyser for RustAnalyser {
     fn extract_imports(&self, tree: &Tree, source: &[u8], file_path: &str) -> Vec<ImportStatement> {
         let mut imports = Vec::new();
         let root = tree.root_node();
-        for i in 0..root.child_count() {
-            if let Some(child) = root.child(i) {
-                if child.kind() == "use_declaration" {
-                    let mut path = None;
-                    for j in 0..child.child_count() {
-                        if let Some(c) = child.child(j) {
-                            if c.kind() == "scoped_identifier"
-                                || c.kind() == "identifier"
-                                || c.kind() == "use_wildcard"
-                                || c.kind() == "scoped_use_list"
-                            {
-                                path = c.utf8_text(source).ok().map(|s| s.to_string());
-                                break;
-                            }
-                        }
-                    }
-                    if let Some(path) = path {
-                        imports.push(ImportStatement {
-                            file: file_path.to_string(),
-                            statement: child
-                                .utf8_text(source)
-                                .unwrap_or("")
-                                .trim_end_matches(';')
-                                .trim()
-                                .to_string(),
-                            target_name: path,
-                            line: child.start_position().row + 1,
-                        });
+        let mut cursor = root.walk();
+        for child in root.children(&mut cursor) {
+            if child.kind() == "use_declaration" {
+                let mut path = None;
+                let mut cursor = child.walk();
+                for c in child.children(&mut cursor) {
+                    if c.kind() == "scoped_identifier"
+                        || c.kind() == "identifier"
+                        || c.kind() == "use_wildcard"
+                        || c.kind() == "scoped_use_list"
+                    {
+                        path = c.utf8_text(source).ok().map(|s| s.to_string());
+                        break;
                     }
                 }
+                if let Some(path) = path {
+                    imports.push(ImportStatement {
+                        file: file_path.to_string(),
+                        statement: child
+                            .utf8_text(source)
+                            .unwrap_or("")
+                            .trim_end_matches(';')
+                            .trim()
+                            .to_string(),
+                        target_name: path,
+                        line: child.start_position().row + 1,
+                    });
+                }
             }
         }
         imports
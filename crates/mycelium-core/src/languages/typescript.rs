@@ -5,7 +5,7 @@ use std::sync::LazyLock;
 
 use tree_sitter::{Language, Node, Tree};
 
-use super::LanguageAnalyser;
+use super::{is_builtin_call, kind_ids, walk_tree, LanguageAnalyser};
 use crate::config::{ImportStatement, RawCall, Symbol, SymbolType, Visibility};
 
 static BUILTIN_EXCLUSIONS: LazyLock<HashSet<String>> = LazyLock::new(|| {
@@ -109,11 +109,10 @@ impl TypeScriptAnalyser {
     }
 
     fn get_name(node: &Node, source: &[u8]) -> Option<String> {
-        for i in 0..node.child_count() {
-            if let Some(child) = node.child(i) {
-                if child.kind() == "identifier" || child.kind() == "type_identifier" {
-                    return child.utf8_text(source).ok().map(|s| s.to_string());
-                }
+        let mut cursor = node.walk();
+        for child in node.children(&mut cursor) {
+            if child.kind() == "identifier" || child.kind() == "type_identifier" {
+                return child.utf8_text(source).ok().map(|s| s.to_string());
             }
         }
         None
@@ -129,26 +128,20 @@ impl TypeScriptAnalyser {
     ) {
         let lang = Self::language_for_path(file_path);
 
-        for i in 0..node.child_count() {
-            let child = match node.child(i) {
-                Some(c) => c,
-                None => continue,
-            };
-
+        let mut cursor = node.walk();
+        for child in node.children(&mut cursor) {
             let mut exported = false;
             let mut decl = child;
 
             // Check for export_statement wrapper
             if child.kind() == "export_statement" {
                 exported = true;
-                for j in 0..child.child_count() {
-                    if let Some(c) = child.child(j) {
-                        if node_to_symbol_type(c.kind()).is_some()
-                            || c.kind() == "lexical_declaration"
-                        {
-                            decl = c;
-                            break;
-                        }
+                let mut cursor = child.walk();
+                for c in child.children(&mut cursor) {
+                    if node_to_symbol_type(c.kind()).is_some() || c.kind() == "lexical_declaration"
+                    {
+                        decl = c;
+                        break;
                     }
                 }
             }
@@ -175,57 +168,51 @@ impl TypeScriptAnalyser {
 
                     // Extract class members
                     if decl.kind() == "class_declaration" {
-                        for j in 0..decl.child_count() {
-                            if let Some(c) = decl.child(j) {
-                                if c.kind() == "class_body" {
-                                    self.extract_class_members(
-                                        &c, file_path, source, symbols, &name, lang,
-                                    );
-                                }
+                        let mut cursor = decl.walk();
+                        for c in decl.children(&mut cursor) {
+                            if c.kind() == "class_body" {
+                                self.extract_class_members(
+                                    &c, file_path, source, symbols, &name, lang,
+                                );
                             }
                         }
                     }
                 }
             } else if decl.kind() == "lexical_declaration" {
                 // const/let with arrow functions
-                for j in 0..decl.child_count() {
-                    if let Some(vc) = decl.child(j) {
-                        if vc.kind() == "variable_declarator" {
-                            let mut vname = None;
-                            let mut is_fn = false;
-                            for k in 0..vc.child_count() {
-                                if let Some(c) = vc.child(k) {
-                                    if c.kind() == "identifier" {
-                                        vname = c.utf8_text(source).ok().map(|s| s.to_string());
-                                    }
-                                    if c.kind() == "arrow_function" {
-                                        is_fn = true;
-                                    }
-                                }
+                let mut cursor = decl.walk();
+                for vc in decl.children(&mut cursor) {
+                    if vc.kind() == "variable_declarator" {
+                        let mut vname = None;
+                        let mut is_fn = false;
+                        let mut cursor = vc.walk();
+                        for c in vc.children(&mut cursor) {
+                            if c.kind() == "identifier" {
+                                vname = c.utf8_text(source).ok().map(|s| s.to_string());
                             }
-                            if let Some(name) = vname {
-                                if is_fn {
-                                    symbols.push(Symbol {
-                                        id: format!("_pending_{}", symbols.len()),
-                                        name,
-                                        symbol_type: SymbolType::Function,
-                                        file: file_path.to_string(),
-                                        line: vc.start_position().row + 1,
-                                        visibility: if exported {
-                                            Visibility::Public
-                                        } else {
-                                            Visibility::Private
-                                        },
-                                        exported,
-                                        parent: parent_id.map(|s| s.to_string()),
-                                        language: Some(lang.to_string()),
-                                        byte_range: Some((
-                                            vc.byte_range().start,
-                                            vc.byte_range().end,
-                                        )),
-                                        parameter_types: None,
-                                    });
-                                }
+                            if c.kind() == "arrow_function" {
+                                is_fn = true;
+                            }
+                        }
+                        if let Some(name) = vname {
+                            if is_fn {
+                                symbols.push(Symbol {
+                                    id: format!("_pending_{}", symbols.len()),
+                                    name,
+                                    symbol_type: SymbolType::Function,
+                                    file: file_path.to_string(),
+                                    line: vc.start_position().row + 1,
+                                    visibility: if exported {
+                                        Visibility::Public
+                                    } else {
+                                        Visibility::Private
+                                    },
+                                    exported,
+                                    parent: parent_id.map(|s| s.to_string()),
+                                    language: Some(lang.to_string()),
+                                    byte_range: Some((vc.byte_range().start, vc.byte_range().end)),
+                                    parameter_types: None,
+                                });
                             }
                         }
                     }
@@ -243,78 +230,73 @@ impl TypeScriptAnalyser {
         parent_name: &str,
         lang: &str,
     ) {
-        for i in 0..body_node.child_count() {
-            if let Some(child) = body_node.child(i) {
-                if child.kind() == "method_definition" {
-                    let mut name = None;
-                    for j in 0..child.child_count() {
-                        if let Some(c) = child.child(j) {
-                            if c.kind() == "property_identifier" {
-                                name = c.utf8_text(source).ok().map(|s| s.to_string());
-                                break;
-                            }
-                        }
-                    }
-                    if let Some(name) = name {
-                        let sym_type = if name == "constructor" {
-                            SymbolType::Constructor
-                        } else {
-                            SymbolType::Method
-                        };
-                        symbols.push(Symbol {
-                            id: format!("_pending_{}", symbols.len()),
-                            name,
-                            symbol_type: sym_type,
-                            file: file_path.to_string(),
-                            line: child.start_position().row + 1,
-                            visibility: Visibility::Public,
-                            exported: true,
-                            parent: Some(parent_name.to_string()),
-                            language: Some(lang.to_string()),
-                            byte_range: Some((child.byte_range().start, child.byte_range().end)),
-                            parameter_types: None,
-                        });
-                    }
-                } else if child.kind() == "public_field_definition" {
-                    let mut name = None;
-                    for j in 0..child.child_count() {
-                        if let Some(c) = child.child(j) {
-                            if c.kind() == "property_identifier" {
-                                name = c.utf8_text(source).ok().map(|s| s.to_string());
-                                break;
-                            }
-                        }
+        let mut cursor = body_node.walk();
+        for child in body_node.children(&mut cursor) {
+            if child.kind() == "method_definition" {
+                let mut name = None;
+                let mut cursor = child.walk();
+                for c in child.children(&mut cursor) {
+                    if c.kind() == "property_identifier" {
+                        name = c.utf8_text(source).ok().map(|s| s.to_string());
+                        break;
                     }
-                    if let Some(name) = name {
-                        symbols.push(Symbol {
-                            id: format!("_pending_{}", symbols.len()),
-                            name,
-                            symbol_type: SymbolType::Property,
-                            file: file_path.to_string(),
-                            line: child.start_position().row + 1,
-                            visibility: Visibility::Public,
-                            exported: true,
-                            parent: Some(parent_name.to_string()),
-                            language: Some(lang.to_string()),
-                            byte_range: Some((child.byte_range().start, child.byte_range().end)),
-                            parameter_types: None,
-                        });
+                }
+                if let Some(name) = name {
+                    let sym_type = if name == "constructor" {
+                        SymbolType::Constructor
+                    } else {
+                        SymbolType::Method
+                    };
+                    symbols.push(Symbol {
+                        id: format!("_pending_{}", symbols.len()),
+                        name,
+                        symbol_type: sym_type,
+                        file: file_path.to_string(),
+                        line: child.start_position().row + 1,
+                        visibility: Visibility::Public,
+                        exported: true,
+                        parent: Some(parent_name.to_string()),
+                        language: Some(lang.to_string()),
+                        byte_range: Some((child.byte_range().start, child.byte_range().end)),
+                        parameter_types: None,
+                    });
+                }
+            } else if child.kind() == "public_field_definition" {
+                let mut name = None;
+                let mut cursor = child.walk();
+                for c in child.children(&mut cursor) {
+                    if c.kind() == "property_identifier" {
+                        name = c.utf8_text(source).ok().map(|s| s.to_string());
+                        break;
                     }
                 }
+                if let Some(name) = name {
+                    symbols.push(Symbol {
+                        id: format!("_pending_{}", symbols.len()),
+                        name,
+                        symbol_type: SymbolType::Property,
+                        file: file_path.to_string(),
+                        line: child.start_position().row + 1,
+                        visibility: Visibility::Public,
+                        exported: true,
+                        parent: Some(parent_name.to_string()),
+                        language: Some(lang.to_string()),
+                        byte_range: Some((child.byte_range().start, child.byte_range().end)),
+                        parameter_types: None,
+                    });
+                }
             }
         }
     }
 
     fn extract_string_source(node: &Node, source: &[u8]) -> Option<String> {
-        for i in 0..node.child_count() {
-            if let Some(child) = node.child(i) {
-                if child.kind() == "string" {
-                    for j in 0..child.child_count() {
-                        if let Some(sc) = child.child(j) {
-                            if sc.kind() == "string_fragment" {
-                                return sc.utf8_text(source).ok().map(|s| s.to_string());
-                            }
-                        }
+        let mut cursor = node.walk();
+        for child in node.children(&mut cursor) {
+            if child.kind() == "string" {
+                let mut cursor = child.walk();
+                for sc in child.children(&mut cursor) {
+                    if sc.kind() == "string_fragment" {
+                        return sc.utf8_text(source).ok().map(|s| s.to_string());
                     }
                 }
             }
@@ -330,16 +312,13 @@ impl TypeScriptAnalyser {
         calls: &mut Vec<RawCall>,
         exclusions: &HashSet<String>,
     ) {
-        if node.kind() == "call_expression" || node.kind() == "new_expression" {
-            let (callee_name, qualifier) = self.extract_callee(node, source);
-            if let Some(ref name) = callee_name {
-                if !exclusions.contains(name) {
-                    let qualified = if let Some(ref q) = qualifier {
-                        format!("{}.{}", q, name)
-                    } else {
-                        name.clone()
-                    };
-                    if !exclusions.contains(&qualified) {
+        let [call_kind, new_kind] = kind_ids(node, ["call_expression", "new_expression"]);
+        walk_tree(node, |node| {
+            let kind = node.kind_id();
+            if kind == call_kind || kind == new_kind {
+                let (callee_name, qualifier) = self.extract_callee(node, source);
+                if let Some(ref name) = callee_name {
+                    if !is_builtin_call(exclusions, name, qualifier.as_deref(), ".") {
                         let caller = self.find_enclosing(node, source);
                         calls.push(RawCall {
                             caller_file: file_path.to_string(),
@@ -351,12 +330,7 @@ impl TypeScriptAnalyser {
                     }
                 }
             }
-        }
-        for i in 0..node.child_count() {
-            if let Some(child) = node.child(i) {
-                self.find_calls(&child, source, file_path, calls, exclusions);
-            }
-        }
+        });
     }
 
     fn extract_callee(&self, node: &Node, source: &[u8]) -> (Option<String>, Option<String>) {
@@ -383,15 +357,14 @@ impl TypeScriptAnalyser {
 
         if first.kind() == "member_expression" {
             let mut parts = Vec::new();
-            for i in 0..first.child_count() {
-                if let Some(c) = first.child(i) {
-                    if c.kind() == "identifier"
-                        || c.kind() == "property_identifier"
-                        || c.kind() == "type_identifier"
-                    {
-                        if let Ok(text) = c.utf8_text(source) {
-                            parts.push(text.to_string());
-                        }
+            let mut cursor = first.walk();
+            for c in first.children(&mut cursor) {
+                if c.kind() == "identifier"
+                    || c.kind() == "property_identifier"
+                    || c.kind() == "type_identifier"
+                {
+                    if let Ok(text) = c.utf8_text(source) {
+                        parts.push(text.to_string());
                     }
                 }
             }
@@ -411,20 +384,18 @@ impl TypeScriptAnalyser {
         let mut current = node.parent();
         while let Some(n) = current {
             if n.kind() == "method_definition" || n.kind() == "function_declaration" {
-                for i in 0..n.child_count() {
-                    if let Some(c) = n.child(i) {
-                        if c.kind() == "identifier" || c.kind() == "property_identifier" {
-                            return c.utf8_text(source).ok().map(|s| s.to_string());
-                        }
+                let mut cursor = n.walk();
+                for c in n.children(&mut cursor) {
+                    if c.kind() == "identifier" || c.kind() == "property_identifier" {
+                        return c.utf8_text(source).ok().map(|s| s.to_string());
                     }
                 }
             }
             if n.kind() == "variable_declarator" {
-                for i in 0..n.child_count() {
-                    if let Some(c) = n.child(i) {
-                        if c.kind() == "identifier" {
-                            return c.utf8_text(source).ok().map(|s| s.to_string());
-                        }
+                let mut cursor = n.walk();
+                for c in n.children(&mut cursor) {
+                    if c.kind() == "identifier" {
+                        return c.utf8_text(source).ok().map(|s| s.to_string());
                     }
                 }
             }
@@ -464,39 +435,38 @@ impl LanguageAnalyser for TypeScriptAnalyser {
     fn extract_imports(&self, tree: &Tree, source: &[u8], file_path: &str) -> Vec<ImportStatement> {
         let mut imports = Vec::new();
         let root = tree.root_node();
-        for i in 0..root.child_count() {
-            if let Some(child) = root.child(i) {
-                if child.kind() == "import_statement" {
-                    if let Some(source_path) = Self::extract_string_source(&child, source) {
-                        let statement = child
-                            .utf8_text(source)
-                            .unwrap_or("")
-                            .trim_end_matches(';')
-                            .trim()
-                            .to_string();
-                        imports.push(ImportStatement {
-                            file: file_path.to_string(),
-                            statement,
-                            target_name: source_path,
-                            line: child.start_position().row + 1,
-                        });
-                    }
-                } else if child.kind() == "export_statement" {
-                    // Re-exports: export { X } from './module'
-                    if let Some(source_path) = Self::extract_string_source(&child, source) {
-                        let statement = child
-                            .utf8_text(source)
-                            .unwrap_or("")
-                            .trim_end_matches(';')
-                            .trim()
-                            .to_string();
-                        imports.push(ImportStatement {
-                            file: file_path.to_string(),
-                            statement,
-                            target_name: source_path,
-                            line: child.start_position().row + 1,
-                        });
-                    }
+        let mut cursor = root.walk();
+        for child in root.children(&mut cursor) {
+            if child.kind() == "import_statement" {
+                if let Some(source_path) = Self::extract_string_source(&child, source) {
+                    let statement = child
+                        .utf8_text(source)
+                        .unwrap_or("")
+                        .trim_end_matches(';')
+                        .trim()
+                        .to_string();
+                    imports.push(ImportStatement {
+                        file: file_path.to_string(),
+                        statement,
+                        target_name: source_path,
+                        line: child.start_position().row + 1,
+                    });
+                }
+            } else if child.kind() == "export_statement" {
+                // Re-exports: export { X } from './module'
+                if let Some(source_path) = Self::extract_string_source(&child, source) {
+                    let statement = child
+                        .utf8_text(source)
+                        .unwrap_or("")
+                        .trim_end_matches(';')
+                        .trim()
+                        .to_string();
+                    imports.push(ImportStatement {
+                        file: file_path.to_string(),
+                        statement,
+                        target_name: source_path,
+                        line: child.start_position().row + 1,
+                    });
                 }
             }
         }
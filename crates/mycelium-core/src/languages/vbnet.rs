@@ -6,7 +6,7 @@ use std::sync::LazyLock;
 use tree_sitter::{Language, Node, Tree};
 use tree_sitter_language::LanguageFn;
 
-use super::LanguageAnalyser;
+use super::{is_builtin_call, kind_ids, walk_tree, LanguageAnalyser};
 use crate::config::{ImportStatement, RawCall, Symbol, SymbolType, Visibility};
 
 // Work around mismatched extern symbol in the grammar crate's auto-generated bindings.
@@ -88,31 +88,29 @@ fn is_container(node_type: &str) -> bool {
 
 fn get_visibility(node: &Node, source: &[u8]) -> Visibility {
     if let Some(modifiers) = node.child_by_field_name("modifiers") {
-        for i in 0..modifiers.child_count() {
-            if let Some(child) = modifiers.child(i) {
-                let text = child.utf8_text(source).unwrap_or("");
-                match text {
-                    "Public" => return Visibility::Public,
-                    "Private" => return Visibility::Private,
-                    "Friend" => return Visibility::Internal,
-                    "Protected" => return Visibility::Protected,
-                    _ => {}
-                }
+        let mut cursor = modifiers.walk();
+        for child in modifiers.children(&mut cursor) {
+            let text = child.utf8_text(source).unwrap_or("");
+            match text {
+                "Public" => return Visibility::Public,
+                "Private" => return Visibility::Private,
+                "Friend" => return Visibility::Internal,
+                "Protected" => return Visibility::Protected,
+                _ => {}
             }
         }
     }
     // Also check direct children for modifier-like tokens
-    for i in 0..node.child_count() {
-        if let Some(child) = node.child(i) {
-            if child.kind() == "modifier" || child.kind() == "access_modifier" {
-                let text = child.utf8_text(source).unwrap_or("");
-                match text {
-                    "Public" => return Visibility::Public,
-                    "Private" => return Visibility::Private,
-                    "Friend" => return Visibility::Internal,
-                    "Protected" => return Visibility::Protected,
-                    _ => {}
-                }
+    let mut cursor = node.walk();
+    for child in node.children(&mut cursor) {
+        if child.kind() == "modifier" || child.kind() == "access_modifier" {
+            let text = child.utf8_text(source).unwrap_or("");
+            match text {
+                "Public" => return Visibility::Public,
+                "Private" => return Visibility::Private,
+                "Friend" => return Visibility::Internal,
+                "Protected" => return Visibility::Protected,
+                _ => {}
             }
         }
     }
@@ -129,11 +127,10 @@ fn get_name(node: &Node, source: &[u8]) -> Option<String> {
         return name_node.utf8_text(source).ok().map(|s| s.to_string());
     }
     // Fallback: look for identifier child
-    for i in 0..node.child_count() {
-        if let Some(child) = node.child(i) {
-            if child.kind() == "identifier" {
-                return child.utf8_text(source).ok().map(|s| s.to_string());
-            }
+    let mut cursor = node.walk();
+    for child in node.children(&mut cursor) {
+        if child.kind() == "identifier" {
+            return child.utf8_text(source).ok().map(|s| s.to_string());
         }
     }
     None
@@ -160,12 +157,8 @@ impl VbNetAnalyser {
         symbols: &mut Vec<Symbol>,
         parent_id: Option<&str>,
     ) {
-        for i in 0..node.child_count() {
-            let child = match node.child(i) {
-                Some(c) => c,
-                None => continue,
-            };
-
+        let mut cursor = node.walk();
+        for child in node.children(&mut cursor) {
             // type_declaration is a wrapper node — recurse into it to find the actual type
             if child.kind() == "type_declaration" {
                 self.walk_node(&child, source, file_path, symbols, parent_id);
@@ -220,16 +213,12 @@ impl VbNetAnalyser {
         calls: &mut Vec<RawCall>,
         exclusions: &HashSet<String>,
     ) {
-        if node.kind() == "invocation" {
-            let (callee_name, qualifier) = extract_callee(node, source);
-            if let Some(ref name) = callee_name {
-                if !exclusions.contains(name) {
-                    let qualified = if let Some(ref q) = qualifier {
-                        format!("{}.{}", q, name)
-                    } else {
-                        name.clone()
-                    };
-                    if !exclusions.contains(&qualified) {
+        let [call_kind] = kind_ids(node, ["invocation"]);
+        walk_tree(node, |node| {
+            if node.kind_id() == call_kind {
+                let (callee_name, qualifier) = extract_callee(node, source);
+                if let Some(ref name) = callee_name {
+                    if !is_builtin_call(exclusions, name, qualifier.as_deref(), ".") {
                         let caller = find_enclosing_method(node, source);
                         calls.push(RawCall {
                             caller_file: file_path.to_string(),
@@ -241,13 +230,7 @@ impl VbNetAnalyser {
                     }
                 }
             }
-        }
-
-        for i in 0..node.child_count() {
-            if let Some(child) = node.child(i) {
-                self.find_calls(&child, source, file_path, calls, exclusions);
-            }
-        }
+        });
     }
 }
 
@@ -267,12 +250,11 @@ fn extract_callee(node: &Node, source: &[u8]) -> (Option<String>, Option<String>
         }
         "member_access" | "member_access_expression" => {
             let mut parts = Vec::new();
-            for i in 0..target.child_count() {
-                if let Some(child) = target.child(i) {
-                    if child.kind() == "identifier" {
-                        if let Ok(text) = child.utf8_text(source) {
-                            parts.push(text.to_string());
-                        }
+            let mut cursor = target.walk();
+            for child in target.children(&mut cursor) {
+                if child.kind() == "identifier" {
+                    if let Ok(text) = child.utf8_text(source) {
+                        parts.push(text.to_string());
                     }
                 }
             }
@@ -366,40 +348,38 @@ impl LanguageAnalyser for VbNetAnalyser {
     fn extract_imports(&self, tree: &Tree, source: &[u8], file_path: &str) -> Vec<ImportStatement> {
         let mut imports = Vec::new();
         let root = tree.root_node();
-        for i in 0..root.child_count() {
-            if let Some(child) = root.child(i) {
-                if child.kind() == "imports_statement" {
-                    // Try the "namespace" field
-                    if let Some(ns_node) = child.child_by_field_name("namespace") {
-                        if let Ok(target) = ns_node.utf8_text(source) {
-                            let statement =
-                                child.utf8_text(source).unwrap_or("").trim().to_string();
+        let mut cursor = root.walk();
+        for child in root.children(&mut cursor) {
+            if child.kind() == "imports_statement" {
+                // Try the "namespace" field
+                if let Some(ns_node) = child.child_by_field_name("namespace") {
+                    if let Ok(target) = ns_node.utf8_text(source) {
+                        let statement = child.utf8_text(source).unwrap_or("").trim().to_string();
+                        imports.push(ImportStatement {
+                            file: file_path.to_string(),
+                            statement,
+                            target_name: target.to_string(),
+                            line: child.start_position().row + 1,
+                        });
+                    }
+                } else {
+                    // Fallback: extract from the full statement text
+                    if let Ok(text) = child.utf8_text(source) {
+                        let text = text.trim();
+                        let target = text
+                            .strip_prefix("Imports ")
+                            .or_else(|| text.strip_prefix("imports "))
+                            .unwrap_or(text)
+                            .trim()
+                            .to_string();
+                        if !target.is_empty() {
                             imports.push(ImportStatement {
                                 file: file_path.to_string(),
-                                statement,
-                                target_name: target.to_string(),
+                                statement: text.to_string(),
+                                target_name: target,
                                 line: child.start_position().row + 1,
                             });
                         }
-                    } else {
-                        // Fallback: extract from the full statement text
-                        if let Ok(text) = child.utf8_text(source) {
-                            let text = text.trim();
-                            let target = text
-                                .strip_prefix("Imports ")
-                                .or_else(|| text.strip_prefix("imports "))
-                                .unwrap_or(text)
-                                .trim()
-                                .to_string();
-                            if !target.is_empty() {
-                                imports.push(ImportStatement {
-                                    file: file_path.to_string(),
-                                    statement: text.to_string(),
-                                    target_name: target,
-                                    line: child.start_position().row + 1,
-                                });
-                            }
-                        }
                     }
                 }
             }
@@ -2,7 +2,7 @@
 
 use std::collections::HashMap;
 
-use crate::config::{AnalysisConfig, CallEdge};
+use crate::config::{AnalysisConfig, CallEdge, SymbolType};
 use crate::graph::knowledge_graph::KnowledgeGraph;
 use crate::graph::namespace_index::NamespaceIndex;
 use crate::graph::symbol_table::SymbolTable;
@@ -16,7 +16,7 @@ pub fn run_calls_phase(
     _ns_index: &mut NamespaceIndex,
 ) {
     let repo_root = &config.repo_path;
-    let registry = AnalyserRegistry::new();
+    let registry = AnalyserRegistry::shared();
 
     // Build a map of file imports for Tier A resolution
     let import_map = build_import_map(kg);
@@ -37,6 +37,9 @@ pub fn run_calls_phase(
         })
         .collect();
 
+    // One parser for the whole phase; set_language switches grammars per file
+    let mut parser = tree_sitter::Parser::new();
+
     for (file_path, language) in &files {
         if let Some(ref langs) = config.languages {
             if !langs.contains(language) {
@@ -62,9 +65,11 @@ pub fn run_calls_phase(
             Err(_) => continue,
         };
 
-        let lang_ts = analyser.get_language_for_ext(&ext);
-        let mut parser = tree_sitter::Parser::new();
-        if parser.set_language(&lang_ts).is_err() {
+        let lang_ts = match registry.language_for_ext(&ext) {
+            Some(l) => l,
+            None => continue,
+        };
+        if parser.set_language(lang_ts).is_err() {
             continue;
         }
 
@@ -88,11 +93,11 @@ pub fn run_calls_phase(
             .cloned()
             .unwrap_or_default();
 
-        for raw_call in &raw_calls {
-            if let Some(edge) = resolve_call(raw_call, file_path, st, &import_map, kg, &ftm) {
-                kg.add_call(&edge);
-            }
-        }
+        let edges: Vec<_> = raw_calls
+            .iter()
+            .filter_map(|raw_call| resolve_call(raw_call, file_path, st, &import_map, kg, &ftm))
+            .collect();
+        kg.add_calls(&edges);
     }
 }
 
@@ -103,8 +108,11 @@ pub fn run_calls_phase(
 /// Build a map from source file -> list of imported file paths.
 fn build_import_map(kg: &KnowledgeGraph) -> HashMap<String, Vec<String>> {
     let mut import_map: HashMap<String, Vec<String>> = HashMap::new();
-    for (from_file, to_file, _stmt) in kg.get_import_edges() {
-        import_map.entry(from_file).or_default().push(to_file);
+    for (from_file, to_file, _stmt) in kg.iter_import_edges() {
+        import_map
+            .entry(from_file.to_string())
+            .or_default()
+            .push(to_file.to_string());
     }
     import_map
 }
@@ -134,26 +142,22 @@ fn is_interface_self_call(
     if caller_name != callee_name {
         return false;
     }
-    let syms = kg.get_symbols();
-    let target = syms.iter().find(|s| s.id == target_id);
-    let parent_name = match target.and_then(|s| s.parent.as_ref()) {
+    let parent_name = match kg.symbol(target_id).and_then(|s| s.parent) {
         Some(p) => p,
         None => return false,
     };
-    syms.iter()
-        .any(|s| s.name == *parent_name && s.symbol_type == "Interface")
+    kg.iter_symbols()
+        .any(|s| s.name == parent_name && s.symbol_type == SymbolType::Interface)
 }
 
 /// Check if a symbol is a method declared in an interface.
 fn is_interface_method(target_id: &str, kg: &KnowledgeGraph) -> bool {
-    let syms = kg.get_symbols();
-    let target = syms.iter().find(|s| s.id == target_id);
-    let parent_name = match target.and_then(|s| s.parent.as_ref()) {
+    let parent_name = match kg.symbol(target_id).and_then(|s| s.parent) {
         Some(p) => p,
         None => return false,
     };
-    syms.iter()
-        .any(|s| s.name == *parent_name && s.symbol_type == "Interface")
+    kg.iter_symbols()
+        .any(|s| s.name == parent_name && s.symbol_type == SymbolType::Interface)
 }
 
 /// Find a concrete implementation of an interface method.
@@ -165,17 +169,15 @@ fn find_implementation(
     file_path: &str,
     kg: &KnowledgeGraph,
 ) -> Option<String> {
-    let syms = kg.get_symbols();
-    let interface_file = syms
-        .iter()
-        .find(|s| s.id == interface_target_id)
-        .map(|s| s.file.clone())
+    let interface_file = kg
+        .symbol(interface_target_id)
+        .map(|s| s.file)
         .unwrap_or_default();
 
     let imported_files = import_map.get(file_path).cloned().unwrap_or_default();
 
     for imported_file in &imported_files {
-        if imported_file == &interface_file {
+        if imported_file == interface_file {
             continue;
         }
         if let Some(target_id) = st.lookup_exact(imported_file, callee_name) {
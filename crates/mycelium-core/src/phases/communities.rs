@@ -373,12 +373,12 @@ fn generate_label(members: &[String], kg: &KnowledgeGraph) -> String {
     let mut names = Vec::new();
     let mut parents = Vec::new();
 
-    for sym in kg.get_symbols() {
-        if member_set.contains(sym.id.as_str()) {
-            file_paths.push(sym.file.clone());
-            names.push(sym.name.clone());
-            if let Some(ref p) = sym.parent {
-                parents.push(p.clone());
+    for sym in kg.iter_symbols() {
+        if member_set.contains(sym.id) {
+            file_paths.push(sym.file);
+            names.push(sym.name);
+            if let Some(p) = sym.parent {
+                parents.push(p);
             }
         }
     }
@@ -386,8 +386,8 @@ fn generate_label(members: &[String], kg: &KnowledgeGraph) -> String {
     // Strategy 1: Most common parent (namespace/class) if >= 30% coverage
     if !parents.is_empty() {
         let mut parent_counts: HashMap<&str, usize> = HashMap::new();
-        for p in &parents {
-            *parent_counts.entry(p.as_str()).or_insert(0) += 1;
+        for &p in &parents {
+            *parent_counts.entry(p).or_insert(0) += 1;
         }
         let (best_parent, count) = parent_counts
             .iter()
@@ -444,12 +444,12 @@ fn disambiguate_label(
     let mut names = Vec::new();
     let mut parents = Vec::new();
 
-    for sym in kg.get_symbols() {
-        if member_set.contains(sym.id.as_str()) {
-            file_paths.push(sym.file.clone());
-            names.push(sym.name.clone());
-            if let Some(ref p) = sym.parent {
-                parents.push(p.clone());
+    for sym in kg.iter_symbols() {
+        if member_set.contains(sym.id) {
+            file_paths.push(sym.file);
+            names.push(sym.name);
+            if let Some(p) = sym.parent {
+                parents.push(p);
             }
         }
     }
@@ -457,8 +457,8 @@ fn disambiguate_label(
     // Try secondary parent
     if !parents.is_empty() {
         let mut parent_counts: HashMap<&str, usize> = HashMap::new();
-        for p in &parents {
-            *parent_counts.entry(p.as_str()).or_insert(0) += 1;
+        for &p in &parents {
+            *parent_counts.entry(p).or_insert(0) += 1;
         }
         let mut sorted: Vec<_> = parent_counts.into_iter().collect();
         sorted.sort_by(|a, b| b.1.cmp(&a.1));
@@ -498,7 +498,7 @@ fn disambiguate_label(
     if !names.is_empty() {
         let mut sorted_names = names.clone();
         sorted_names.sort_by_key(|b| std::cmp::Reverse(b.len()));
-        for name in &sorted_names {
+        for &name in &sorted_names {
             if name != label {
                 let candidate = format!("{label}:{name}");
                 if !used_labels.contains(&candidate) {
@@ -552,12 +552,12 @@ fn compute_cohesion(members: &[String], adj: &AdjList) -> f64 {
 /// Determine the primary language among community members.
 fn primary_language(members: &[String], kg: &KnowledgeGraph) -> String {
     let member_set: HashSet<&str> = members.iter().map(|s| s.as_str()).collect();
-    let mut lang_counts: HashMap<String, usize> = HashMap::new();
+    let mut lang_counts: HashMap<&str, usize> = HashMap::new();
 
-    for sym in kg.get_symbols() {
-        if member_set.contains(sym.id.as_str()) {
-            if let Some(ref lang) = sym.language {
-                *lang_counts.entry(lang.clone()).or_insert(0) += 1;
+    for sym in kg.iter_symbols() {
+        if member_set.contains(sym.id) {
+            if let Some(lang) = sym.language {
+                *lang_counts.entry(lang).or_insert(0) += 1;
             }
         }
     }
@@ -565,18 +565,19 @@ fn primary_language(members: &[String], kg: &KnowledgeGraph) -> String {
     lang_counts
         .into_iter()
         .max_by_key(|&(_, c)| c)
-        .map(|(l, _)| l)
+        .map(|(l, _)| l.to_string())
         .unwrap_or_default()
 }
 
 /// Find common prefix of a list of strings.
-fn common_prefix(strings: &[String]) -> String {
+fn common_prefix<S: AsRef<str>>(strings: &[S]) -> String {
     if strings.is_empty() {
         return String::new();
     }
-    let first = &strings[0];
+    let first = strings[0].as_ref();
     let mut len = first.len();
     for s in &strings[1..] {
+        let s = s.as_ref();
         len = len.min(s.len());
         for (i, (a, b)) in first.bytes().zip(s.bytes()).enumerate() {
             if a != b {
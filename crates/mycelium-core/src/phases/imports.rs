@@ -5,8 +5,7 @@ use std::path::Path;
 
 use crate::config::{AnalysisConfig, ImportEdge, PackageReference, ProjectReference};
 use crate::dotnet::assembly::AssemblyIndex;
-use crate::dotnet::project::parse_project_file;
-use crate::dotnet::solution::parse_solution;
+use crate::dotnet::project::parse_project_path;
 use crate::graph::knowledge_graph::{KnowledgeGraph, NodeData};
 use crate::graph::namespace_index::NamespaceIndex;
 use crate::graph::symbol_table::SymbolTable;
@@ -42,50 +41,36 @@ fn process_dotnet_projects(
 ) {
     let repo_root = &config.repo_path;
 
-    // Collect file paths
-    let files: Vec<(String, Option<String>)> = kg
+    // Collect project files. Solutions are not parsed: the walk already finds
+    // every project they would list, and nothing here uses their structure.
+    let project_files: Vec<String> = kg
         .get_files()
         .into_iter()
-        .filter_map(|n| {
-            if let NodeData::File { path, language, .. } = n {
-                Some((path.clone(), language.clone()))
-            } else {
-                None
+        .filter_map(|n| match n {
+            NodeData::File { path, .. }
+                if path.ends_with(".csproj") || path.ends_with(".vbproj") =>
+            {
+                Some(path.clone())
             }
+            _ => None,
         })
         .collect();
 
-    let mut sln_files = Vec::new();
-    let mut project_files = Vec::new();
-    for (path, _) in &files {
-        if path.ends_with(".sln") {
-            sln_files.push(path.clone());
-        } else if path.ends_with(".csproj") || path.ends_with(".vbproj") {
-            project_files.push(path.clone());
-        }
-    }
-
-    // Parse solutions (for discovery, not currently used beyond logging)
-    for sln_path in &sln_files {
-        let full_path = Path::new(repo_root).join(sln_path);
-        if let Ok(content) = std::fs::read_to_string(&full_path) {
-            let _projects = parse_solution(&content);
-        }
-    }
-
-    // Parse each project file
-    for proj_path in &project_files {
-        let full_path = Path::new(repo_root).join(proj_path);
-        let content = match std::fs::read_to_string(&full_path) {
-            Ok(c) => c,
-            Err(_) => continue,
-        };
-
-        let info = parse_project_file(&content, proj_path);
+    // Parse project files serially: a repo has a handful of small XML files,
+    // and parses are served from the shared project cache
+    let parsed: Vec<_> = project_files
+        .iter()
+        .filter_map(|proj_path| {
+            let full_path = Path::new(repo_root).join(proj_path);
+            parse_project_path(&full_path, proj_path).map(|info| (proj_path.clone(), info))
+        })
+        .collect();
 
-        // Register root namespace
+    let mut root_namespaces = Vec::new();
+    for (proj_path, info) in &parsed {
+        // Collect root namespace for bulk registration
         if let Some(ref root_ns) = info.root_namespace {
-            assembly_index.register(root_ns, proj_path);
+            root_namespaces.push((root_ns.clone(), proj_path.clone()));
         }
 
         // Add project references
@@ -109,6 +94,8 @@ fn process_dotnet_projects(
             });
         }
     }
+
+    assembly_index.register_many(root_namespaces);
 }
 
 fn register_observed_namespaces(kg: &KnowledgeGraph, _assembly_index: &AssemblyIndex) {
@@ -130,7 +117,7 @@ fn process_source_imports(
     ns_index: &mut NamespaceIndex,
 ) {
     let repo_root = &config.repo_path;
-    let registry = AnalyserRegistry::new();
+    let registry = AnalyserRegistry::shared();
 
     // Build file set once for O(1) lookups
     let file_set: HashSet<String> = kg
@@ -168,6 +155,11 @@ fn process_source_imports(
         HashMap::new()
     };
 
+    // Python/Java: dotted module path -> file path, so absolute imports resolve
+    // with a single lookup instead of formatting candidate paths per import
+    let py_module_index = build_dotted_module_index(&file_set, "py");
+    let java_class_index = build_dotted_module_index(&file_set, "java");
+
     // Java: build basename index for class-name fallback resolution
     let mut java_basename_index: HashMap<String, Vec<String>> = HashMap::new();
     for path in &file_set {
@@ -183,6 +175,9 @@ fn process_source_imports(
         }
     }
 
+    // One parser for the whole phase; set_language switches grammars per file
+    let mut parser = tree_sitter::Parser::new();
+
     // Process each file's imports
     for (file_path, language) in &files {
         let lang = match language {
@@ -211,9 +206,11 @@ fn process_source_imports(
         };
 
         // Parse with tree-sitter
-        let mut parser = tree_sitter::Parser::new();
-        let ts_language = analyser.get_language_for_ext(&ext);
-        if parser.set_language(&ts_language).is_err() {
+        let ts_language = match registry.language_for_ext(&ext) {
+            Some(l) => l,
+            None => continue,
+        };
+        if parser.set_language(ts_language).is_err() {
             continue;
         }
         let tree = match parser.parse(&source, None) {
@@ -260,7 +257,8 @@ fn process_source_imports(
 
             // Python: dotted module paths
             if lang == "Python" {
-                if let Some(target) = resolve_python_import(&imp.target_name, file_path, &file_set)
+                if let Some(target) =
+                    resolve_python_import(&imp.target_name, file_path, &file_set, &py_module_index)
                 {
                     if target != *file_path {
                         kg.add_import(&ImportEdge {
@@ -292,7 +290,7 @@ fn process_source_imports(
                 if let Some(target) = resolve_java_import(
                     &imp.target_name,
                     file_path,
-                    &file_set,
+                    &java_class_index,
                     &java_basename_index,
                 ) {
                     if target != *file_path {
@@ -355,6 +353,35 @@ fn process_source_imports(
     }
 }
 
+// ---------------------------------------------------------------------------
+// Dotted module index (Python, Java)
+// ---------------------------------------------------------------------------
+
+/// Build a dotted module name -> file path index for files with extension `ext`.
+///
+/// `app/models/user.py` is keyed as `app.models.user`. For Python, a package's
+/// `__init__.py` is keyed by the package name unless a same-named module file
+/// exists, matching the `{path}.py` then `{path}/__init__.py` probe order.
+/// Paths with extra dots in their stem cannot be reached by a dotted import
+/// and are skipped.
+fn build_dotted_module_index(file_set: &HashSet<String>, ext: &str) -> HashMap<String, String> {
+    let mut index = HashMap::new();
+    for path in file_set {
+        let stem = match path.strip_suffix(ext).and_then(|p| p.strip_suffix('.')) {
+            Some(s) if !s.contains('.') => s,
+            _ => continue,
+        };
+        if let Some(package) = stem.strip_suffix("/__init__") {
+            index
+                .entry(package.replace('/', "."))
+                .or_insert_with(|| path.clone());
+        } else if stem != "__init__" {
+            index.insert(stem.replace('/', "."), path.clone());
+        }
+    }
+    index
+}
+
 // ---------------------------------------------------------------------------
 // Python resolver
 // ---------------------------------------------------------------------------
@@ -363,24 +390,13 @@ fn resolve_python_import(
     target_name: &str,
     source_file: &str,
     file_set: &HashSet<String>,
+    module_index: &HashMap<String, String>,
 ) -> Option<String> {
     if target_name.starts_with('.') {
         return resolve_python_relative(target_name, source_file, file_set);
     }
 
-    let path = target_name.replace('.', "/");
-
-    let candidate = format!("{}.py", path);
-    if file_set.contains(&candidate) {
-        return Some(candidate);
-    }
-
-    let candidate = format!("{}/__init__.py", path);
-    if file_set.contains(&candidate) {
-        return Some(candidate);
-    }
-
-    None
+    module_index.get(target_name).cloned()
 }
 
 fn resolve_python_relative(
@@ -440,6 +456,9 @@ fn resolve_python_relative(
 // TypeScript/JavaScript resolver
 // ---------------------------------------------------------------------------
 
+/// Extensions probed, in order, for extensionless relative TS/JS specifiers.
+const TS_PROBE_EXTENSIONS: &[&str] = &[".ts", ".tsx", ".js", ".jsx"];
+
 fn resolve_ts_import(
     target_name: &str,
     source_file: &str,
@@ -463,19 +482,13 @@ fn resolve_ts_import(
         return Some(resolved);
     }
 
-    // Extension probing
-    for ext in &[".ts", ".tsx", ".js", ".jsx"] {
-        let candidate = format!("{}{}", resolved, ext);
-        if file_set.contains(&candidate) {
-            return Some(candidate);
-        }
-    }
-
-    // Index file probing
-    for ext in &[".ts", ".tsx", ".js", ".jsx"] {
-        let candidate = format!("{}/index{}", resolved, ext);
-        if file_set.contains(&candidate) {
-            return Some(candidate);
+    // Extension probing, then index file probing
+    for suffix in ["", "/index"] {
+        for ext in TS_PROBE_EXTENSIONS {
+            let candidate = format!("{resolved}{suffix}{ext}");
+            if file_set.contains(&candidate) {
+                return Some(candidate);
+            }
         }
     }
 
@@ -489,13 +502,12 @@ fn resolve_ts_import(
 fn resolve_java_import(
     target_name: &str,
     source_file: &str,
-    file_set: &HashSet<String>,
+    class_index: &HashMap<String, String>,
     basename_index: &HashMap<String, Vec<String>>,
 ) -> Option<String> {
     // Primary: path-based resolution
-    let path = format!("{}.java", target_name.replace('.', "/"));
-    if file_set.contains(&path) {
-        return Some(path);
+    if let Some(path) = class_index.get(target_name) {
+        return Some(path.clone());
     }
 
     // Fallback: class-name basename lookup
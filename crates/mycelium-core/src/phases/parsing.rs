@@ -3,7 +3,7 @@
 use std::collections::HashSet;
 use std::path::Path;
 
-use crate::config::AnalysisConfig;
+use crate::config::{AnalysisConfig, SymbolType};
 use crate::graph::knowledge_graph::{KnowledgeGraph, NodeData};
 use crate::graph::namespace_index::NamespaceIndex;
 use crate::graph::symbol_table::SymbolTable;
@@ -16,7 +16,7 @@ pub fn run_parsing_phase(
     st: &mut SymbolTable,
     ns_index: &mut NamespaceIndex,
 ) {
-    let registry = AnalyserRegistry::new();
+    let registry = AnalyserRegistry::shared();
 
     // Collect file paths from the knowledge graph
     let files: Vec<(String, Option<String>)> = kg
@@ -34,6 +34,9 @@ pub fn run_parsing_phase(
     // Track used symbol IDs for deduplication
     let mut used_ids = HashSet::new();
 
+    // One parser for the whole phase; set_language switches grammars per file
+    let mut parser = tree_sitter::Parser::new();
+
     for (file_path, _language) in &files {
         let ext = Path::new(file_path)
             .extension()
@@ -52,9 +55,11 @@ pub fn run_parsing_phase(
         };
 
         // Parse with tree-sitter, using extension-specific language
-        let mut parser = tree_sitter::Parser::new();
-        let language = analyser.get_language_for_ext(&ext);
-        if parser.set_language(&language).is_err() {
+        let language = match registry.language_for_ext(&ext) {
+            Some(l) => l,
+            None => continue,
+        };
+        if parser.set_language(language).is_err() {
             continue;
         }
         let tree = match parser.parse(&source, None) {
@@ -84,12 +89,12 @@ pub fn run_parsing_phase(
             symbol.id = id;
         }
 
+        kg.add_symbols(&symbols);
         for symbol in &symbols {
-            kg.add_symbol(symbol);
             st.add(symbol);
 
             // Register namespaces
-            if symbol.symbol_type.as_str() == "Namespace" {
+            if symbol.symbol_type == SymbolType::Namespace {
                 ns_index.register(&symbol.name, &symbol.file);
             }
         }
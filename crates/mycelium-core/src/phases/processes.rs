@@ -1,9 +1,10 @@
 //! Phase 6: Multi-branch BFS trace detection.
 
 use std::collections::{HashMap, HashSet, VecDeque};
+use std::sync::Arc;
 
 use crate::config::{AnalysisConfig, Process};
-use crate::graph::knowledge_graph::KnowledgeGraph;
+use crate::graph::knowledge_graph::{CallCsr, KnowledgeGraph};
 use crate::graph::scoring::score_entry_points;
 
 /// Run the processes phase: trace execution flows from scored entry points.
@@ -22,11 +23,21 @@ pub fn run_processes_phase(config: &AnalysisConfig, kg: &mut KnowledgeGraph) {
     // Take top N candidates (2x max to allow for deduplication)
     let candidates: Vec<_> = entry_points.into_iter().take(max_processes * 2).collect();
 
-    // BFS from each entry point (multi-branch)
+    // BFS from each entry point (multi-branch), over node indices
+    let adjacency = CallAdjacency::build(kg);
     let mut traces: Vec<Vec<String>> = Vec::new();
     for (entry_id, _score) in &candidates {
-        let new_traces = bfs_traces(kg, entry_id, max_depth, max_branching, min_steps);
-        traces.extend(new_traces);
+        let Some(start) = kg.get_node_index(entry_id) else {
+            continue;
+        };
+        let new_traces = bfs_traces(
+            &adjacency,
+            start.index(),
+            max_depth,
+            max_branching,
+            min_steps,
+        );
+        traces.extend(new_traces.iter().map(|t| adjacency.trace_ids(t)));
     }
 
     // Deduplicate
@@ -36,7 +47,7 @@ pub fn run_processes_phase(config: &AnalysisConfig, kg: &mut KnowledgeGraph) {
     let community_map = build_community_map(kg);
 
     // Compute confidence for each trace
-    let mut process_data: Vec<(Vec<String>, f64)> = traces
+    let process_data: Vec<(Vec<String>, f64)> = traces
         .into_iter()
         .map(|trace| {
             let conf = compute_total_confidence(kg, &trace);
@@ -44,31 +55,15 @@ pub fn run_processes_phase(config: &AnalysisConfig, kg: &mut KnowledgeGraph) {
         })
         .collect();
 
-    // Sort by normalised confidence (geometric mean per hop), tiebreak by length
-    process_data.sort_by(|a, b| {
-        let key_a = sort_key(&a.0, a.1);
-        let key_b = sort_key(&b.0, b.1);
-        key_b
-            .partial_cmp(&key_a)
-            .unwrap_or(std::cmp::Ordering::Equal)
-    });
-
-    // Depth-diverse selection: prioritise multi-step traces
-    let deep: Vec<_> = process_data
-        .iter()
-        .filter(|(t, _)| t.len() > 2)
-        .cloned()
-        .collect();
-    let shallow: Vec<_> = process_data
-        .iter()
-        .filter(|(t, _)| t.len() <= 2)
-        .cloned()
-        .collect();
+    // Depth-diverse selection: prioritise multi-step traces, taking the best
+    // of each bucket by normalised confidence (geometric mean per hop),
+    // tiebreak by length
+    let (deep, shallow): (Vec<_>, Vec<_>) =
+        process_data.into_iter().partition(|(t, _)| t.len() > 2);
     let max_deep = max_processes / 2;
-    let selected_deep: Vec<_> = deep.into_iter().take(max_deep).collect();
-    let remaining = max_processes - selected_deep.len();
-    let mut selected: Vec<_> = selected_deep;
-    selected.extend(shallow.into_iter().take(remaining));
+    let mut selected = top_traces(deep, max_deep);
+    let remaining = max_processes - selected.len();
+    selected.extend(top_traces(shallow, remaining));
 
     // Re-sort by normalised confidence
     selected.sort_by(|a, b| {
@@ -94,6 +89,35 @@ pub fn run_processes_phase(config: &AnalysisConfig, kg: &mut KnowledgeGraph) {
     }
 }
 
+// ---------------------------------------------------------------------------
+// Call adjacency
+// ---------------------------------------------------------------------------
+
+/// Call edges by node index, built once per phase.
+///
+/// Callees are pre-sorted by confidence descending so the BFS never
+/// allocates or sorts per hop, and works on indices rather than string ids.
+struct CallAdjacency<'a> {
+    /// Node index → string ID.
+    ids: &'a [Arc<str>],
+    /// Call edges with each node's callees ordered highest confidence first.
+    calls: CallCsr,
+}
+
+impl<'a> CallAdjacency<'a> {
+    fn build(kg: &'a KnowledgeGraph) -> Self {
+        Self {
+            ids: kg.node_ids(),
+            calls: kg.call_csr().sorted_by_confidence(),
+        }
+    }
+
+    /// Translate a trace of node indices back to string IDs.
+    fn trace_ids(&self, trace: &[usize]) -> Vec<String> {
+        trace.iter().map(|&i| self.ids[i].to_string()).collect()
+    }
+}
+
 // ---------------------------------------------------------------------------
 // BFS trace collection
 // ---------------------------------------------------------------------------
@@ -104,50 +128,43 @@ pub fn run_processes_phase(config: &AnalysisConfig, kg: &mut KnowledgeGraph) {
 /// branch of callees. Per-path cycle detection allows two paths to visit
 /// the same node.
 fn bfs_traces(
-    kg: &KnowledgeGraph,
-    start: &str,
+    adjacency: &CallAdjacency,
+    start: usize,
     max_depth: usize,
     max_branching: usize,
     min_steps: usize,
-) -> Vec<Vec<String>> {
-    let mut traces: Vec<Vec<String>> = Vec::new();
+) -> Vec<Vec<usize>> {
+    let mut traces: Vec<Vec<usize>> = Vec::new();
     let max_traces = max_branching * 3;
-    let mut queue: VecDeque<(String, Vec<String>)> = VecDeque::new();
-    queue.push_back((start.to_string(), vec![start.to_string()]));
-
-    while let Some((current, path)) = queue.pop_front() {
-        if traces.len() >= max_traces {
-            break;
-        }
+    if max_traces == 0 {
+        return traces;
+    }
+    let mut queue: VecDeque<Vec<usize>> = VecDeque::new();
+    queue.push_back(vec![start]);
 
-        let callees = kg.get_callees(&current);
-        if callees.is_empty() || path.len() >= max_depth {
-            if path.len() >= min_steps {
-                traces.push(path);
-            }
-            continue;
-        }
-
-        // Sort by confidence descending
-        let mut sorted_callees = callees;
-        sorted_callees.sort_by(|a, b| {
-            b.confidence
-                .partial_cmp(&a.confidence)
-                .unwrap_or(std::cmp::Ordering::Equal)
-        });
+    while let Some(path) = queue.pop_front() {
+        let current = path[path.len() - 1];
+        let callees = adjacency.calls.callees(current);
 
         let mut extended = false;
-        for callee in sorted_callees.iter().take(max_branching) {
-            if !path.contains(&callee.id) {
-                let mut new_path = path.clone();
-                new_path.push(callee.id.clone());
-                queue.push_back((callee.id.clone(), new_path));
-                extended = true;
+        if !callees.is_empty() && path.len() < max_depth {
+            for &callee in callees.iter().take(max_branching) {
+                if !path.contains(&callee) {
+                    let mut new_path = Vec::with_capacity(path.len() + 1);
+                    new_path.extend_from_slice(&path);
+                    new_path.push(callee);
+                    queue.push_back(new_path);
+                    extended = true;
+                }
             }
         }
 
         if !extended && path.len() >= min_steps {
             traces.push(path);
+            // Bail as soon as the cap is hit rather than draining the queue
+            if traces.len() >= max_traces {
+                break;
+            }
         }
     }
 
@@ -159,22 +176,44 @@ fn bfs_traces(
 // ---------------------------------------------------------------------------
 
 /// Remove traces that are strict subsequences of longer traces.
+///
+/// Each trace's member set is built once, and kept traces are indexed by
+/// member so a trace is only compared against kept traces sharing its entry.
 fn deduplicate(mut traces: Vec<Vec<String>>) -> Vec<Vec<String>> {
     traces.sort_by_key(|b| std::cmp::Reverse(b.len()));
 
-    let mut result: Vec<Vec<String>> = Vec::new();
-    for trace in traces {
-        let trace_set: HashSet<&str> = trace.iter().map(|s| s.as_str()).collect();
-        let is_subset = result.iter().any(|existing| {
-            let existing_set: HashSet<&str> = existing.iter().map(|s| s.as_str()).collect();
-            trace_set.is_subset(&existing_set) && trace_set != existing_set
-        });
-        if !is_subset {
-            result.push(trace);
+    let keep: Vec<bool> = {
+        let sets: Vec<HashSet<&str>> = traces
+            .iter()
+            .map(|t| t.iter().map(|s| s.as_str()).collect())
+            .collect();
+        let mut kept_by_member: HashMap<&str, Vec<usize>> = HashMap::new();
+        let mut keep = vec![false; traces.len()];
+
+        for (i, trace_set) in sets.iter().enumerate() {
+            let is_subset = traces[i]
+                .first()
+                .and_then(|anchor| kept_by_member.get(anchor.as_str()))
+                .is_some_and(|candidates| {
+                    candidates
+                        .iter()
+                        .any(|&j| trace_set.len() < sets[j].len() && trace_set.is_subset(&sets[j]))
+                });
+            if !is_subset {
+                keep[i] = true;
+                for &member in trace_set {
+                    kept_by_member.entry(member).or_default().push(i);
+                }
+            }
         }
-    }
+        keep
+    };
 
-    result
+    traces
+        .into_iter()
+        .zip(keep)
+        .filter_map(|(trace, kept)| kept.then_some(trace))
+        .collect()
 }
 
 // ---------------------------------------------------------------------------
@@ -212,13 +251,16 @@ fn compute_total_confidence(kg: &KnowledgeGraph, trace: &[String]) -> f64 {
         return 1.0;
     }
 
+    let calls = kg.call_csr();
+    let index = |id: &str| kg.get_node_index(id).map(|idx| idx.index());
     let mut total = 1.0;
-    for i in 0..trace.len() - 1 {
-        let callees = kg.get_callees(&trace[i]);
-        let edge_conf = callees
-            .iter()
-            .find(|c| c.id == trace[i + 1])
-            .map(|c| c.confidence)
+    for hop in trace.windows(2) {
+        let edge_conf = index(&hop[0])
+            .zip(index(&hop[1]))
+            .and_then(|(from, to)| {
+                let k = calls.callees(from).iter().position(|&c| c == to)?;
+                Some(calls.confidences(from)[k])
+            })
             .unwrap_or(0.5);
         total *= edge_conf;
     }
@@ -226,6 +268,36 @@ fn compute_total_confidence(kg: &KnowledgeGraph, trace: &[String]) -> f64 {
     total
 }
 
+/// The `k` best traces by `sort_key`, best first.
+///
+/// Uses a partial selection instead of sorting every trace; ties keep their
+/// input order, exactly as a stable sort followed by a truncate would.
+fn top_traces(traces: Vec<(Vec<String>, f64)>, k: usize) -> Vec<(Vec<String>, f64)> {
+    if k == 0 {
+        return Vec::new();
+    }
+    let mut ranked: Vec<_> = traces
+        .into_iter()
+        .enumerate()
+        .map(|(i, (trace, conf))| (sort_key(&trace, conf), i, trace, conf))
+        .collect();
+    let order = |a: &((f64, usize), usize, Vec<String>, f64),
+                 b: &((f64, usize), usize, Vec<String>, f64)| {
+        b.0.partial_cmp(&a.0)
+            .unwrap_or(std::cmp::Ordering::Equal)
+            .then(a.1.cmp(&b.1))
+    };
+    if ranked.len() > k {
+        ranked.select_nth_unstable_by(k - 1, order);
+        ranked.truncate(k);
+    }
+    ranked.sort_unstable_by(order);
+    ranked
+        .into_iter()
+        .map(|(_, _, trace, conf)| (trace, conf))
+        .collect()
+}
+
 /// Sort key: (normalised_confidence, trace_length).
 fn sort_key(trace: &[String], total_conf: f64) -> (f64, usize) {
     let n_edges = trace.len().saturating_sub(1);
@@ -235,3 +307,61 @@ fn sort_key(trace: &[String], total_conf: f64) -> (f64, usize) {
     let normalised = total_conf.powf(1.0 / n_edges as f64);
     (normalised, trace.len())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::config::{CallEdge, Symbol, SymbolType, Visibility};
+
+    fn add_method(kg: &mut KnowledgeGraph, id: &str) {
+        kg.add_symbol(&Symbol {
+            id: id.to_string(),
+            name: id.to_string(),
+            symbol_type: SymbolType::Method,
+            file: "src/app.cs".to_string(),
+            line: 1,
+            visibility: Visibility::Public,
+            exported: true,
+            parent: None,
+            language: None,
+            byte_range: None,
+            parameter_types: None,
+        });
+    }
+
+    fn add_call(kg: &mut KnowledgeGraph, from: &str, to: &str) {
+        kg.add_call(&CallEdge {
+            from_symbol: from.to_string(),
+            to_symbol: to.to_string(),
+            confidence: 0.85,
+            tier: "A".to_string(),
+            reason: "import".to_string(),
+            line: 1,
+        });
+    }
+
+    #[test]
+    fn bfs_stops_at_trace_cap() {
+        // root -> 10 mids, each mid -> 10 leaves: 100 candidate traces
+        let mut kg = KnowledgeGraph::new();
+        add_method(&mut kg, "root");
+        for m in 0..10 {
+            let mid = format!("mid{m}");
+            add_method(&mut kg, &mid);
+            add_call(&mut kg, "root", &mid);
+            for l in 0..10 {
+                let leaf = format!("leaf{m}_{l}");
+                add_method(&mut kg, &leaf);
+                add_call(&mut kg, &mid, &leaf);
+            }
+        }
+        let adjacency = CallAdjacency::build(&kg);
+        let root = kg.get_node_index("root").unwrap().index();
+
+        let traces = bfs_traces(&adjacency, root, 10, 4, 2);
+        assert_eq!(traces.len(), 12);
+        assert!(traces.iter().all(|t| t.len() == 3));
+
+        assert!(bfs_traces(&adjacency, root, 10, 0, 2).is_empty());
+    }
+}
@@ -1,9 +1,12 @@
 //! Phase 1: Walk file tree, build FileNode/FolderNode graph.
 
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
+use std::fs::File;
+use std::io::Read;
 use std::path::Path;
 
-use walkdir::WalkDir;
+use rayon::prelude::*;
+use walkdir::{DirEntry, WalkDir};
 
 use crate::config::{AnalysisConfig, FileNode, FolderNode};
 use crate::graph::knowledge_graph::KnowledgeGraph;
@@ -37,10 +40,12 @@ const DEFAULT_EXCLUDES: &[&str] = &[
 /// Run the structure phase: walk the file tree and populate the graph.
 pub fn run_structure_phase(config: &AnalysisConfig, kg: &mut KnowledgeGraph) {
     let repo_path = Path::new(&config.repo_path);
-    let registry = AnalyserRegistry::new();
+    let registry = AnalyserRegistry::shared();
     let mut folder_file_counts: HashMap<String, usize> = HashMap::new();
+    let mut candidates: Vec<(DirEntry, String, Option<String>)> = Vec::new();
 
-    let exclude_patterns: Vec<&str> = DEFAULT_EXCLUDES
+    // Hashed so each directory entry is checked in O(1) rather than per pattern
+    let exclude_patterns: HashSet<&str> = DEFAULT_EXCLUDES
         .iter()
         .copied()
         .chain(config.exclude_patterns.iter().map(|s| s.as_str()))
@@ -52,7 +57,7 @@ pub fn run_structure_phase(config: &AnalysisConfig, kg: &mut KnowledgeGraph) {
         .filter_entry(|e| {
             let name = e.file_name().to_string_lossy();
             // Skip explicitly excluded names
-            if exclude_patterns.iter().any(|p| name == *p) {
+            if exclude_patterns.contains(name.as_ref()) {
                 return false;
             }
             // Skip hidden directories (starting with .) like Python does,
@@ -85,10 +90,10 @@ pub fn run_structure_phase(config: &AnalysisConfig, kg: &mut KnowledgeGraph) {
         } else if entry.file_type().is_file() {
             let ext = abs_path
                 .extension()
-                .map(|e| e.to_string_lossy().to_string())
+                .and_then(|e| e.to_str())
                 .unwrap_or_default();
 
-            let language = registry.language_for_extension(&ext).map(String::from);
+            let language = registry.language_for_extension(ext).map(String::from);
 
             // Apply language filter if specified
             if let Some(ref lang_filter) = config.languages {
@@ -101,34 +106,37 @@ pub fn run_structure_phase(config: &AnalysisConfig, kg: &mut KnowledgeGraph) {
                 }
             }
 
-            // Skip files over size limit
-            let size = entry.metadata().map(|m| m.len()).unwrap_or(0);
-            if size > config.max_file_size {
-                continue;
-            }
+            candidates.push((entry, rel_path, language));
+        }
+    }
 
-            // Count lines
-            let lines = if language.is_some() {
-                std::fs::read_to_string(abs_path)
-                    .map(|content| content.lines().count())
-                    .unwrap_or(0)
-            } else {
-                0
-            };
-
-            kg.add_file(&FileNode {
-                path: rel_path.clone(),
-                language,
-                size,
-                lines,
-            });
-
-            // Increment parent folder counts
-            if let Some(parent) = Path::new(&rel_path).parent() {
-                let parent_str = parent.to_string_lossy().replace('\\', "/");
-                if !parent_str.is_empty() {
-                    *folder_file_counts.entry(parent_str).or_insert(0) += 1;
-                }
+    // Stat and line-count files in parallel; collect keeps the walk order
+    let measure = |(entry, path, language): (DirEntry, String, Option<String>)| {
+        // Size (and lines, for source files) with one stat per file
+        let (size, lines) = if language.is_some() {
+            source_size_and_lines(entry.path(), config.max_file_size)
+        } else {
+            (entry.metadata().map(|m| m.len()).unwrap_or(0), 0)
+        };
+
+        // Skip files over size limit
+        (size <= config.max_file_size).then_some(FileNode {
+            path,
+            language,
+            size,
+            lines,
+        })
+    };
+    let file_nodes: Vec<FileNode> = candidates.into_par_iter().filter_map(measure).collect();
+
+    for file_node in &file_nodes {
+        kg.add_file(file_node);
+
+        // Increment parent folder counts
+        if let Some(parent) = Path::new(&file_node.path).parent() {
+            let parent_str = parent.to_string_lossy().replace('\\', "/");
+            if !parent_str.is_empty() {
+                *folder_file_counts.entry(parent_str).or_insert(0) += 1;
             }
         }
     }
@@ -138,3 +146,50 @@ pub fn run_structure_phase(config: &AnalysisConfig, kg: &mut KnowledgeGraph) {
         kg.add_folder(&FolderNode { path, file_count });
     }
 }
+
+/// Size and line count of a source file from a single open.
+///
+/// The size comes from the open handle's metadata, so the file is not
+/// stat'ed separately, and the contents are only read when within `max_size`.
+fn source_size_and_lines(path: &Path, max_size: u64) -> (u64, usize) {
+    let Ok(mut file) = File::open(path) else {
+        let size = std::fs::symlink_metadata(path).map(|m| m.len());
+        return (size.unwrap_or(0), 0);
+    };
+    let size = file.metadata().map(|m| m.len()).unwrap_or(0);
+    if size > max_size {
+        return (size, 0);
+    }
+    let mut bytes = Vec::with_capacity(size as usize);
+    let lines = file
+        .read_to_end(&mut bytes)
+        .map(|_| count_lines(&bytes))
+        .unwrap_or(0);
+    (size, lines)
+}
+
+/// Count lines the way `str::lines` does, scanning raw bytes for `\n`
+/// without UTF-8 validation or per-line slicing.
+fn count_lines(bytes: &[u8]) -> usize {
+    let newlines = bytes.iter().filter(|&&b| b == b'\n').count();
+    match bytes.last() {
+        Some(&b'\n') | None => newlines,
+        Some(_) => newlines + 1,
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn count_lines_matches_str_lines() {
+        for text in ["", "a", "a\n", "a\nb", "a\r\nb\r\n", "\n\n", "a\n\nb\n"] {
+            assert_eq!(
+                count_lines(text.as_bytes()),
+                text.lines().count(),
+                "{text:?}"
+            );
+        }
+    }
+}
@@ -1,10 +1,16 @@
 //! Shared test helpers for integration tests.
 
-use std::collections::HashSet;
+use std::cell::RefCell;
+use std::collections::{HashMap, HashSet};
+use std::hash::Hash;
+use std::ops::Deref;
 use std::path::{Path, PathBuf};
+use std::sync::{Arc, LazyLock, Mutex, OnceLock};
 
-use mycelium_core::config::AnalysisConfig;
-use mycelium_core::graph::knowledge_graph::KnowledgeGraph;
+use mycelium_core::config::{
+    AnalysisConfig, AnalysisResult, ImportStatement, RawCall, Symbol, SymbolType,
+};
+use mycelium_core::graph::knowledge_graph::{KnowledgeGraph, SymbolInfo};
 use mycelium_core::graph::namespace_index::NamespaceIndex;
 use mycelium_core::graph::symbol_table::SymbolTable;
 use mycelium_core::languages::{AnalyserRegistry, LanguageAnalyser};
@@ -13,20 +19,32 @@ use mycelium_core::languages::{AnalyserRegistry, LanguageAnalyser};
 // Fixture path resolution
 // ---------------------------------------------------------------------------
 
+/// `tests/fixtures`, resolved and canonicalized once per test binary.
+static FIXTURES_DIR: LazyLock<PathBuf> = LazyLock::new(|| {
+    let dir = Path::new(env!("CARGO_MANIFEST_DIR")).join("../../tests/fixtures");
+    dir.canonicalize().unwrap_or(dir)
+});
+
 /// Resolve `tests/fixtures/{name}` relative to the workspace root.
 pub fn fixture_path(name: &str) -> PathBuf {
-    let manifest_dir = env!("CARGO_MANIFEST_DIR");
-    Path::new(manifest_dir)
-        .join("../../tests/fixtures")
-        .join(name)
-        .canonicalize()
-        .unwrap_or_else(|_| {
-            Path::new(manifest_dir)
-                .join("../../tests/fixtures")
-                .join(name)
-        })
+    FIXTURES_DIR.join(name)
 }
 
+// Fixture directory names under `tests/fixtures`.
+pub const C_SIMPLE: &str = "c_simple";
+pub const CPP_SIMPLE: &str = "cpp_simple";
+pub const CSHARP_SIMPLE: &str = "csharp_simple";
+pub const GO_PACKAGE: &str = "go_package";
+pub const GO_SIMPLE: &str = "go_simple";
+pub const JAVA_PACKAGE: &str = "java_package";
+pub const JAVA_SIMPLE: &str = "java_simple";
+pub const MIXED_DOTNET: &str = "mixed_dotnet";
+pub const PYTHON_PACKAGE: &str = "python_package";
+pub const PYTHON_SIMPLE: &str = "python_simple";
+pub const RUST_SIMPLE: &str = "rust_simple";
+pub const TYPESCRIPT_SIMPLE: &str = "typescript_simple";
+pub const VBNET_SIMPLE: &str = "vbnet_simple";
+
 // ---------------------------------------------------------------------------
 // Phase runners
 // ---------------------------------------------------------------------------
@@ -36,15 +54,117 @@ pub struct PhaseResult {
     pub st: SymbolTable,
     pub ns_index: NamespaceIndex,
     pub config: AnalysisConfig,
+    views: GraphViews,
+}
+
+/// Read-only views of a [`PhaseResult`], each built from the graph on first
+/// use, so they are only read once the phases have run.
+#[derive(Default)]
+struct GraphViews {
+    names_by_type: OnceLock<NamesByType>,
+    symbols: OnceLock<GraphSymbols>,
+    files: OnceLock<StructureFiles>,
+    processes: OnceLock<Vec<ProcessRow>>,
+}
+
+/// Symbol names grouped by type. Types with no symbols have no entry.
+pub type NamesByType = HashMap<SymbolType, HashSet<String>>;
+
+/// Process rows as returned by `KnowledgeGraph::get_processes`.
+pub type ProcessRow = (String, String, String, Vec<String>, String, f64);
+
+/// Symbols of a graph, copied out and indexed by name.
+pub struct GraphSymbols {
+    pub all: Vec<SymbolInfo>,
+    by_name: HashMap<String, usize>,
+}
+
+impl GraphSymbols {
+    /// The first symbol declared with `name`, if any.
+    pub fn find(&self, name: &str) -> Option<&SymbolInfo> {
+        self.by_name.get(name).map(|&i| &self.all[i])
+    }
+
+    pub fn iter(&self) -> std::slice::Iter<'_, SymbolInfo> {
+        self.all.iter()
+    }
+}
+
+/// File and folder paths of a graph, indexed for lookups.
+pub struct StructureFiles {
+    pub paths: HashSet<String>,
+    /// Extension (without the dot) → paths with that extension.
+    pub by_ext: HashMap<String, Vec<String>>,
+    pub languages: HashSet<String>,
+    pub folders: HashSet<String>,
+}
+
+impl PhaseResult {
+    /// Symbol names grouped by type.
+    pub fn names_by_type(&self) -> &NamesByType {
+        self.views.names_by_type.get_or_init(|| {
+            let mut names = NamesByType::new();
+            for sym in self.kg.iter_symbols() {
+                names
+                    .entry(sym.symbol_type)
+                    .or_default()
+                    .insert(sym.name.to_string());
+            }
+            names
+        })
+    }
+
+    /// The graph's symbols, indexed by name.
+    pub fn symbols(&self) -> &GraphSymbols {
+        self.views.symbols.get_or_init(|| {
+            let all = self.kg.get_symbols();
+            let mut by_name = HashMap::new();
+            for (i, sym) in all.iter().enumerate() {
+                by_name.entry(sym.name.clone()).or_insert(i);
+            }
+            GraphSymbols { all, by_name }
+        })
+    }
+
+    /// The graph's files and folders, indexed by extension and language.
+    pub fn files(&self) -> &StructureFiles {
+        self.views.files.get_or_init(|| {
+            let paths: HashSet<String> = file_paths(&self.kg).into_iter().collect();
+            let mut by_ext: HashMap<String, Vec<String>> = HashMap::new();
+            for path in &paths {
+                if let Some(ext) = Path::new(path).extension() {
+                    by_ext
+                        .entry(ext.to_string_lossy().to_string())
+                        .or_default()
+                        .push(path.clone());
+                }
+            }
+            StructureFiles {
+                paths,
+                by_ext,
+                languages: file_languages(&self.kg),
+                folders: folder_paths(&self.kg).into_iter().collect(),
+            }
+        })
+    }
+
+    /// The processes detected in the graph.
+    pub fn processes(&self) -> &[ProcessRow] {
+        self.views.processes.get_or_init(|| self.kg.get_processes())
+    }
+}
+
+/// Default analysis config rooted at a fixture directory.
+pub fn fixture_config(fixture_name: &str) -> AnalysisConfig {
+    AnalysisConfig {
+        repo_path: fixture_path(fixture_name).to_string_lossy().to_string(),
+        ..Default::default()
+    }
 }
 
 /// Run Phase 1 (structure) on a fixture directory.
 pub fn run_structure(fixture_name: &str) -> PhaseResult {
-    let path = fixture_path(fixture_name);
-    let config = AnalysisConfig {
-        repo_path: path.to_string_lossy().to_string(),
-        ..Default::default()
-    };
+    let config = fixture_config(fixture_name);
     let mut kg = KnowledgeGraph::new();
     mycelium_core::phases::structure::run_structure_phase(&config, &mut kg);
     PhaseResult {
@@ -52,6 +172,7 @@ pub fn run_structure(fixture_name: &str) -> PhaseResult {
         st: SymbolTable::new(),
         ns_index: NamespaceIndex::new(),
         config,
+        views: GraphViews::default(),
     }
 }
 
@@ -94,13 +215,105 @@ pub fn run_all_phases(fixture_name: &str) -> PhaseResult {
     r
 }
 
+/// Run the full pipeline on a fixture directory.
+pub fn run_pipeline(fixture_name: &str) -> AnalysisResult {
+    mycelium_core::pipeline::run_pipeline(&fixture_config(fixture_name), None).unwrap()
+}
+
+// ---------------------------------------------------------------------------
+// Shared phase results
+// ---------------------------------------------------------------------------
+
+/// How far through the phases a shared result was run.
+#[derive(Clone, Copy, PartialEq, Eq, Hash)]
+enum Phases {
+    Structure,
+    Two,
+    Four,
+    All,
+}
+
+/// One cell per key, filled by the first test that asks for it.
+type SharedCell<T> = Arc<OnceLock<Arc<T>>>;
+
+static PHASE_RESULTS: LazyLock<Mutex<HashMap<(Phases, String), SharedCell<PhaseResult>>>> =
+    LazyLock::new(|| Mutex::new(HashMap::new()));
+
+static PIPELINE_RESULTS: LazyLock<Mutex<HashMap<String, SharedCell<AnalysisResult>>>> =
+    LazyLock::new(|| Mutex::new(HashMap::new()));
+
+/// Compute `init` at most once per key per test binary and share the result.
+fn shared<K: Eq + Hash, T>(
+    cache: &Mutex<HashMap<K, SharedCell<T>>>,
+    key: K,
+    init: impl FnOnce() -> T,
+) -> Arc<T> {
+    let cell = Arc::clone(cache.lock().unwrap().entry(key).or_default());
+    Arc::clone(cell.get_or_init(|| Arc::new(init())))
+}
+
+fn shared_phases(phases: Phases, fixture_name: &str) -> Arc<PhaseResult> {
+    shared(
+        &PHASE_RESULTS,
+        (phases, fixture_name.to_string()),
+        || match phases {
+            Phases::Structure => run_structure(fixture_name),
+            Phases::Two => run_two_phases(fixture_name),
+            Phases::Four => run_four_phases(fixture_name),
+            Phases::All => run_all_phases(fixture_name),
+        },
+    )
+}
+
+/// Run Phase 1 on a fixture directory at most once per test binary, for
+/// tests that only read the result.
+pub fn shared_structure(fixture_name: &str) -> Arc<PhaseResult> {
+    shared_phases(Phases::Structure, fixture_name)
+}
+
+/// Run Phases 1-2 on a fixture directory at most once per test binary, for
+/// tests that only read the result.
+pub fn shared_two_phases(fixture_name: &str) -> Arc<PhaseResult> {
+    shared_phases(Phases::Two, fixture_name)
+}
+
+/// Run Phases 1-4 on a fixture directory at most once per test binary, for
+/// tests that only read the result.
+pub fn shared_four_phases(fixture_name: &str) -> Arc<PhaseResult> {
+    shared_phases(Phases::Four, fixture_name)
+}
+
+/// Run all 6 phases on a fixture directory at most once per test binary, for
+/// tests that only read the result.
+pub fn shared_all_phases(fixture_name: &str) -> Arc<PhaseResult> {
+    shared_phases(Phases::All, fixture_name)
+}
+
+/// Run the full pipeline on a fixture directory at most once per test binary,
+/// for tests that only read the result.
+pub fn shared_pipeline(fixture_name: &str) -> Arc<AnalysisResult> {
+    shared(&PIPELINE_RESULTS, fixture_name.to_string(), || {
+        run_pipeline(fixture_name)
+    })
+}
+
 // ---------------------------------------------------------------------------
 // Extractors from KnowledgeGraph
 // ---------------------------------------------------------------------------
 
 /// Extract all symbol names from the knowledge graph.
 pub fn symbol_names(kg: &KnowledgeGraph) -> Vec<String> {
-    kg.get_symbols().into_iter().map(|s| s.name).collect()
+    kg.iter_symbols().map(|s| s.name.to_string()).collect()
+}
+
+/// Whether the graph has a symbol named `name`, stopping at the first match.
+pub fn has_symbol(kg: &KnowledgeGraph, name: &str) -> bool {
+    kg.iter_symbols().any(|s| s.name == name)
+}
+
+/// Whether any symbol name contains `fragment`, stopping at the first match.
+pub fn has_symbol_containing(kg: &KnowledgeGraph, fragment: &str) -> bool {
+    kg.iter_symbols().any(|s| s.name.contains(fragment))
 }
 
 /// Extract symbol names in a specific file.
@@ -113,9 +326,10 @@ pub fn symbol_names_in_file(kg: &KnowledgeGraph, file_path: &str) -> Vec<String>
 
 /// Extract import edge pairs (from_file, to_file).
 pub fn import_targets(kg: &KnowledgeGraph) -> Vec<(String, String)> {
-    kg.get_import_edges()
-        .into_iter()
-        .map(|(from, to, _)| (from, to))
+    let (from, to) = kg.get_import_edges_raw();
+    from.iter()
+        .zip(to)
+        .map(|(from, to)| (from.to_string(), to.to_string()))
         .collect()
 }
 
@@ -185,83 +399,267 @@ pub fn file_languages(kg: &KnowledgeGraph) -> HashSet<String> {
 // Single-file parsers (for language analyser tests)
 // ---------------------------------------------------------------------------
 
-/// Parse a single file and return extracted symbols.
-pub fn parse_file_symbols(
-    fixture_name: &str,
-    file_name: &str,
-) -> Vec<mycelium_core::config::Symbol> {
-    let path = fixture_path(fixture_name).join(file_name);
-    let source = std::fs::read(&path).expect("Failed to read fixture file");
-    let ext = Path::new(file_name)
-        .extension()
-        .map(|e| e.to_string_lossy().to_string())
-        .unwrap_or_default();
+/// The shared analyser registry, the same one the pipeline phases use.
+pub fn registry() -> &'static AnalyserRegistry {
+    AnalyserRegistry::shared()
+}
+
+/// The shared analyser for a file extension.
+pub fn analyser(ext: &str) -> &'static dyn LanguageAnalyser {
+    registry()
+        .get_by_extension(ext)
+        .expect("No analyser for extension")
+}
 
-    let registry = AnalyserRegistry::new();
-    let analyser = registry
-        .get_by_extension(&ext)
-        .expect("No analyser for extension");
+/// Everything an analyser extracts from one parsed fixture file.
+#[derive(Debug, Default)]
+pub struct FileAnalysis {
+    pub symbols: Vec<Symbol>,
+    pub imports: Vec<ImportStatement>,
+    pub calls: Vec<RawCall>,
+}
 
-    let mut parser = tree_sitter::Parser::new();
-    let language = analyser.get_language_for_ext(&ext);
-    parser
-        .set_language(&language)
-        .expect("Failed to set language");
-    let tree = parser.parse(&source, None).expect("Failed to parse");
+/// Run all three extractors of `analyser` over one parsed tree.
+fn extract_all(
+    analyser: &dyn LanguageAnalyser,
+    tree: &tree_sitter::Tree,
+    source: &[u8],
+    file_path: &str,
+) -> FileAnalysis {
+    FileAnalysis {
+        symbols: analyser.extract_symbols(tree, source, file_path),
+        imports: analyser.extract_imports(tree, source, file_path),
+        calls: analyser.extract_calls(tree, source, file_path),
+    }
+}
 
-    analyser.extract_symbols(&tree, &source, file_name)
+/// A fixture file read, parsed and extracted once, then shared by every test
+/// in the binary. Only the extraction is kept; the syntax tree is dropped.
+pub struct ParsedFixture {
+    pub file_name: String,
+    pub ext: String,
+    pub source: Arc<[u8]>,
+    analysis: FileAnalysis,
+    symbol_index: OnceLock<Arc<SymbolIndex>>,
+    call_names: OnceLock<Arc<HashSet<String>>>,
+    import_targets: OnceLock<Arc<HashSet<String>>>,
 }
 
-/// Parse a single file and return extracted imports.
-pub fn parse_file_imports(
-    fixture_name: &str,
-    file_name: &str,
-) -> Vec<mycelium_core::config::ImportStatement> {
+impl ParsedFixture {
+    /// Symbols, imports and calls extracted from this fixture.
+    pub fn analysis(&self) -> &FileAnalysis {
+        &self.analysis
+    }
+
+    /// Re-parse the fixture on demand. No test needs the syntax tree today; this
+    /// is kept on purpose so the rare one that does can get it without the
+    /// cache holding every tree for the whole run.
+    pub fn tree(&self) -> tree_sitter::Tree {
+        parse_source(&self.ext, &self.source)
+    }
+
+    /// Symbol names grouped by type, built once from `analysis()`.
+    pub fn symbol_index(&self) -> Arc<SymbolIndex> {
+        Arc::clone(
+            self.symbol_index
+                .get_or_init(|| Arc::new(SymbolIndex::new(&self.analysis().symbols))),
+        )
+    }
+
+    /// Distinct callee names, built once from `analysis()`.
+    pub fn call_names(&self) -> Arc<HashSet<String>> {
+        Arc::clone(self.call_names.get_or_init(|| {
+            Arc::new(
+                self.analysis()
+                    .calls
+                    .iter()
+                    .map(|c| c.callee_name.clone())
+                    .collect(),
+            )
+        }))
+    }
+
+    /// Distinct import target names, built once from `analysis()`.
+    pub fn import_targets(&self) -> Arc<HashSet<String>> {
+        Arc::clone(self.import_targets.get_or_init(|| {
+            Arc::new(
+                self.analysis()
+                    .imports
+                    .iter()
+                    .map(|i| i.target_name.clone())
+                    .collect(),
+            )
+        }))
+    }
+}
+
+/// Symbols of one file, indexed by type and by name for constant-time assertions.
+#[derive(Default)]
+pub struct SymbolIndex {
+    pub by_type: HashMap<SymbolType, HashSet<String>>,
+    pub by_name: HashMap<String, Symbol>,
+    pub all: HashSet<String>,
+}
+
+impl SymbolIndex {
+    pub fn new(symbols: &[Symbol]) -> Self {
+        let mut index = Self::default();
+        for sym in symbols {
+            index
+                .by_type
+                .entry(sym.symbol_type)
+                .or_default()
+                .insert(sym.name.clone());
+            index.all.insert(sym.name.clone());
+            // Keep the first declaration, matching `iter().find()` on the list.
+            index
+                .by_name
+                .entry(sym.name.clone())
+                .or_insert_with(|| sym.clone());
+        }
+        index
+    }
+
+    /// Names of all symbols of `symbol_type` (empty if there are none).
+    pub fn names(&self, symbol_type: SymbolType) -> &HashSet<String> {
+        static EMPTY: LazyLock<HashSet<String>> = LazyLock::new(HashSet::new);
+        self.by_type.get(&symbol_type).unwrap_or(&EMPTY)
+    }
+
+    /// Whether any symbol is declared with `name`.
+    pub fn contains(&self, name: &str) -> bool {
+        self.all.contains(name)
+    }
+
+    /// The first symbol declared with `name`, if any.
+    pub fn find(&self, name: &str) -> Option<&Symbol> {
+        self.by_name.get(name)
+    }
+}
+
+thread_local! {
+    /// One tree-sitter parser per test thread, re-targeted per fixture language.
+    static PARSER: RefCell<tree_sitter::Parser> = RefCell::new(tree_sitter::Parser::new());
+}
+
+/// One cell per fixture: the map lock is held only to find the cell, so test
+/// threads parse different fixtures concurrently while threads racing for the
+/// same fixture wait on its cell instead of parsing it again.
+type FixtureCell = Arc<OnceLock<Arc<ParsedFixture>>>;
+
+static PARSED_FIXTURES: LazyLock<Mutex<HashMap<PathBuf, FixtureCell>>> =
+    LazyLock::new(|| Mutex::new(HashMap::new()));
+
+/// Parse `source` with the grammar for `ext` on this thread's parser.
+fn parse_source(ext: &str, source: &[u8]) -> tree_sitter::Tree {
+    let language = registry()
+        .language_for_ext(ext)
+        .expect("No language for extension");
+    PARSER.with_borrow_mut(|parser| {
+        parser
+            .set_language(language)
+            .expect("Failed to set language");
+        parser.parse(source, None).expect("Failed to parse")
+    })
+}
+
+/// Parse and extract `tests/fixtures/{fixture_name}/{file_name}`, at most once per
+/// test binary.
+///
+/// The tree is dropped once extraction is done. What is shared is the source
+/// bytes and the [`FileAnalysis`], plus the indexes built lazily from it.
+pub fn parsed_fixture(fixture_name: &str, file_name: &str) -> Arc<ParsedFixture> {
     let path = fixture_path(fixture_name).join(file_name);
-    let source = std::fs::read(&path).expect("Failed to read fixture file");
-    let ext = Path::new(file_name)
-        .extension()
-        .map(|e| e.to_string_lossy().to_string())
-        .unwrap_or_default();
+    let cell = Arc::clone(
+        PARSED_FIXTURES
+            .lock()
+            .unwrap()
+            .entry(path.clone())
+            .or_default(),
+    );
+
+    let parsed = cell.get_or_init(|| {
+        let source: Arc<[u8]> = std::fs::read(&path)
+            .expect("Failed to read fixture file")
+            .into();
+        let ext = Path::new(file_name)
+            .extension()
+            .map(|e| e.to_string_lossy().to_string())
+            .unwrap_or_default();
+        let tree = parse_source(&ext, &source);
+        let analysis = extract_all(analyser(&ext), &tree, &source, file_name);
+        Arc::new(ParsedFixture {
+            file_name: file_name.to_string(),
+            ext,
+            source,
+            analysis,
+            symbol_index: OnceLock::new(),
+            call_names: OnceLock::new(),
+            import_targets: OnceLock::new(),
+        })
+    });
+    Arc::clone(parsed)
+}
+
+/// One extraction result of a cached [`ParsedFixture`], borrowed rather than
+/// cloned out of it. Derefs to a slice, so tests use it like the `Vec` it was.
+pub struct Extracted<T> {
+    fixture: Arc<ParsedFixture>,
+    select: fn(&FileAnalysis) -> &[T],
+}
+
+impl<T> Deref for Extracted<T> {
+    type Target = [T];
 
-    let registry = AnalyserRegistry::new();
-    let analyser = registry
-        .get_by_extension(&ext)
-        .expect("No analyser for extension");
+    fn deref(&self) -> &[T] {
+        (self.select)(self.fixture.analysis())
+    }
+}
 
-    let mut parser = tree_sitter::Parser::new();
-    let language = analyser.get_language_for_ext(&ext);
-    parser
-        .set_language(&language)
-        .expect("Failed to set language");
-    let tree = parser.parse(&source, None).expect("Failed to parse");
+impl<'a, T> IntoIterator for &'a Extracted<T> {
+    type Item = &'a T;
+    type IntoIter = std::slice::Iter<'a, T>;
 
-    analyser.extract_imports(&tree, &source, file_name)
+    fn into_iter(self) -> Self::IntoIter {
+        self.iter()
+    }
+}
+
+/// Parse a single file and return extracted symbols.
+pub fn parse_file_symbols(fixture_name: &str, file_name: &str) -> Extracted<Symbol> {
+    Extracted {
+        fixture: parsed_fixture(fixture_name, file_name),
+        select: |analysis| analysis.symbols.as_slice(),
+    }
+}
+
+/// Parse a single file and return its symbol names grouped by type.
+pub fn symbol_index(fixture_name: &str, file_name: &str) -> Arc<SymbolIndex> {
+    parsed_fixture(fixture_name, file_name).symbol_index()
+}
+
+/// Parse a single file and return its distinct callee names.
+pub fn call_names(fixture_name: &str, file_name: &str) -> Arc<HashSet<String>> {
+    parsed_fixture(fixture_name, file_name).call_names()
+}
+
+/// Parse a single file and return its distinct import target names.
+pub fn import_target_names(fixture_name: &str, file_name: &str) -> Arc<HashSet<String>> {
+    parsed_fixture(fixture_name, file_name).import_targets()
+}
+
+/// Parse a single file and return extracted imports.
+pub fn parse_file_imports(fixture_name: &str, file_name: &str) -> Extracted<ImportStatement> {
+    Extracted {
+        fixture: parsed_fixture(fixture_name, file_name),
+        select: |analysis| analysis.imports.as_slice(),
+    }
 }
 
 /// Parse a single file and return extracted calls.
-pub fn parse_file_calls(
-    fixture_name: &str,
-    file_name: &str,
-) -> Vec<mycelium_core::config::RawCall> {
-    let path = fixture_path(fixture_name).join(file_name);
-    let source = std::fs::read(&path).expect("Failed to read fixture file");
-    let ext = Path::new(file_name)
-        .extension()
-        .map(|e| e.to_string_lossy().to_string())
-        .unwrap_or_default();
-
-    let registry = AnalyserRegistry::new();
-    let analyser = registry
-        .get_by_extension(&ext)
-        .expect("No analyser for extension");
-
-    let mut parser = tree_sitter::Parser::new();
-    let language = analyser.get_language_for_ext(&ext);
-    parser
-        .set_language(&language)
-        .expect("Failed to set language");
-    let tree = parser.parse(&source, None).expect("Failed to parse");
-
-    analyser.extract_calls(&tree, &source, file_name)
+pub fn parse_file_calls(fixture_name: &str, file_name: &str) -> Extracted<RawCall> {
+    Extracted {
+        fixture: parsed_fixture(fixture_name, file_name),
+        select: |analysis| analysis.calls.as_slice(),
+    }
 }
@@ -10,7 +10,7 @@ use common::*;
 
 #[test]
 fn calls_extracted_csharp() {
-    let r = run_four_phases("csharp_simple");
+    let r = run_four_phases(CSHARP_SIMPLE);
     let edges = r.kg.get_call_edges();
     assert!(
         !edges.is_empty(),
@@ -20,7 +20,7 @@ fn calls_extracted_csharp() {
 
 #[test]
 fn calls_extracted_python() {
-    let r = run_four_phases("python_simple");
+    let r = run_four_phases(PYTHON_SIMPLE);
     let edges = r.kg.get_call_edges();
     assert!(
         !edges.is_empty(),
@@ -30,7 +30,7 @@ fn calls_extracted_python() {
 
 #[test]
 fn calls_extracted_java() {
-    let r = run_four_phases("java_simple");
+    let r = run_four_phases(JAVA_SIMPLE);
     let edges = r.kg.get_call_edges();
     assert!(
         !edges.is_empty(),
@@ -40,14 +40,14 @@ fn calls_extracted_java() {
 
 #[test]
 fn calls_extracted_go() {
-    let r = run_four_phases("go_simple");
+    let r = run_four_phases(GO_SIMPLE);
     let edges = r.kg.get_call_edges();
     let _ = edges; // Go simple may or may not have resolved calls
 }
 
 #[test]
 fn calls_extracted_rust() {
-    let r = run_four_phases("rust_simple");
+    let r = run_four_phases(RUST_SIMPLE);
     let edges = r.kg.get_call_edges();
     let _ = edges; // Depends on import resolution success
 }
@@ -58,7 +58,7 @@ fn calls_extracted_rust() {
 
 #[test]
 fn tier_a_import_resolved() {
-    let r = run_four_phases("csharp_simple");
+    let r = run_four_phases(CSHARP_SIMPLE);
     let edges = r.kg.get_call_edges();
     let tier_a: Vec<_> = edges.iter().filter(|e| e.3 == "A").collect();
     // May or may not have Tier A depending on import resolution
@@ -67,7 +67,7 @@ fn tier_a_import_resolved() {
 
 #[test]
 fn tier_b_same_file() {
-    let r = run_four_phases("csharp_simple");
+    let r = run_four_phases(CSHARP_SIMPLE);
     let edges = r.kg.get_call_edges();
     let tier_b: Vec<_> = edges.iter().filter(|e| e.3 == "B").collect();
     assert!(
@@ -78,7 +78,7 @@ fn tier_b_same_file() {
 
 #[test]
 fn tier_c_fuzzy() {
-    let r = run_four_phases("csharp_simple");
+    let r = run_four_phases(CSHARP_SIMPLE);
     let edges = r.kg.get_call_edges();
     let tier_c: Vec<_> = edges.iter().filter(|e| e.3 == "C").collect();
     // May or may not have Tier C
@@ -87,7 +87,7 @@ fn tier_c_fuzzy() {
 
 #[test]
 fn confidence_values_valid() {
-    let r = run_four_phases("csharp_simple");
+    let r = run_four_phases(CSHARP_SIMPLE);
     let edges = r.kg.get_call_edges();
     for (_, _, confidence, tier, _, _) in &edges {
         assert!(
@@ -105,7 +105,7 @@ fn confidence_values_valid() {
 
 #[test]
 fn di_constructor_params_tracked() {
-    let r = run_two_phases("csharp_simple");
+    let r = run_two_phases(CSHARP_SIMPLE);
     let syms = r.kg.get_symbols();
     let constructors_with_params: Vec<_> = syms
         .iter()
@@ -119,7 +119,7 @@ fn di_constructor_params_tracked() {
 
 #[test]
 fn di_resolved_calls() {
-    let r = run_four_phases("csharp_simple");
+    let r = run_four_phases(CSHARP_SIMPLE);
     let edges = r.kg.get_call_edges();
     let di_edges: Vec<_> = edges.iter().filter(|e| e.4.contains("di")).collect();
     // DI resolution may or may not produce edges depending on fixture structure
@@ -132,7 +132,7 @@ fn di_resolved_calls() {
 
 #[test]
 fn interface_methods_present() {
-    let r = run_two_phases("csharp_simple");
+    let r = run_two_phases(CSHARP_SIMPLE);
     let syms = r.kg.get_symbols();
     let interface_methods: Vec<_> = syms
         .iter()
@@ -152,7 +152,7 @@ fn interface_methods_present() {
 
 #[test]
 fn impl_resolved_calls() {
-    let r = run_four_phases("csharp_simple");
+    let r = run_four_phases(CSHARP_SIMPLE);
     let edges = r.kg.get_call_edges();
     let impl_edges: Vec<_> = edges.iter().filter(|e| e.4.contains("impl")).collect();
     // Interface-to-impl resolution may or may not fire
@@ -165,7 +165,7 @@ fn impl_resolved_calls() {
 
 #[test]
 fn builtin_calls_excluded() {
-    let r = run_four_phases("python_simple");
+    let r = run_four_phases(PYTHON_SIMPLE);
     let pairs = call_pairs(&r.kg);
     // Built-in calls like print, len should not appear as resolved call targets
     let has_print = pairs.iter().any(|(_, to)| to == "print");
@@ -176,7 +176,7 @@ fn builtin_calls_excluded() {
 
 #[test]
 fn builtin_calls_excluded_csharp() {
-    let r = run_four_phases("csharp_simple");
+    let r = run_four_phases(CSHARP_SIMPLE);
     let pairs = call_pairs(&r.kg);
     let has_console = pairs.iter().any(|(_, to)| to == "Console");
     assert!(!has_console, "Console should be excluded as builtin");
@@ -188,7 +188,7 @@ fn builtin_calls_excluded_csharp() {
 
 #[test]
 fn calls_have_line_numbers() {
-    let r = run_four_phases("csharp_simple");
+    let r = run_four_phases(CSHARP_SIMPLE);
     let edges = r.kg.get_call_edges();
     for (_, _, _, _, _, line) in &edges {
         assert!(*line > 0, "Call edges should have positive line numbers");
@@ -197,7 +197,7 @@ fn calls_have_line_numbers() {
 
 #[test]
 fn call_count_reasonable() {
-    let r = run_four_phases("csharp_simple");
+    let r = run_four_phases(CSHARP_SIMPLE);
     let edges = r.kg.get_call_edges();
     assert!(
         edges.len() >= 5,
@@ -208,7 +208,7 @@ fn call_count_reasonable() {
 
 #[test]
 fn no_self_calls() {
-    let r = run_four_phases("csharp_simple");
+    let r = run_four_phases(CSHARP_SIMPLE);
     let edges = r.kg.get_call_edges();
     for (from, to, _, _, _, _) in &edges {
         assert_ne!(from, to, "Should not have self-calls: {}", from);
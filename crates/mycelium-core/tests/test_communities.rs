@@ -6,7 +6,7 @@ use common::*;
 
 #[test]
 fn communities_detected() {
-    let r = run_all_phases("csharp_simple");
+    let r = run_all_phases(CSHARP_SIMPLE);
     let communities = r.kg.get_communities();
     assert!(
         !communities.is_empty(),
@@ -16,7 +16,7 @@ fn communities_detected() {
 
 #[test]
 fn community_has_members() {
-    let r = run_all_phases("csharp_simple");
+    let r = run_all_phases(CSHARP_SIMPLE);
     let communities = r.kg.get_communities();
     for (id, _label, members, _, _) in &communities {
         assert!(!members.is_empty(), "Community {} should have members", id);
@@ -25,7 +25,7 @@ fn community_has_members() {
 
 #[test]
 fn community_has_label() {
-    let r = run_all_phases("csharp_simple");
+    let r = run_all_phases(CSHARP_SIMPLE);
     let communities = r.kg.get_communities();
     for (_, label, _, _, _) in &communities {
         assert!(
@@ -37,7 +37,7 @@ fn community_has_label() {
 
 #[test]
 fn community_cohesion_range() {
-    let r = run_all_phases("csharp_simple");
+    let r = run_all_phases(CSHARP_SIMPLE);
     let communities = r.kg.get_communities();
     for (id, _, _, cohesion, _) in &communities {
         assert!(
@@ -51,7 +51,7 @@ fn community_cohesion_range() {
 
 #[test]
 fn community_ids_unique() {
-    let r = run_all_phases("csharp_simple");
+    let r = run_all_phases(CSHARP_SIMPLE);
     let communities = r.kg.get_communities();
     let mut seen = std::collections::HashSet::new();
     for (id, _, _, _, _) in &communities {
@@ -61,7 +61,7 @@ fn community_ids_unique() {
 
 #[test]
 fn community_primary_language() {
-    let r = run_all_phases("csharp_simple");
+    let r = run_all_phases(CSHARP_SIMPLE);
     let communities = r.kg.get_communities();
     for (_, _, _, _, lang) in &communities {
         // Primary language should be set (may be empty for mixed)
@@ -71,7 +71,7 @@ fn community_primary_language() {
 
 #[test]
 fn community_labels_unique() {
-    let r = run_all_phases("csharp_simple");
+    let r = run_all_phases(CSHARP_SIMPLE);
     let communities = r.kg.get_communities();
     let mut labels = std::collections::HashSet::new();
     for (_, label, _, _, _) in &communities {
@@ -87,7 +87,7 @@ fn community_labels_unique() {
 
 #[test]
 fn community_python_fixture() {
-    let r = run_all_phases("python_simple");
+    let r = run_all_phases(PYTHON_SIMPLE);
     let communities = r.kg.get_communities();
     assert!(
         !communities.is_empty(),
@@ -97,7 +97,7 @@ fn community_python_fixture() {
 
 #[test]
 fn community_java_fixture() {
-    let r = run_all_phases("java_simple");
+    let r = run_all_phases(JAVA_SIMPLE);
     let communities = r.kg.get_communities();
     assert!(
         !communities.is_empty(),
@@ -107,7 +107,7 @@ fn community_java_fixture() {
 
 #[test]
 fn community_all_symbols_assigned() {
-    let r = run_all_phases("csharp_simple");
+    let r = run_all_phases(CSHARP_SIMPLE);
     let communities = r.kg.get_communities();
     let all_members: std::collections::HashSet<_> = communities
         .iter()
@@ -125,7 +125,7 @@ fn community_all_symbols_assigned() {
 
 #[test]
 fn community_count_reasonable() {
-    let r = run_all_phases("csharp_simple");
+    let r = run_all_phases(CSHARP_SIMPLE);
     let communities = r.kg.get_communities();
     let sym_count = r.kg.symbol_count();
     assert!(
@@ -10,7 +10,7 @@ use common::*;
 
 #[test]
 fn dotnet_discovers_sln_file() {
-    let r = run_structure("mixed_dotnet");
+    let r = run_structure(MIXED_DOTNET);
     let files = file_paths(&r.kg);
     assert!(
         files.iter().any(|f| f.ends_with(".sln")),
@@ -20,7 +20,7 @@ fn dotnet_discovers_sln_file() {
 
 #[test]
 fn dotnet_discovers_csproj_file() {
-    let r = run_structure("mixed_dotnet");
+    let r = run_structure(MIXED_DOTNET);
     let files = file_paths(&r.kg);
     assert!(
         files.iter().any(|f| f.ends_with(".csproj")),
@@ -30,7 +30,7 @@ fn dotnet_discovers_csproj_file() {
 
 #[test]
 fn dotnet_discovers_vbproj_file() {
-    let r = run_structure("mixed_dotnet");
+    let r = run_structure(MIXED_DOTNET);
     let files = file_paths(&r.kg);
     assert!(
         files.iter().any(|f| f.ends_with(".vbproj")),
@@ -40,7 +40,7 @@ fn dotnet_discovers_vbproj_file() {
 
 #[test]
 fn dotnet_project_references_resolved() {
-    let r = run_three_phases("mixed_dotnet");
+    let r = run_three_phases(MIXED_DOTNET);
     let proj_refs = r.kg.get_project_references();
     // CSharpProject references VBNetProject
     assert!(
@@ -51,7 +51,7 @@ fn dotnet_project_references_resolved() {
 
 #[test]
 fn dotnet_package_references_extracted() {
-    let r = run_three_phases("mixed_dotnet");
+    let r = run_three_phases(MIXED_DOTNET);
     let pkg_refs = r.kg.get_package_references();
     // CSharpProject has Newtonsoft.Json and Microsoft.Extensions.Logging
     assert!(
@@ -62,7 +62,7 @@ fn dotnet_package_references_extracted() {
 
 #[test]
 fn dotnet_csproj_package_names() {
-    let r = run_three_phases("mixed_dotnet");
+    let r = run_three_phases(MIXED_DOTNET);
     let pkg_refs = r.kg.get_package_references();
     let names: Vec<_> = pkg_refs.iter().map(|(_, name, _)| name.as_str()).collect();
     assert!(
@@ -73,7 +73,7 @@ fn dotnet_csproj_package_names() {
 
 #[test]
 fn dotnet_vbproj_packages() {
-    let r = run_three_phases("mixed_dotnet");
+    let r = run_three_phases(MIXED_DOTNET);
     let pkg_refs = r.kg.get_package_references();
     let vb_pkgs: Vec<_> = pkg_refs
         .iter()
@@ -87,7 +87,7 @@ fn dotnet_vbproj_packages() {
 
 #[test]
 fn dotnet_project_ref_target() {
-    let r = run_three_phases("mixed_dotnet");
+    let r = run_three_phases(MIXED_DOTNET);
     let proj_refs = r.kg.get_project_references();
     // Project reference should point to VBNetProject
     let has_vb_ref = proj_refs
@@ -103,7 +103,7 @@ fn dotnet_project_ref_target() {
 #[test]
 fn assembly_index_populated_from_csproj() {
     // The assembly index gets populated during imports phase from csproj RootNamespace
-    let r = run_three_phases("mixed_dotnet");
+    let r = run_three_phases(MIXED_DOTNET);
     // Verify imports ran without error and project refs were created
     let proj_refs = r.kg.get_project_references();
     assert!(!proj_refs.is_empty(), "Assembly processing should complete");
@@ -146,7 +146,7 @@ fn assembly_unrelated_namespace_no_match() {
 
 #[test]
 fn csharp_using_extracts_imports() {
-    let imports = parse_file_imports("csharp_simple", "AbsenceController.cs");
+    let imports = parse_file_imports(CSHARP_SIMPLE, "AbsenceController.cs");
     assert!(
         !imports.is_empty(),
         "Should extract C# using directives as imports"
@@ -155,7 +155,7 @@ fn csharp_using_extracts_imports() {
 
 #[test]
 fn csharp_namespace_import_target() {
-    let imports = parse_file_imports("csharp_simple", "AbsenceController.cs");
+    let imports = parse_file_imports(CSHARP_SIMPLE, "AbsenceController.cs");
     // Should import from Absence namespace
     assert!(
         imports.iter().any(|i| i.target_name.contains("Absence")),
@@ -165,9 +165,8 @@ fn csharp_namespace_import_target() {
 
 #[test]
 fn csharp_self_import_excluded() {
-    let r = run_three_phases("csharp_simple");
-    let import_edges = r.kg.get_import_edges();
-    for (from, to, _) in &import_edges {
+    let r = run_three_phases(CSHARP_SIMPLE);
+    for (from, to, _) in r.kg.iter_import_edges() {
         assert_ne!(from, to, "Self-imports should be excluded");
     }
 }
@@ -178,13 +177,13 @@ fn csharp_self_import_excluded() {
 
 #[test]
 fn python_simple_imports() {
-    let imports = parse_file_imports("python_simple", "handler.py");
+    let imports = parse_file_imports(PYTHON_SIMPLE, "handler.py");
     assert!(!imports.is_empty(), "Should extract Python imports");
 }
 
 #[test]
 fn python_import_resolution() {
-    let r = run_three_phases("python_simple");
+    let r = run_three_phases(PYTHON_SIMPLE);
     let edges = r.kg.get_import_edges();
     assert!(
         !edges.is_empty(),
@@ -194,24 +193,22 @@ fn python_import_resolution() {
 
 #[test]
 fn python_self_import_excluded() {
-    let r = run_three_phases("python_simple");
-    let edges = r.kg.get_import_edges();
-    for (from, to, _) in &edges {
+    let r = run_three_phases(PYTHON_SIMPLE);
+    for (from, to, _) in r.kg.iter_import_edges() {
         assert_ne!(from, to, "Self-imports should be excluded");
     }
 }
 
 #[test]
 fn python_service_to_repository() {
-    let r = run_three_phases("python_simple");
-    let edges = r.kg.get_import_edges();
-    let has_service_repo = edges
-        .iter()
-        .any(|(from, to, _)| from.contains("service") && to.contains("repository"));
+    let r = run_three_phases(PYTHON_SIMPLE);
+    let has_service_repo =
+        r.kg.iter_import_edges()
+            .any(|(from, to, _)| from.contains("service") && to.contains("repository"));
     // service imports from repository
-    let has_service_models = edges
-        .iter()
-        .any(|(from, to, _)| from.contains("service") && to.contains("models"));
+    let has_service_models =
+        r.kg.iter_import_edges()
+            .any(|(from, to, _)| from.contains("service") && to.contains("models"));
     assert!(
         has_service_repo || has_service_models,
         "service.py should import from repository.py or models.py"
@@ -220,17 +217,16 @@ fn python_service_to_repository() {
 
 #[test]
 fn python_handler_imports_service() {
-    let r = run_three_phases("python_simple");
-    let edges = r.kg.get_import_edges();
-    let has_handler_service = edges
-        .iter()
-        .any(|(from, to, _)| from.contains("handler") && to.contains("service"));
-    assert!(has_handler_service, "handler.py should import service.py");
+    let r = run_three_phases(PYTHON_SIMPLE);
+    assert!(
+        r.kg.has_import_edge("handler.py", "service.py"),
+        "handler.py should import service.py"
+    );
 }
 
 #[test]
 fn python_package_imports() {
-    let r = run_three_phases("python_package");
+    let r = run_three_phases(PYTHON_PACKAGE);
     let edges = r.kg.get_import_edges();
     assert!(
         !edges.is_empty(),
@@ -241,7 +237,7 @@ fn python_package_imports() {
 #[test]
 fn python_relative_imports() {
     // user_service.py has relative imports (..models.item)
-    let imports = parse_file_imports("python_package", "app/services/user_service.py");
+    let imports = parse_file_imports(PYTHON_PACKAGE, "app/services/user_service.py");
     let has_relative = imports
         .iter()
         .any(|i| i.target_name.starts_with('.') || i.statement.contains("from ."));
@@ -250,18 +246,17 @@ fn python_relative_imports() {
 
 #[test]
 fn python_dotted_path_resolution() {
-    let r = run_three_phases("python_package");
-    let edges = r.kg.get_import_edges();
+    let r = run_three_phases(PYTHON_PACKAGE);
     // user_service imports from models
-    let service_to_models = edges
-        .iter()
-        .any(|(from, to, _)| from.contains("user_service") && to.contains("models"));
+    let service_to_models =
+        r.kg.iter_import_edges()
+            .any(|(from, to, _)| from.contains("user_service") && to.contains("models"));
     let _ = service_to_models;
 }
 
 #[test]
 fn python_import_count() {
-    let r = run_three_phases("python_simple");
+    let r = run_three_phases(PYTHON_SIMPLE);
     let edges = r.kg.get_import_edges();
     assert!(
         edges.len() >= 3,
@@ -278,7 +273,7 @@ fn python_import_count() {
 fn ts_relative_import_resolution() {
     // TypeScript imports use relative specifiers like ./service
     // Resolution depends on path normalization with source directory
-    let r = run_three_phases("typescript_simple");
+    let r = run_three_phases(TYPESCRIPT_SIMPLE);
     let edges = r.kg.get_import_edges();
     // Flat fixture directory may not resolve ./service from root; verify no errors
     let _ = edges;
@@ -287,7 +282,7 @@ fn ts_relative_import_resolution() {
 #[test]
 fn ts_controller_imports_service() {
     // Verify import extraction works; resolution depends on directory structure
-    let imports = parse_file_imports("typescript_simple", "controller.ts");
+    let imports = parse_file_imports(TYPESCRIPT_SIMPLE, "controller.ts");
     assert!(
         imports.iter().any(|i| i.target_name.contains("service")),
         "controller.ts should have import referencing service"
@@ -297,10 +292,9 @@ fn ts_controller_imports_service() {
 #[test]
 fn ts_extension_probing() {
     // TS imports don't include extension - should probe .ts, .tsx, .js, .jsx
-    let r = run_three_phases("typescript_simple");
-    let edges = r.kg.get_import_edges();
+    let r = run_three_phases(TYPESCRIPT_SIMPLE);
     // All resolved targets should be actual .ts files
-    for (_, to, _) in &edges {
+    for (_, to, _) in r.kg.iter_import_edges() {
         assert!(
             to.ends_with(".ts"),
             "Resolved import should end in .ts: {}",
@@ -312,9 +306,8 @@ fn ts_extension_probing() {
 #[test]
 fn ts_bare_specifier_excluded() {
     // Bare specifiers (no ./ or ../) are external packages and should not resolve
-    let r = run_three_phases("typescript_simple");
-    let edges = r.kg.get_import_edges();
-    for (_, to, _) in &edges {
+    let r = run_three_phases(TYPESCRIPT_SIMPLE);
+    for to in r.kg.import_targets() {
         assert!(
             !to.starts_with("node_modules"),
             "External packages should not resolve to file edges"
@@ -324,9 +317,8 @@ fn ts_bare_specifier_excluded() {
 
 #[test]
 fn ts_self_import_excluded() {
-    let r = run_three_phases("typescript_simple");
-    let edges = r.kg.get_import_edges();
-    for (from, to, _) in &edges {
+    let r = run_three_phases(TYPESCRIPT_SIMPLE);
+    for (from, to, _) in r.kg.iter_import_edges() {
         assert_ne!(from, to, "Self-imports should be excluded");
     }
 }
@@ -337,7 +329,7 @@ fn ts_self_import_excluded() {
 
 #[test]
 fn java_simple_import_resolution() {
-    let r = run_three_phases("java_simple");
+    let r = run_three_phases(JAVA_SIMPLE);
     let edges = r.kg.get_import_edges();
     assert!(
         !edges.is_empty(),
@@ -347,7 +339,7 @@ fn java_simple_import_resolution() {
 
 #[test]
 fn java_package_import_resolution() {
-    let r = run_three_phases("java_package");
+    let r = run_three_phases(JAVA_PACKAGE);
     let edges = r.kg.get_import_edges();
     assert!(
         !edges.is_empty(),
@@ -357,26 +349,24 @@ fn java_package_import_resolution() {
 
 #[test]
 fn java_controller_imports_service() {
-    let r = run_three_phases("java_package");
-    let edges = r.kg.get_import_edges();
-    let has_ctrl_svc = edges
-        .iter()
-        .any(|(from, to, _)| from.contains("UserController") && to.contains("UserService"));
+    let r = run_three_phases(JAVA_PACKAGE);
     assert!(
-        has_ctrl_svc,
+        r.kg.has_import_edge(
+            "com/example/controllers/UserController.java",
+            "com/example/services/UserService.java"
+        ),
         "UserController.java should import UserService.java"
     );
 }
 
 #[test]
 fn java_controller_imports_model() {
-    let r = run_three_phases("java_package");
-    let edges = r.kg.get_import_edges();
-    let has_ctrl_model = edges
-        .iter()
-        .any(|(from, to, _)| from.contains("UserController") && to.contains("User.java"));
+    let r = run_three_phases(JAVA_PACKAGE);
     assert!(
-        has_ctrl_model,
+        r.kg.has_import_edge(
+            "com/example/controllers/UserController.java",
+            "com/example/models/User.java"
+        ),
         "UserController.java should import User.java"
     );
 }
@@ -384,9 +374,10 @@ fn java_controller_imports_model() {
 #[test]
 fn java_stdlib_excluded() {
     // java.util.List etc. should not resolve to local files
-    let r = run_three_phases("java_simple");
-    let edges = r.kg.get_import_edges();
-    for (_, to, _) in &edges {
+    let r = run_three_phases(JAVA_SIMPLE);
+    let targets = r.kg.import_targets();
+    assert!(!targets.contains("java/util/List.java"));
+    for to in targets {
         assert!(
             !to.starts_with("java/"),
             "Java stdlib imports should not resolve to files"
@@ -396,9 +387,8 @@ fn java_stdlib_excluded() {
 
 #[test]
 fn java_self_import_excluded() {
-    let r = run_three_phases("java_simple");
-    let edges = r.kg.get_import_edges();
-    for (from, to, _) in &edges {
+    let r = run_three_phases(JAVA_SIMPLE);
+    for (from, to, _) in r.kg.iter_import_edges() {
         assert_ne!(from, to, "Self-imports should be excluded");
     }
 }
@@ -406,7 +396,7 @@ fn java_self_import_excluded() {
 #[test]
 fn java_basename_fallback() {
     // java_simple doesn't have proper package paths — basename fallback should work
-    let r = run_three_phases("java_simple");
+    let r = run_three_phases(JAVA_SIMPLE);
     let edges = r.kg.get_import_edges();
     // Some imports should resolve even without full path match
     let _ = edges;
@@ -414,10 +404,7 @@ fn java_basename_fallback() {
 
 #[test]
 fn java_dotted_path_import() {
-    let imports = parse_file_imports(
-        "java_package",
-        "com/example/controllers/UserController.java",
-    );
+    let imports = parse_file_imports(JAVA_PACKAGE, "com/example/controllers/UserController.java");
     assert!(
         imports
             .iter()
@@ -432,7 +419,7 @@ fn java_dotted_path_import() {
 
 #[test]
 fn go_package_imports_resolved() {
-    let r = run_three_phases("go_package");
+    let r = run_three_phases(GO_PACKAGE);
     let edges = r.kg.get_import_edges();
     assert!(
         !edges.is_empty(),
@@ -442,9 +429,8 @@ fn go_package_imports_resolved() {
 
 #[test]
 fn go_stdlib_excluded() {
-    let r = run_three_phases("go_package");
-    let edges = r.kg.get_import_edges();
-    for (_, to, _) in &edges {
+    let r = run_three_phases(GO_PACKAGE);
+    for to in r.kg.import_targets() {
         assert!(
             !to.starts_with("fmt") && !to.starts_with("log"),
             "Go stdlib imports should not resolve to files"
@@ -454,21 +440,19 @@ fn go_stdlib_excluded() {
 
 #[test]
 fn go_main_imports_service() {
-    let r = run_three_phases("go_package");
-    let edges = r.kg.get_import_edges();
-    let has_main_svc = edges
-        .iter()
-        .any(|(from, to, _)| from.contains("main.go") && to.contains("service"));
+    let r = run_three_phases(GO_PACKAGE);
+    let has_main_svc =
+        r.kg.iter_import_edges()
+            .any(|(from, to, _)| from.contains("main.go") && to.contains("service"));
     assert!(has_main_svc, "main.go should import service package");
 }
 
 #[test]
 fn go_service_imports_model() {
-    let r = run_three_phases("go_package");
-    let edges = r.kg.get_import_edges();
-    let has_svc_model = edges
-        .iter()
-        .any(|(from, to, _)| from.contains("service") && to.contains("model"));
+    let r = run_three_phases(GO_PACKAGE);
+    let has_svc_model =
+        r.kg.iter_import_edges()
+            .any(|(from, to, _)| from.contains("service") && to.contains("model"));
     assert!(has_svc_model, "service.go should import model package");
 }
 
@@ -478,13 +462,13 @@ fn go_service_imports_model() {
 
 #[test]
 fn rust_use_declarations() {
-    let imports = parse_file_imports("rust_simple", "main.rs");
+    let imports = parse_file_imports(RUST_SIMPLE, "main.rs");
     assert!(!imports.is_empty(), "Should extract Rust use declarations");
 }
 
 #[test]
 fn rust_import_resolution() {
-    let r = run_three_phases("rust_simple");
+    let r = run_three_phases(RUST_SIMPLE);
     let edges = r.kg.get_import_edges();
     // main.rs uses service, model, error
     assert!(
@@ -495,9 +479,8 @@ fn rust_import_resolution() {
 
 #[test]
 fn rust_std_excluded() {
-    let r = run_three_phases("rust_simple");
-    let edges = r.kg.get_import_edges();
-    for (_, to, _) in &edges {
+    let r = run_three_phases(RUST_SIMPLE);
+    for to in r.kg.import_targets() {
         assert!(
             !to.starts_with("std/") && !to.starts_with("core/"),
             "Rust stdlib imports should not resolve to files"
@@ -507,20 +490,18 @@ fn rust_std_excluded() {
 
 #[test]
 fn rust_self_import_excluded() {
-    let r = run_three_phases("rust_simple");
-    let edges = r.kg.get_import_edges();
-    for (from, to, _) in &edges {
+    let r = run_three_phases(RUST_SIMPLE);
+    for (from, to, _) in r.kg.iter_import_edges() {
         assert_ne!(from, to, "Self-imports should be excluded");
     }
 }
 
 #[test]
 fn rust_main_imports_service() {
-    let r = run_three_phases("rust_simple");
-    let edges = r.kg.get_import_edges();
-    let has_main_svc = edges
-        .iter()
-        .any(|(from, to, _)| from.contains("main") && to.contains("service"));
+    let r = run_three_phases(RUST_SIMPLE);
+    let has_main_svc =
+        r.kg.iter_import_edges()
+            .any(|(from, to, _)| from.contains("main") && to.contains("service"));
     assert!(has_main_svc, "main.rs should import service.rs");
 }
 
@@ -530,24 +511,24 @@ fn rust_main_imports_service() {
 
 #[test]
 fn c_include_resolution() {
-    let r = run_three_phases("c_simple");
+    let r = run_three_phases(C_SIMPLE);
     let edges = r.kg.get_import_edges();
     assert!(!edges.is_empty(), "Should resolve C #include to file edges");
 }
 
 #[test]
 fn c_user_include_resolved() {
-    let r = run_three_phases("c_simple");
-    let edges = r.kg.get_import_edges();
-    let has_service = edges.iter().any(|(_, to, _)| to.contains("service.h"));
-    assert!(has_service, "Should resolve user includes like service.h");
+    let r = run_three_phases(C_SIMPLE);
+    assert!(
+        r.kg.import_targets().contains("service.h"),
+        "Should resolve user includes like service.h"
+    );
 }
 
 #[test]
 fn c_system_include_excluded() {
-    let r = run_three_phases("c_simple");
-    let edges = r.kg.get_import_edges();
-    for (_, to, _) in &edges {
+    let r = run_three_phases(C_SIMPLE);
+    for to in r.kg.import_targets() {
         assert!(
             !to.starts_with("stdio") && !to.starts_with("stdlib"),
             "System includes should not resolve to local files"
@@ -557,21 +538,19 @@ fn c_system_include_excluded() {
 
 #[test]
 fn c_self_import_excluded() {
-    let r = run_three_phases("c_simple");
-    let edges = r.kg.get_import_edges();
-    for (from, to, _) in &edges {
+    let r = run_three_phases(C_SIMPLE);
+    for (from, to, _) in r.kg.iter_import_edges() {
         assert_ne!(from, to, "Self-imports should be excluded");
     }
 }
 
 #[test]
 fn c_main_includes_headers() {
-    let r = run_three_phases("c_simple");
-    let edges = r.kg.get_import_edges();
-    let main_imports: Vec<_> = edges
-        .iter()
-        .filter(|(from, _, _)| from.contains("main.c"))
-        .collect();
+    let r = run_three_phases(C_SIMPLE);
+    let main_imports: Vec<_> =
+        r.kg.iter_import_edges()
+            .filter(|(from, _, _)| from.contains("main.c"))
+            .collect();
     assert!(
         !main_imports.is_empty(),
         "main.c should include header files"
@@ -584,7 +563,7 @@ fn c_main_includes_headers() {
 
 #[test]
 fn cpp_include_resolution() {
-    let r = run_three_phases("cpp_simple");
+    let r = run_three_phases(CPP_SIMPLE);
     let edges = r.kg.get_import_edges();
     assert!(
         !edges.is_empty(),
@@ -594,19 +573,17 @@ fn cpp_include_resolution() {
 
 #[test]
 fn cpp_handler_includes_service() {
-    let r = run_three_phases("cpp_simple");
-    let edges = r.kg.get_import_edges();
-    let has_svc = edges
-        .iter()
-        .any(|(from, to, _)| from.contains("handler") && to.contains("service"));
-    assert!(has_svc, "handler.cpp should include service.hpp");
+    let r = run_three_phases(CPP_SIMPLE);
+    assert!(
+        r.kg.has_import_edge("handler.cpp", "service.hpp"),
+        "handler.cpp should include service.hpp"
+    );
 }
 
 #[test]
 fn cpp_system_include_excluded() {
-    let r = run_three_phases("cpp_simple");
-    let edges = r.kg.get_import_edges();
-    for (_, to, _) in &edges {
+    let r = run_three_phases(CPP_SIMPLE);
+    for to in r.kg.import_targets() {
         assert!(
             !to.starts_with("iostream") && !to.starts_with("vector"),
             "System includes should not resolve"
@@ -616,9 +593,8 @@ fn cpp_system_include_excluded() {
 
 #[test]
 fn cpp_self_import_excluded() {
-    let r = run_three_phases("cpp_simple");
-    let edges = r.kg.get_import_edges();
-    for (from, to, _) in &edges {
+    let r = run_three_phases(CPP_SIMPLE);
+    for (from, to, _) in r.kg.iter_import_edges() {
         assert_ne!(from, to, "Self-imports should be excluded");
     }
 }
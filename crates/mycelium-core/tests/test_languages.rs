@@ -7,47 +7,73 @@ mod common;
 
 use common::*;
 use mycelium_core::config::{SymbolType, Visibility};
+use std::collections::HashSet;
+
+/// Generate one test per row asserting that `file` in `fixture` yields at
+/// least one symbol of `type`, including every listed name.
+macro_rules! symbol_type_tests {
+    ($($name:ident: $fixture:expr, $file:expr, $ty:ident, [$($expected:expr),*];)*) => {
+        $(
+            #[test]
+            fn $name() {
+                let index = symbol_index($fixture, $file);
+                let names = index.names(SymbolType::$ty);
+                assert!(
+                    !names.is_empty(),
+                    "Should extract {:?} symbols from {}",
+                    SymbolType::$ty,
+                    $file
+                );
+                $(
+                    assert!(
+                        names.contains($expected),
+                        "Should extract {:?} {} from {}",
+                        SymbolType::$ty,
+                        $expected,
+                        $file
+                    );
+                )*
+            }
+        )*
+    };
+}
+
+/// Generate one test per row asserting that `file` in `fixture` declares
+/// every listed name, whatever its symbol type.
+macro_rules! symbol_name_tests {
+    ($($name:ident: $fixture:expr, $file:expr, [$($expected:expr),+];)*) => {
+        $(
+            #[test]
+            fn $name() {
+                let index = symbol_index($fixture, $file);
+                $(
+                    assert!(
+                        index.contains($expected),
+                        "Should extract {} from {}",
+                        $expected,
+                        $file
+                    );
+                )+
+            }
+        )*
+    };
+}
 
 // ===========================================================================
 // TypeScript analyser (28 tests)
 // ===========================================================================
 
-#[test]
-fn ts_extracts_classes() {
-    let syms = parse_file_symbols("typescript_simple", "controller.ts");
-    let classes: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Class)
-        .collect();
-    assert!(!classes.is_empty(), "Should extract TypeScript classes");
-    assert!(classes.iter().any(|s| s.name == "UserController"));
-}
-
-#[test]
-fn ts_extracts_interfaces() {
-    let syms = parse_file_symbols("typescript_simple", "models.ts");
-    let ifaces: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Interface)
-        .collect();
-    assert!(!ifaces.is_empty(), "Should extract TypeScript interfaces");
-    assert!(ifaces.iter().any(|s| s.name == "User"));
-}
-
-#[test]
-fn ts_extracts_enums() {
-    let syms = parse_file_symbols("typescript_simple", "models.ts");
-    let enums: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Enum)
-        .collect();
-    assert!(!enums.is_empty(), "Should extract TypeScript enums");
-    assert!(enums.iter().any(|s| s.name == "UserRole"));
+symbol_type_tests! {
+    ts_extracts_classes: TYPESCRIPT_SIMPLE, "controller.ts", Class, ["UserController"];
+    ts_extracts_interfaces: TYPESCRIPT_SIMPLE, "models.ts", Interface, ["User"];
+    ts_extracts_enums: TYPESCRIPT_SIMPLE, "models.ts", Enum, ["UserRole"];
+    ts_extracts_type_aliases: TYPESCRIPT_SIMPLE, "models.ts", TypeAlias, [];
+    ts_extracts_methods: TYPESCRIPT_SIMPLE, "controller.ts", Method, [];
 }
 
 #[test]
 fn ts_extracts_functions() {
-    let syms = parse_file_symbols("typescript_simple", "utils.ts");
+    let syms = parse_file_symbols(TYPESCRIPT_SIMPLE, "utils.ts");
     let funcs: Vec<_> = syms
         .iter()
         .filter(|s| s.symbol_type == SymbolType::Function)
@@ -58,40 +84,17 @@ fn ts_extracts_functions() {
         .any(|s| s.name == "hashPassword" || s.name == "validateEmail"));
 }
 
-#[test]
-fn ts_extracts_type_aliases() {
-    let syms = parse_file_symbols("typescript_simple", "models.ts");
-    let type_aliases: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::TypeAlias)
-        .collect();
-    assert!(
-        !type_aliases.is_empty(),
-        "Should extract TypeScript type aliases"
-    );
-}
-
-#[test]
-fn ts_extracts_methods() {
-    let syms = parse_file_symbols("typescript_simple", "controller.ts");
-    let methods: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Method)
-        .collect();
-    assert!(!methods.is_empty(), "Should extract class methods");
-}
-
 #[test]
 fn ts_exported_visibility() {
-    let syms = parse_file_symbols("typescript_simple", "controller.ts");
-    let controller = syms.iter().find(|s| s.name == "UserController").unwrap();
+    let index = symbol_index(TYPESCRIPT_SIMPLE, "controller.ts");
+    let controller = index.find("UserController").unwrap();
     assert_eq!(controller.visibility, Visibility::Public);
     assert!(controller.exported);
 }
 
 #[test]
 fn ts_non_exported_visibility() {
-    let syms = parse_file_symbols("typescript_simple", "utils.ts");
+    let syms = parse_file_symbols(TYPESCRIPT_SIMPLE, "utils.ts");
     // Not all functions may be exported — check if any are private
     let has_non_exported = syms.iter().any(|s| !s.exported);
     // If all are exported that's also valid for the fixture
@@ -100,7 +103,7 @@ fn ts_non_exported_visibility() {
 
 #[test]
 fn ts_parent_tracking() {
-    let syms = parse_file_symbols("typescript_simple", "controller.ts");
+    let syms = parse_file_symbols(TYPESCRIPT_SIMPLE, "controller.ts");
     let methods: Vec<_> = syms
         .iter()
         .filter(|s| s.symbol_type == SymbolType::Method && s.parent.is_some())
@@ -113,7 +116,7 @@ fn ts_parent_tracking() {
 
 #[test]
 fn ts_line_numbers() {
-    let syms = parse_file_symbols("typescript_simple", "controller.ts");
+    let syms = parse_file_symbols(TYPESCRIPT_SIMPLE, "controller.ts");
     for sym in &syms {
         assert!(sym.line > 0, "Line numbers should be > 0 for {}", sym.name);
     }
@@ -121,7 +124,7 @@ fn ts_line_numbers() {
 
 #[test]
 fn ts_language_tag() {
-    let syms = parse_file_symbols("typescript_simple", "controller.ts");
+    let syms = parse_file_symbols(TYPESCRIPT_SIMPLE, "controller.ts");
     for sym in &syms {
         assert_eq!(
             sym.language.as_deref(),
@@ -135,7 +138,7 @@ fn ts_language_tag() {
 fn ts_js_language_tag() {
     // JS files should get JavaScript language tag — test via phase runner
     // since parse_file_symbols doesn't have .js fixtures in typescript_simple
-    let r = run_two_phases("typescript_simple");
+    let r = shared_two_phases(TYPESCRIPT_SIMPLE);
     let syms = r.kg.get_symbols();
     let ts_syms: Vec<_> = syms
         .iter()
@@ -146,7 +149,7 @@ fn ts_js_language_tag() {
 
 #[test]
 fn ts_extracts_imports() {
-    let imports = parse_file_imports("typescript_simple", "controller.ts");
+    let imports = parse_file_imports(TYPESCRIPT_SIMPLE, "controller.ts");
     assert!(!imports.is_empty(), "Should extract TypeScript imports");
     assert!(
         imports.iter().any(|i| i.statement.contains("service")
@@ -158,22 +161,21 @@ fn ts_extracts_imports() {
 
 #[test]
 fn ts_extracts_calls() {
-    let calls = parse_file_calls("typescript_simple", "controller.ts");
+    let calls = call_names(TYPESCRIPT_SIMPLE, "controller.ts");
     assert!(!calls.is_empty(), "Should extract TypeScript calls");
 }
 
 #[test]
 fn ts_builtin_exclusions() {
-    let registry = mycelium_core::languages::AnalyserRegistry::new();
-    let analyser = registry.get_by_extension("ts").unwrap();
+    let analyser = analyser("ts");
     let builtins = analyser.builtin_exclusions();
-    assert!(builtins.contains(&"console.log".to_string()));
-    assert!(builtins.contains(&"JSON.parse".to_string()));
+    assert!(builtins.contains("console.log"));
+    assert!(builtins.contains("JSON.parse"));
 }
 
 #[test]
 fn ts_multiple_extensions() {
-    let registry = mycelium_core::languages::AnalyserRegistry::new();
+    let registry = registry();
     assert!(registry.get_by_extension("ts").is_some());
     assert!(registry.get_by_extension("tsx").is_some());
     assert!(registry.get_by_extension("js").is_some());
@@ -182,7 +184,7 @@ fn ts_multiple_extensions() {
 
 #[test]
 fn ts_constructor_extraction() {
-    let syms = parse_file_symbols("typescript_simple", "controller.ts");
+    let syms = parse_file_symbols(TYPESCRIPT_SIMPLE, "controller.ts");
     let constructors: Vec<_> = syms
         .iter()
         .filter(|s| s.symbol_type == SymbolType::Constructor)
@@ -193,7 +195,7 @@ fn ts_constructor_extraction() {
 
 #[test]
 fn ts_file_attribute() {
-    let syms = parse_file_symbols("typescript_simple", "controller.ts");
+    let syms = parse_file_symbols(TYPESCRIPT_SIMPLE, "controller.ts");
     for sym in &syms {
         assert_eq!(sym.file, "controller.ts");
     }
@@ -201,7 +203,7 @@ fn ts_file_attribute() {
 
 #[test]
 fn ts_property_extraction() {
-    let syms = parse_file_symbols("typescript_simple", "models.ts");
+    let syms = parse_file_symbols(TYPESCRIPT_SIMPLE, "models.ts");
     // Models may have property-like declarations
     let has_props = syms.iter().any(|s| s.symbol_type == SymbolType::Property);
     let _ = has_props;
@@ -209,7 +211,7 @@ fn ts_property_extraction() {
 
 #[test]
 fn ts_fixture_e2e() {
-    let r = run_two_phases("typescript_simple");
+    let r = shared_two_phases(TYPESCRIPT_SIMPLE);
     let count = r.kg.symbol_count();
     assert!(
         count >= 10,
@@ -219,56 +221,45 @@ fn ts_fixture_e2e() {
 
 #[test]
 fn ts_middleware_symbols() {
-    let syms = parse_file_symbols("typescript_simple", "middleware.ts");
-    assert!(!syms.is_empty(), "Should extract middleware symbols");
-    assert!(syms.iter().any(|s| s.name == "AuthMiddleware"));
+    let index = symbol_index(TYPESCRIPT_SIMPLE, "middleware.ts");
+    assert!(!index.all.is_empty(), "Should extract middleware symbols");
+    assert!(index.contains("AuthMiddleware"));
 }
 
-#[test]
-fn ts_repository_symbols() {
-    let syms = parse_file_symbols("typescript_simple", "repository.ts");
-    assert!(syms.iter().any(|s| s.name == "UserRepository"));
-}
-
-#[test]
-fn ts_service_symbols() {
-    let syms = parse_file_symbols("typescript_simple", "service.ts");
-    assert!(syms.iter().any(|s| s.name == "UserService"));
+symbol_name_tests! {
+    ts_repository_symbols: TYPESCRIPT_SIMPLE, "repository.ts", ["UserRepository"];
+    ts_service_symbols: TYPESCRIPT_SIMPLE, "service.ts", ["UserService"];
 }
 
 #[test]
 fn ts_service_imports() {
-    let imports = parse_file_imports("typescript_simple", "service.ts");
+    let imports = import_target_names(TYPESCRIPT_SIMPLE, "service.ts");
     assert!(!imports.is_empty(), "Service should have imports");
 }
 
 #[test]
 fn ts_service_calls() {
-    let calls = parse_file_calls("typescript_simple", "service.ts");
+    let calls = call_names(TYPESCRIPT_SIMPLE, "service.ts");
     assert!(!calls.is_empty(), "Service should have calls");
 }
 
 #[test]
 fn ts_index_exports() {
-    let syms = parse_file_symbols("typescript_simple", "index.ts");
+    let syms = parse_file_symbols(TYPESCRIPT_SIMPLE, "index.ts");
     // index.ts is primarily re-exports
     let _ = syms;
 }
 
 #[test]
 fn ts_utils_exported() {
-    let syms = parse_file_symbols("typescript_simple", "utils.ts");
-    let funcs: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Function)
-        .collect();
+    let index = symbol_index(TYPESCRIPT_SIMPLE, "utils.ts");
+    let funcs = index.names(SymbolType::Function);
     assert!(!funcs.is_empty());
 }
 
 #[test]
 fn ts_import_targets() {
-    let imports = parse_file_imports("typescript_simple", "service.ts");
-    let targets: Vec<_> = imports.iter().map(|i| &i.target_name).collect();
+    let targets = import_target_names(TYPESCRIPT_SIMPLE, "service.ts");
     assert!(!targets.is_empty());
 }
 
@@ -276,53 +267,16 @@ fn ts_import_targets() {
 // Python analyser (26 tests)
 // ===========================================================================
 
-#[test]
-fn py_extracts_classes() {
-    let syms = parse_file_symbols("python_simple", "handler.py");
-    let classes: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Class)
-        .collect();
-    assert!(!classes.is_empty(), "Should extract Python classes");
-    assert!(classes.iter().any(|s| s.name == "RequestHandler"));
-}
-
-#[test]
-fn py_extracts_functions() {
-    let syms = parse_file_symbols("python_simple", "config.py");
-    let funcs: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Function)
-        .collect();
-    assert!(!funcs.is_empty(), "Should extract Python functions");
-}
-
-#[test]
-fn py_extracts_methods() {
-    let syms = parse_file_symbols("python_simple", "handler.py");
-    let methods: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Method)
-        .collect();
-    assert!(!methods.is_empty(), "Should extract Python methods");
-}
-
-#[test]
-fn py_extracts_constructors() {
-    let syms = parse_file_symbols("python_simple", "handler.py");
-    let constructors: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Constructor)
-        .collect();
-    assert!(
-        !constructors.is_empty(),
-        "Should extract __init__ as Constructor"
-    );
+symbol_type_tests! {
+    py_extracts_classes: PYTHON_SIMPLE, "handler.py", Class, ["RequestHandler"];
+    py_extracts_functions: PYTHON_SIMPLE, "config.py", Function, [];
+    py_extracts_methods: PYTHON_SIMPLE, "handler.py", Method, [];
+    py_extracts_constructors: PYTHON_SIMPLE, "handler.py", Constructor, [];
 }
 
 #[test]
 fn py_private_visibility() {
-    let syms = parse_file_symbols("python_simple", "handler.py");
+    let syms = parse_file_symbols(PYTHON_SIMPLE, "handler.py");
     let private: Vec<_> = syms
         .iter()
         .filter(|s| s.visibility == Visibility::Private)
@@ -335,7 +289,7 @@ fn py_private_visibility() {
 
 #[test]
 fn py_public_visibility() {
-    let syms = parse_file_symbols("python_simple", "handler.py");
+    let syms = parse_file_symbols(PYTHON_SIMPLE, "handler.py");
     let public: Vec<_> = syms
         .iter()
         .filter(|s| s.visibility == Visibility::Public)
@@ -345,14 +299,14 @@ fn py_public_visibility() {
 
 #[test]
 fn py_exported() {
-    let syms = parse_file_symbols("python_simple", "handler.py");
+    let syms = parse_file_symbols(PYTHON_SIMPLE, "handler.py");
     let exported: Vec<_> = syms.iter().filter(|s| s.exported).collect();
     assert!(!exported.is_empty(), "Public symbols should be exported");
 }
 
 #[test]
 fn py_not_exported() {
-    let syms = parse_file_symbols("python_simple", "handler.py");
+    let syms = parse_file_symbols(PYTHON_SIMPLE, "handler.py");
     let not_exported: Vec<_> = syms.iter().filter(|s| !s.exported).collect();
     assert!(
         !not_exported.is_empty(),
@@ -362,7 +316,7 @@ fn py_not_exported() {
 
 #[test]
 fn py_parent_tracking() {
-    let syms = parse_file_symbols("python_simple", "handler.py");
+    let syms = parse_file_symbols(PYTHON_SIMPLE, "handler.py");
     let methods_with_parent: Vec<_> = syms
         .iter()
         .filter(|s| s.symbol_type == SymbolType::Method && s.parent.is_some())
@@ -375,7 +329,7 @@ fn py_parent_tracking() {
 
 #[test]
 fn py_line_numbers() {
-    let syms = parse_file_symbols("python_simple", "handler.py");
+    let syms = parse_file_symbols(PYTHON_SIMPLE, "handler.py");
     for sym in &syms {
         assert!(sym.line > 0, "Line numbers should be > 0 for {}", sym.name);
     }
@@ -383,7 +337,7 @@ fn py_line_numbers() {
 
 #[test]
 fn py_language_tag() {
-    let syms = parse_file_symbols("python_simple", "handler.py");
+    let syms = parse_file_symbols(PYTHON_SIMPLE, "handler.py");
     for sym in &syms {
         assert_eq!(sym.language.as_deref(), Some("Python"));
     }
@@ -391,62 +345,42 @@ fn py_language_tag() {
 
 #[test]
 fn py_extracts_imports() {
-    let imports = parse_file_imports("python_simple", "handler.py");
+    let imports = import_target_names(PYTHON_SIMPLE, "handler.py");
     assert!(!imports.is_empty(), "Should extract Python imports");
 }
 
 #[test]
 fn py_extracts_calls() {
-    let calls = parse_file_calls("python_simple", "handler.py");
+    let calls = call_names(PYTHON_SIMPLE, "handler.py");
     assert!(!calls.is_empty(), "Should extract Python calls");
 }
 
 #[test]
 fn py_builtin_exclusions() {
-    let registry = mycelium_core::languages::AnalyserRegistry::new();
-    let analyser = registry.get_by_extension("py").unwrap();
+    let analyser = analyser("py");
     let builtins = analyser.builtin_exclusions();
-    assert!(builtins.contains(&"print".to_string()));
-    assert!(builtins.contains(&"len".to_string()));
+    assert!(builtins.contains("print"));
+    assert!(builtins.contains("len"));
 }
 
-#[test]
-fn py_service_symbols() {
-    let syms = parse_file_symbols("python_simple", "service.py");
-    assert!(syms.iter().any(|s| s.name == "DataService"));
-}
-
-#[test]
-fn py_models_symbols() {
-    let syms = parse_file_symbols("python_simple", "models.py");
-    assert!(syms.iter().any(|s| s.name == "Item"));
-}
-
-#[test]
-fn py_repository_symbols() {
-    let syms = parse_file_symbols("python_simple", "repository.py");
-    assert!(syms.iter().any(|s| s.name == "ItemRepository"));
-}
-
-#[test]
-fn py_validators_symbols() {
-    let syms = parse_file_symbols("python_simple", "validators.py");
-    assert!(syms.iter().any(|s| s.name == "ItemValidator"));
+symbol_name_tests! {
+    py_service_symbols: PYTHON_SIMPLE, "service.py", ["DataService"];
+    py_models_symbols: PYTHON_SIMPLE, "models.py", ["Item"];
+    py_repository_symbols: PYTHON_SIMPLE, "repository.py", ["ItemRepository"];
+    py_validators_symbols: PYTHON_SIMPLE, "validators.py", ["ItemValidator"];
+    py_config_symbols: PYTHON_SIMPLE, "config.py", ["AppConfig"];
 }
 
 #[test]
 fn py_exception_classes() {
-    let syms = parse_file_symbols("python_simple", "exceptions.py");
-    let classes: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Class)
-        .collect();
+    let index = symbol_index(PYTHON_SIMPLE, "exceptions.py");
+    let classes = index.names(SymbolType::Class);
     assert!(classes.len() >= 2, "Should have multiple exception classes");
 }
 
 #[test]
 fn py_file_attribute() {
-    let syms = parse_file_symbols("python_simple", "handler.py");
+    let syms = parse_file_symbols(PYTHON_SIMPLE, "handler.py");
     for sym in &syms {
         assert_eq!(sym.file, "handler.py");
     }
@@ -454,7 +388,7 @@ fn py_file_attribute() {
 
 #[test]
 fn py_fixture_e2e() {
-    let r = run_two_phases("python_simple");
+    let r = shared_two_phases(PYTHON_SIMPLE);
     let count = r.kg.symbol_count();
     assert!(
         count >= 10,
@@ -464,19 +398,19 @@ fn py_fixture_e2e() {
 
 #[test]
 fn py_service_imports() {
-    let imports = parse_file_imports("python_simple", "service.py");
+    let imports = import_target_names(PYTHON_SIMPLE, "service.py");
     assert!(!imports.is_empty(), "Service should have imports");
 }
 
 #[test]
 fn py_service_calls() {
-    let calls = parse_file_calls("python_simple", "service.py");
+    let calls = call_names(PYTHON_SIMPLE, "service.py");
     assert!(!calls.is_empty(), "Service should have calls");
 }
 
 #[test]
 fn py_import_from_statement() {
-    let imports = parse_file_imports("python_simple", "handler.py");
+    let imports = parse_file_imports(PYTHON_SIMPLE, "handler.py");
     assert!(
         imports
             .iter()
@@ -485,16 +419,10 @@ fn py_import_from_statement() {
     );
 }
 
-#[test]
-fn py_config_symbols() {
-    let syms = parse_file_symbols("python_simple", "config.py");
-    assert!(syms.iter().any(|s| s.name == "AppConfig"));
-}
-
 #[test]
 fn py_dunder_init_is_constructor() {
-    let syms = parse_file_symbols("python_simple", "handler.py");
-    let init = syms.iter().find(|s| s.name == "__init__");
+    let index = symbol_index(PYTHON_SIMPLE, "handler.py");
+    let init = index.find("__init__");
     if let Some(init) = init {
         assert_eq!(init.symbol_type, SymbolType::Constructor);
     }
@@ -504,59 +432,24 @@ fn py_dunder_init_is_constructor() {
 // Java analyser (24 tests)
 // ===========================================================================
 
-#[test]
-fn java_extracts_classes() {
-    let syms = parse_file_symbols("java_simple", "UserController.java");
-    let classes: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Class)
-        .collect();
-    assert!(!classes.is_empty(), "Should extract Java classes");
-    assert!(classes.iter().any(|s| s.name == "UserController"));
-}
-
-#[test]
-fn java_extracts_interfaces() {
-    let syms = parse_file_symbols("java_simple", "UserRepository.java");
-    let ifaces: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Interface)
-        .collect();
-    assert!(!ifaces.is_empty(), "Should extract Java interfaces");
-    assert!(ifaces.iter().any(|s| s.name == "UserRepository"));
-}
-
-#[test]
-fn java_extracts_methods() {
-    let syms = parse_file_symbols("java_simple", "UserController.java");
-    let methods: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Method)
-        .collect();
-    assert!(!methods.is_empty(), "Should extract Java methods");
-}
-
-#[test]
-fn java_extracts_constructors() {
-    let syms = parse_file_symbols("java_simple", "UserController.java");
-    let constructors: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Constructor)
-        .collect();
-    assert!(!constructors.is_empty(), "Should extract Java constructors");
+symbol_type_tests! {
+    java_extracts_classes: JAVA_SIMPLE, "UserController.java", Class, ["UserController"];
+    java_extracts_interfaces: JAVA_SIMPLE, "UserRepository.java", Interface, ["UserRepository"];
+    java_extracts_methods: JAVA_SIMPLE, "UserController.java", Method, [];
+    java_extracts_constructors: JAVA_SIMPLE, "UserController.java", Constructor, [];
 }
 
 #[test]
 fn java_public_visibility() {
-    let syms = parse_file_symbols("java_simple", "UserController.java");
-    let controller = syms.iter().find(|s| s.name == "UserController").unwrap();
+    let index = symbol_index(JAVA_SIMPLE, "UserController.java");
+    let controller = index.find("UserController").unwrap();
     assert_eq!(controller.visibility, Visibility::Public);
     assert!(controller.exported);
 }
 
 #[test]
 fn java_private_visibility() {
-    let syms = parse_file_symbols("java_simple", "UserController.java");
+    let syms = parse_file_symbols(JAVA_SIMPLE, "UserController.java");
     let private: Vec<_> = syms
         .iter()
         .filter(|s| s.visibility == Visibility::Private)
@@ -569,7 +462,7 @@ fn java_private_visibility() {
 
 #[test]
 fn java_package_private() {
-    let syms = parse_file_symbols("java_simple", "UserController.java");
+    let syms = parse_file_symbols(JAVA_SIMPLE, "UserController.java");
     // Methods without explicit modifier default to internal (package-private)
     let has_internal = syms.iter().any(|s| s.visibility == Visibility::Internal);
     let _ = has_internal;
@@ -577,7 +470,7 @@ fn java_package_private() {
 
 #[test]
 fn java_parent_tracking() {
-    let syms = parse_file_symbols("java_simple", "UserController.java");
+    let syms = parse_file_symbols(JAVA_SIMPLE, "UserController.java");
     let methods_with_parent: Vec<_> = syms
         .iter()
         .filter(|s| s.symbol_type == SymbolType::Method && s.parent.is_some())
@@ -590,7 +483,7 @@ fn java_parent_tracking() {
 
 #[test]
 fn java_line_numbers() {
-    let syms = parse_file_symbols("java_simple", "UserController.java");
+    let syms = parse_file_symbols(JAVA_SIMPLE, "UserController.java");
     for sym in &syms {
         assert!(sym.line > 0, "Line numbers should be > 0 for {}", sym.name);
     }
@@ -598,7 +491,7 @@ fn java_line_numbers() {
 
 #[test]
 fn java_language_tag() {
-    let syms = parse_file_symbols("java_simple", "UserController.java");
+    let syms = parse_file_symbols(JAVA_SIMPLE, "UserController.java");
     for sym in &syms {
         assert_eq!(sym.language.as_deref(), Some("Java"));
     }
@@ -606,58 +499,36 @@ fn java_language_tag() {
 
 #[test]
 fn java_extracts_imports() {
-    let imports = parse_file_imports("java_simple", "UserController.java");
+    let imports = import_target_names(JAVA_SIMPLE, "UserController.java");
     assert!(!imports.is_empty(), "Should extract Java imports");
 }
 
 #[test]
 fn java_extracts_calls() {
-    let calls = parse_file_calls("java_simple", "UserController.java");
+    let calls = call_names(JAVA_SIMPLE, "UserController.java");
     assert!(!calls.is_empty(), "Should extract Java calls");
 }
 
 #[test]
 fn java_builtin_exclusions() {
-    let registry = mycelium_core::languages::AnalyserRegistry::new();
-    let analyser = registry.get_by_extension("java").unwrap();
+    let analyser = analyser("java");
     let builtins = analyser.builtin_exclusions();
-    assert!(builtins.contains(&"System.out.println".to_string()));
-    assert!(builtins.contains(&"toString".to_string()));
+    assert!(builtins.contains("System.out.println"));
+    assert!(builtins.contains("toString"));
 }
 
-#[test]
-fn java_service_symbols() {
-    let syms = parse_file_symbols("java_simple", "UserService.java");
-    assert!(syms.iter().any(|s| s.name == "UserService"));
-}
-
-#[test]
-fn java_model_symbols() {
-    let syms = parse_file_symbols("java_simple", "User.java");
-    assert!(syms.iter().any(|s| s.name == "User"));
-}
-
-#[test]
-fn java_mapper_symbols() {
-    let syms = parse_file_symbols("java_simple", "UserMapper.java");
-    assert!(syms.iter().any(|s| s.name == "UserMapper"));
-}
-
-#[test]
-fn java_exception_symbols() {
-    let syms = parse_file_symbols("java_simple", "UserNotFoundException.java");
-    assert!(syms.iter().any(|s| s.name == "UserNotFoundException"));
-}
-
-#[test]
-fn java_dto_symbols() {
-    let syms = parse_file_symbols("java_simple", "UserDto.java");
-    assert!(syms.iter().any(|s| s.name == "UserDto"));
+symbol_name_tests! {
+    java_service_symbols: JAVA_SIMPLE, "UserService.java", ["UserService"];
+    java_model_symbols: JAVA_SIMPLE, "User.java", ["User"];
+    java_mapper_symbols: JAVA_SIMPLE, "UserMapper.java", ["UserMapper"];
+    java_exception_symbols: JAVA_SIMPLE, "UserNotFoundException.java", ["UserNotFoundException"];
+    java_dto_symbols: JAVA_SIMPLE, "UserDto.java", ["UserDto"];
+    java_repository_impl_symbols: JAVA_SIMPLE, "InMemoryUserRepository.java", ["InMemoryUserRepository"];
 }
 
 #[test]
 fn java_file_attribute() {
-    let syms = parse_file_symbols("java_simple", "UserController.java");
+    let syms = parse_file_symbols(JAVA_SIMPLE, "UserController.java");
     for sym in &syms {
         assert_eq!(sym.file, "UserController.java");
     }
@@ -665,7 +536,7 @@ fn java_file_attribute() {
 
 #[test]
 fn java_fixture_e2e() {
-    let r = run_two_phases("java_simple");
+    let r = shared_two_phases(JAVA_SIMPLE);
     let count = r.kg.symbol_count();
     assert!(
         count >= 10,
@@ -673,27 +544,21 @@ fn java_fixture_e2e() {
     );
 }
 
-#[test]
-fn java_repository_impl_symbols() {
-    let syms = parse_file_symbols("java_simple", "InMemoryUserRepository.java");
-    assert!(syms.iter().any(|s| s.name == "InMemoryUserRepository"));
-}
-
 #[test]
 fn java_service_imports() {
-    let imports = parse_file_imports("java_simple", "UserService.java");
+    let imports = import_target_names(JAVA_SIMPLE, "UserService.java");
     assert!(!imports.is_empty());
 }
 
 #[test]
 fn java_service_calls() {
-    let calls = parse_file_calls("java_simple", "UserService.java");
+    let calls = call_names(JAVA_SIMPLE, "UserService.java");
     assert!(!calls.is_empty());
 }
 
 #[test]
 fn java_controller_methods() {
-    let syms = parse_file_symbols("java_simple", "UserController.java");
+    let syms = parse_file_symbols(JAVA_SIMPLE, "UserController.java");
     let method_names: Vec<_> = syms
         .iter()
         .filter(|s| s.symbol_type == SymbolType::Method)
@@ -707,51 +572,16 @@ fn java_controller_methods() {
 // Go analyser (23 tests)
 // ===========================================================================
 
-#[test]
-fn go_extracts_functions() {
-    let syms = parse_file_symbols("go_simple", "handler.go");
-    let funcs: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Function)
-        .collect();
-    assert!(!funcs.is_empty(), "Should extract Go functions");
-}
-
-#[test]
-fn go_extracts_structs() {
-    let syms = parse_file_symbols("go_simple", "handler.go");
-    let structs: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Struct)
-        .collect();
-    assert!(!structs.is_empty(), "Should extract Go structs");
-    assert!(structs.iter().any(|s| s.name == "Handler"));
-}
-
-#[test]
-fn go_extracts_interfaces() {
-    let syms = parse_file_symbols("go_simple", "repository.go");
-    let ifaces: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Interface)
-        .collect();
-    assert!(!ifaces.is_empty(), "Should extract Go interfaces");
-    assert!(ifaces.iter().any(|s| s.name == "Repository"));
-}
-
-#[test]
-fn go_extracts_methods() {
-    let syms = parse_file_symbols("go_simple", "service.go");
-    let methods: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Method)
-        .collect();
-    assert!(!methods.is_empty(), "Should extract Go methods");
+symbol_type_tests! {
+    go_extracts_functions: GO_SIMPLE, "handler.go", Function, [];
+    go_extracts_structs: GO_SIMPLE, "handler.go", Struct, ["Handler"];
+    go_extracts_interfaces: GO_SIMPLE, "repository.go", Interface, ["Repository"];
+    go_extracts_methods: GO_SIMPLE, "service.go", Method, [];
 }
 
 #[test]
 fn go_export_by_capitalisation() {
-    let syms = parse_file_symbols("go_simple", "handler.go");
+    let syms = parse_file_symbols(GO_SIMPLE, "handler.go");
     // HandleGet, HandleCreate etc. should be exported (uppercase)
     let exported: Vec<_> = syms.iter().filter(|s| s.exported).collect();
     assert!(!exported.is_empty(), "Uppercase names should be exported");
@@ -766,9 +596,9 @@ fn go_export_by_capitalisation() {
 
 #[test]
 fn go_private_lowercase() {
-    let syms = parse_file_symbols("go_simple", "handler.go");
+    let index = symbol_index(GO_SIMPLE, "handler.go");
     // main function should be private (lowercase)
-    if let Some(main_fn) = syms.iter().find(|s| s.name == "main") {
+    if let Some(main_fn) = index.find("main") {
         assert_eq!(main_fn.visibility, Visibility::Private);
         assert!(!main_fn.exported);
     }
@@ -776,7 +606,7 @@ fn go_private_lowercase() {
 
 #[test]
 fn go_line_numbers() {
-    let syms = parse_file_symbols("go_simple", "handler.go");
+    let syms = parse_file_symbols(GO_SIMPLE, "handler.go");
     for sym in &syms {
         assert!(sym.line > 0, "Line numbers should be > 0 for {}", sym.name);
     }
@@ -784,7 +614,7 @@ fn go_line_numbers() {
 
 #[test]
 fn go_language_tag() {
-    let syms = parse_file_symbols("go_simple", "handler.go");
+    let syms = parse_file_symbols(GO_SIMPLE, "handler.go");
     for sym in &syms {
         assert_eq!(sym.language.as_deref(), Some("Go"));
     }
@@ -792,65 +622,52 @@ fn go_language_tag() {
 
 #[test]
 fn go_extracts_imports() {
-    let imports = parse_file_imports("go_simple", "handler.go");
+    let imports = import_target_names(GO_SIMPLE, "handler.go");
     assert!(!imports.is_empty(), "Should extract Go imports");
 }
 
 #[test]
 fn go_extracts_calls() {
-    let calls = parse_file_calls("go_simple", "handler.go");
+    let calls = call_names(GO_SIMPLE, "handler.go");
     assert!(!calls.is_empty(), "Should extract Go calls");
 }
 
 #[test]
 fn go_builtin_exclusions() {
-    let registry = mycelium_core::languages::AnalyserRegistry::new();
-    let analyser = registry.get_by_extension("go").unwrap();
+    let analyser = analyser("go");
     let builtins = analyser.builtin_exclusions();
-    assert!(builtins.contains(&"fmt.Println".to_string()));
-    assert!(builtins.contains(&"len".to_string()));
+    assert!(builtins.contains("fmt.Println"));
+    assert!(builtins.contains("len"));
 }
 
 #[test]
 fn go_model_structs() {
-    let syms = parse_file_symbols("go_simple", "model.go");
-    assert!(syms.iter().any(|s| s.name == "Item"));
-    assert!(syms
-        .iter()
-        .any(|s| s.name == "ItemFilter" || s.name == "PaginatedResult"));
+    let index = symbol_index(GO_SIMPLE, "model.go");
+    assert!(index.contains("Item"));
+    assert!(index.contains("ItemFilter") || index.contains("PaginatedResult"));
 }
 
-#[test]
-fn go_service_structs() {
-    let syms = parse_file_symbols("go_simple", "service.go");
-    assert!(syms.iter().any(|s| s.name == "DataService"));
-}
-
-#[test]
-fn go_repository_types() {
-    let syms = parse_file_symbols("go_simple", "repository.go");
-    assert!(syms.iter().any(|s| s.name == "InMemoryRepository"));
-}
-
-#[test]
-fn go_middleware_symbols() {
-    let syms = parse_file_symbols("go_simple", "middleware.go");
-    assert!(syms.iter().any(|s| s.name == "Logger"));
+symbol_name_tests! {
+    go_service_structs: GO_SIMPLE, "service.go", ["DataService"];
+    go_repository_types: GO_SIMPLE, "repository.go", ["InMemoryRepository"];
+    go_middleware_symbols: GO_SIMPLE, "middleware.go", ["Logger"];
+    go_new_data_service: GO_SIMPLE, "service.go", ["NewDataService"];
+    go_model_new_item: GO_SIMPLE, "model.go", ["NewItem"];
 }
 
 #[test]
 fn go_constructor_pattern() {
-    let syms = parse_file_symbols("go_simple", "handler.go");
+    let index = symbol_index(GO_SIMPLE, "handler.go");
     // Go uses New* convention for constructors
     assert!(
-        syms.iter().any(|s| s.name == "NewHandler"),
+        index.contains("NewHandler"),
         "Should extract Go constructor pattern (NewHandler)"
     );
 }
 
 #[test]
 fn go_file_attribute() {
-    let syms = parse_file_symbols("go_simple", "handler.go");
+    let syms = parse_file_symbols(GO_SIMPLE, "handler.go");
     for sym in &syms {
         assert_eq!(sym.file, "handler.go");
     }
@@ -858,7 +675,7 @@ fn go_file_attribute() {
 
 #[test]
 fn go_fixture_e2e() {
-    let r = run_two_phases("go_simple");
+    let r = shared_two_phases(GO_SIMPLE);
     let count = r.kg.symbol_count();
     assert!(
         count >= 10,
@@ -868,105 +685,48 @@ fn go_fixture_e2e() {
 
 #[test]
 fn go_service_imports() {
-    let imports = parse_file_imports("go_simple", "service.go");
+    let imports = parse_file_imports(GO_SIMPLE, "service.go");
     // service.go imports model
     let _ = imports;
 }
 
 #[test]
 fn go_handler_calls() {
-    let calls = parse_file_calls("go_simple", "handler.go");
+    let calls = call_names(GO_SIMPLE, "handler.go");
     assert!(!calls.is_empty());
 }
 
-#[test]
-fn go_new_data_service() {
-    let syms = parse_file_symbols("go_simple", "service.go");
-    assert!(syms.iter().any(|s| s.name == "NewDataService"));
-}
-
 #[test]
 fn go_exported_struct_public() {
-    let syms = parse_file_symbols("go_simple", "model.go");
-    let item = syms.iter().find(|s| s.name == "Item").unwrap();
+    let index = symbol_index(GO_SIMPLE, "model.go");
+    let item = index.find("Item").unwrap();
     assert_eq!(item.visibility, Visibility::Public);
     assert!(item.exported);
 }
 
-#[test]
-fn go_model_new_item() {
-    let syms = parse_file_symbols("go_simple", "model.go");
-    assert!(syms.iter().any(|s| s.name == "NewItem"));
-}
-
 // ===========================================================================
 // Rust analyser (22 tests)
 // ===========================================================================
 
-#[test]
-fn rust_extracts_functions() {
-    let syms = parse_file_symbols("rust_simple", "main.rs");
-    let funcs: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Function)
-        .collect();
-    assert!(!funcs.is_empty(), "Should extract Rust functions");
-}
-
-#[test]
-fn rust_extracts_structs() {
-    let syms = parse_file_symbols("rust_simple", "main.rs");
-    let structs: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Struct)
-        .collect();
-    assert!(!structs.is_empty(), "Should extract Rust structs");
-    assert!(structs.iter().any(|s| s.name == "Handler"));
-}
-
-#[test]
-fn rust_extracts_enums() {
-    let syms = parse_file_symbols("rust_simple", "error.rs");
-    let enums: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Enum)
-        .collect();
-    assert!(!enums.is_empty(), "Should extract Rust enums");
-    assert!(enums.iter().any(|s| s.name == "AppError"));
-}
-
-#[test]
-fn rust_extracts_traits() {
-    let syms = parse_file_symbols("rust_simple", "service.rs");
-    let traits: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Trait)
-        .collect();
-    assert!(!traits.is_empty(), "Should extract Rust traits");
-    assert!(traits.iter().any(|s| s.name == "Repository"));
-}
-
-#[test]
-fn rust_extracts_impl_blocks() {
-    let syms = parse_file_symbols("rust_simple", "service.rs");
-    let impls: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Impl)
-        .collect();
-    assert!(!impls.is_empty(), "Should extract Rust impl blocks");
+symbol_type_tests! {
+    rust_extracts_functions: RUST_SIMPLE, "main.rs", Function, [];
+    rust_extracts_structs: RUST_SIMPLE, "main.rs", Struct, ["Handler"];
+    rust_extracts_enums: RUST_SIMPLE, "error.rs", Enum, ["AppError"];
+    rust_extracts_traits: RUST_SIMPLE, "service.rs", Trait, ["Repository"];
+    rust_extracts_impl_blocks: RUST_SIMPLE, "service.rs", Impl, [];
 }
 
 #[test]
 fn rust_pub_visibility() {
-    let syms = parse_file_symbols("rust_simple", "model.rs");
-    let item = syms.iter().find(|s| s.name == "Item").unwrap();
+    let index = symbol_index(RUST_SIMPLE, "model.rs");
+    let item = index.find("Item").unwrap();
     assert_eq!(item.visibility, Visibility::Public);
     assert!(item.exported);
 }
 
 #[test]
 fn rust_private_visibility() {
-    let syms = parse_file_symbols("rust_simple", "service.rs");
+    let syms = parse_file_symbols(RUST_SIMPLE, "service.rs");
     let private: Vec<_> = syms
         .iter()
         .filter(|s| s.visibility == Visibility::Private)
@@ -976,7 +736,7 @@ fn rust_private_visibility() {
 
 #[test]
 fn rust_line_numbers() {
-    let syms = parse_file_symbols("rust_simple", "main.rs");
+    let syms = parse_file_symbols(RUST_SIMPLE, "main.rs");
     for sym in &syms {
         assert!(sym.line > 0, "Line numbers should be > 0 for {}", sym.name);
     }
@@ -984,7 +744,7 @@ fn rust_line_numbers() {
 
 #[test]
 fn rust_language_tag() {
-    let syms = parse_file_symbols("rust_simple", "main.rs");
+    let syms = parse_file_symbols(RUST_SIMPLE, "main.rs");
     for sym in &syms {
         assert_eq!(sym.language.as_deref(), Some("Rust"));
     }
@@ -992,54 +752,34 @@ fn rust_language_tag() {
 
 #[test]
 fn rust_extracts_imports() {
-    let imports = parse_file_imports("rust_simple", "main.rs");
+    let imports = import_target_names(RUST_SIMPLE, "main.rs");
     assert!(!imports.is_empty(), "Should extract Rust use declarations");
 }
 
 #[test]
 fn rust_extracts_calls() {
-    let calls = parse_file_calls("rust_simple", "main.rs");
+    let calls = call_names(RUST_SIMPLE, "main.rs");
     assert!(!calls.is_empty(), "Should extract Rust calls");
 }
 
 #[test]
 fn rust_builtin_exclusions() {
-    let registry = mycelium_core::languages::AnalyserRegistry::new();
-    let analyser = registry.get_by_extension("rs").unwrap();
+    let analyser = analyser("rs");
     let builtins = analyser.builtin_exclusions();
-    assert!(
-        builtins.contains(&"println!".to_string()) || builtins.contains(&"println".to_string())
-    );
-}
-
-#[test]
-fn rust_model_symbols() {
-    let syms = parse_file_symbols("rust_simple", "model.rs");
-    assert!(syms.iter().any(|s| s.name == "Item"));
-    assert!(syms.iter().any(|s| s.name == "ItemFilter"));
-}
-
-#[test]
-fn rust_service_symbols() {
-    let syms = parse_file_symbols("rust_simple", "service.rs");
-    assert!(syms.iter().any(|s| s.name == "DataService"));
-}
-
-#[test]
-fn rust_repository_symbols() {
-    let syms = parse_file_symbols("rust_simple", "repository.rs");
-    assert!(syms.iter().any(|s| s.name == "InMemoryRepository"));
+    assert!(builtins.contains("println!") || builtins.contains("println"));
 }
 
-#[test]
-fn rust_error_symbols() {
-    let syms = parse_file_symbols("rust_simple", "error.rs");
-    assert!(syms.iter().any(|s| s.name == "AppError"));
+symbol_name_tests! {
+    rust_model_symbols: RUST_SIMPLE, "model.rs", ["Item", "ItemFilter"];
+    rust_service_symbols: RUST_SIMPLE, "service.rs", ["DataService"];
+    rust_repository_symbols: RUST_SIMPLE, "repository.rs", ["InMemoryRepository"];
+    rust_error_symbols: RUST_SIMPLE, "error.rs", ["AppError"];
+    rust_main_fn: RUST_SIMPLE, "main.rs", ["main"];
 }
 
 #[test]
 fn rust_file_attribute() {
-    let syms = parse_file_symbols("rust_simple", "main.rs");
+    let syms = parse_file_symbols(RUST_SIMPLE, "main.rs");
     for sym in &syms {
         assert_eq!(sym.file, "main.rs");
     }
@@ -1047,7 +787,7 @@ fn rust_file_attribute() {
 
 #[test]
 fn rust_fixture_e2e() {
-    let r = run_two_phases("rust_simple");
+    let r = shared_two_phases(RUST_SIMPLE);
     let count = r.kg.symbol_count();
     assert!(
         count >= 10,
@@ -1057,7 +797,7 @@ fn rust_fixture_e2e() {
 
 #[test]
 fn rust_impl_methods() {
-    let syms = parse_file_symbols("rust_simple", "service.rs");
+    let syms = parse_file_symbols(RUST_SIMPLE, "service.rs");
     let methods: Vec<_> = syms
         .iter()
         .filter(|s| s.symbol_type == SymbolType::Function && s.parent.is_some())
@@ -1065,21 +805,15 @@ fn rust_impl_methods() {
     assert!(!methods.is_empty(), "Impl methods should have parent");
 }
 
-#[test]
-fn rust_main_fn() {
-    let syms = parse_file_symbols("rust_simple", "main.rs");
-    assert!(syms.iter().any(|s| s.name == "main"));
-}
-
 #[test]
 fn rust_service_calls() {
-    let calls = parse_file_calls("rust_simple", "service.rs");
+    let calls = call_names(RUST_SIMPLE, "service.rs");
     let _ = calls;
 }
 
 #[test]
 fn rust_use_declarations() {
-    let imports = parse_file_imports("rust_simple", "service.rs");
+    let imports = import_target_names(RUST_SIMPLE, "service.rs");
     let _ = imports;
 }
 
@@ -1087,20 +821,13 @@ fn rust_use_declarations() {
 // C analyser (24 tests)
 // ===========================================================================
 
-#[test]
-fn c_extracts_functions() {
-    let syms = parse_file_symbols("c_simple", "main.c");
-    let funcs: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Function)
-        .collect();
-    assert!(!funcs.is_empty(), "Should extract C functions");
-    assert!(funcs.iter().any(|s| s.name == "main"));
+symbol_type_tests! {
+    c_extracts_functions: C_SIMPLE, "main.c", Function, ["main"];
 }
 
 #[test]
 fn c_extracts_structs() {
-    let syms = parse_file_symbols("c_simple", "service.h");
+    let syms = parse_file_symbols(C_SIMPLE, "service.h");
     let structs_or_typedefs: Vec<_> = syms
         .iter()
         .filter(|s| s.symbol_type == SymbolType::Struct || s.symbol_type == SymbolType::Typedef)
@@ -1113,7 +840,7 @@ fn c_extracts_structs() {
 
 #[test]
 fn c_extracts_enums() {
-    let syms = parse_file_symbols("c_simple", "service.h");
+    let syms = parse_file_symbols(C_SIMPLE, "service.h");
     let enums: Vec<_> = syms
         .iter()
         .filter(|s| s.symbol_type == SymbolType::Enum || s.name == "ItemStatus")
@@ -1123,7 +850,7 @@ fn c_extracts_enums() {
 
 #[test]
 fn c_all_public() {
-    let syms = parse_file_symbols("c_simple", "main.c");
+    let syms = parse_file_symbols(C_SIMPLE, "main.c");
     for sym in &syms {
         assert_eq!(
             sym.visibility,
@@ -1136,7 +863,7 @@ fn c_all_public() {
 
 #[test]
 fn c_all_exported() {
-    let syms = parse_file_symbols("c_simple", "main.c");
+    let syms = parse_file_symbols(C_SIMPLE, "main.c");
     for sym in &syms {
         assert!(
             sym.exported,
@@ -1148,7 +875,7 @@ fn c_all_exported() {
 
 #[test]
 fn c_line_numbers() {
-    let syms = parse_file_symbols("c_simple", "main.c");
+    let syms = parse_file_symbols(C_SIMPLE, "main.c");
     for sym in &syms {
         assert!(sym.line > 0, "Line numbers should be > 0 for {}", sym.name);
     }
@@ -1156,7 +883,7 @@ fn c_line_numbers() {
 
 #[test]
 fn c_language_tag() {
-    let syms = parse_file_symbols("c_simple", "main.c");
+    let syms = parse_file_symbols(C_SIMPLE, "main.c");
     for sym in &syms {
         assert_eq!(sym.language.as_deref(), Some("C"));
     }
@@ -1164,79 +891,74 @@ fn c_language_tag() {
 
 #[test]
 fn c_extracts_imports() {
-    let imports = parse_file_imports("c_simple", "main.c");
+    let imports = import_target_names(C_SIMPLE, "main.c");
     assert!(!imports.is_empty(), "Should extract C #include statements");
 }
 
 #[test]
 fn c_extracts_calls() {
-    let calls = parse_file_calls("c_simple", "main.c");
+    let calls = call_names(C_SIMPLE, "main.c");
     assert!(!calls.is_empty(), "Should extract C function calls");
 }
 
 #[test]
 fn c_builtin_exclusions() {
-    let registry = mycelium_core::languages::AnalyserRegistry::new();
-    let analyser = registry.get_by_extension("c").unwrap();
+    let analyser = analyser("c");
     let builtins = analyser.builtin_exclusions();
-    assert!(builtins.contains(&"printf".to_string()));
-    assert!(builtins.contains(&"malloc".to_string()));
+    assert!(builtins.contains("printf"));
+    assert!(builtins.contains("malloc"));
 }
 
 #[test]
 fn c_header_functions() {
-    let syms = parse_file_symbols("c_simple", "service.h");
+    let syms = parse_file_symbols(C_SIMPLE, "service.h");
     // Headers should declare function prototypes
     assert!(!syms.is_empty(), "Should extract declarations from headers");
 }
 
 #[test]
 fn c_implementation_functions() {
-    let syms = parse_file_symbols("c_simple", "service.c");
+    let syms = parse_file_symbols(C_SIMPLE, "service.c");
     assert!(!syms.is_empty(), "Should extract functions from .c files");
 }
 
 #[test]
 fn c_types_header() {
-    let syms = parse_file_symbols("c_simple", "types.h");
+    let syms = parse_file_symbols(C_SIMPLE, "types.h");
     assert!(!syms.is_empty(), "Should extract from types.h");
 }
 
 #[test]
 fn c_types_impl() {
-    let syms = parse_file_symbols("c_simple", "types.c");
+    let syms = parse_file_symbols(C_SIMPLE, "types.c");
     assert!(!syms.is_empty(), "Should extract from types.c");
 }
 
 #[test]
 fn c_repository_header() {
-    let syms = parse_file_symbols("c_simple", "repository.h");
+    let syms = parse_file_symbols(C_SIMPLE, "repository.h");
     assert!(!syms.is_empty(), "Should extract from repository.h");
 }
 
 #[test]
 fn c_repository_impl() {
-    let syms = parse_file_symbols("c_simple", "repository.c");
+    let syms = parse_file_symbols(C_SIMPLE, "repository.c");
     assert!(!syms.is_empty(), "Should extract from repository.c");
 }
 
-#[test]
-fn c_main_function() {
-    let syms = parse_file_symbols("c_simple", "main.c");
-    assert!(syms.iter().any(|s| s.name == "main"));
+symbol_name_tests! {
+    c_main_function: C_SIMPLE, "main.c", ["main"];
 }
 
 #[test]
 fn c_handle_functions() {
-    let syms = parse_file_symbols("c_simple", "main.c");
-    assert!(syms
-        .iter()
-        .any(|s| s.name == "handle_request" || s.name == "handle_create"));
+    let index = symbol_index(C_SIMPLE, "main.c");
+    assert!(index.contains("handle_request") || index.contains("handle_create"));
 }
 
 #[test]
 fn c_include_local() {
-    let imports = parse_file_imports("c_simple", "main.c");
+    let imports = parse_file_imports(C_SIMPLE, "main.c");
     assert!(
         imports.iter().any(|i| i.statement.contains("service.h")),
         "Should include local headers"
@@ -1245,7 +967,7 @@ fn c_include_local() {
 
 #[test]
 fn c_file_attribute() {
-    let syms = parse_file_symbols("c_simple", "main.c");
+    let syms = parse_file_symbols(C_SIMPLE, "main.c");
     for sym in &syms {
         assert_eq!(sym.file, "main.c");
     }
@@ -1253,7 +975,7 @@ fn c_file_attribute() {
 
 #[test]
 fn c_fixture_e2e() {
-    let r = run_two_phases("c_simple");
+    let r = shared_two_phases(C_SIMPLE);
     let count = r.kg.symbol_count();
     assert!(
         count >= 5,
@@ -1263,20 +985,20 @@ fn c_fixture_e2e() {
 
 #[test]
 fn c_extensions() {
-    let registry = mycelium_core::languages::AnalyserRegistry::new();
+    let registry = registry();
     assert!(registry.get_by_extension("c").is_some());
     assert!(registry.get_by_extension("h").is_some());
 }
 
 #[test]
 fn c_service_calls() {
-    let calls = parse_file_calls("c_simple", "service.c");
+    let calls = call_names(C_SIMPLE, "service.c");
     let _ = calls;
 }
 
 #[test]
 fn c_header_language_tag() {
-    let syms = parse_file_symbols("c_simple", "service.h");
+    let syms = parse_file_symbols(C_SIMPLE, "service.h");
     for sym in &syms {
         assert_eq!(sym.language.as_deref(), Some("C"));
     }
@@ -1286,61 +1008,17 @@ fn c_header_language_tag() {
 // C++ analyser (18 tests)
 // ===========================================================================
 
-#[test]
-fn cpp_extracts_classes() {
-    let syms = parse_file_symbols("cpp_simple", "service.hpp");
-    let classes: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Class)
-        .collect();
-    assert!(!classes.is_empty(), "Should extract C++ classes");
-    assert!(classes.iter().any(|s| s.name == "DataService"));
-}
-
-#[test]
-fn cpp_extracts_namespaces() {
-    let syms = parse_file_symbols("cpp_simple", "handler.cpp");
-    let namespaces: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Namespace)
-        .collect();
-    assert!(!namespaces.is_empty(), "Should extract C++ namespaces");
-}
-
-#[test]
-fn cpp_extracts_functions() {
-    let syms = parse_file_symbols("cpp_simple", "main.cpp");
-    let funcs: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Function)
-        .collect();
-    assert!(!funcs.is_empty(), "Should extract C++ functions");
-}
-
-#[test]
-fn cpp_extracts_structs() {
-    let syms = parse_file_symbols("cpp_simple", "models.hpp");
-    let structs: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Struct)
-        .collect();
-    assert!(!structs.is_empty(), "Should extract C++ structs");
-}
-
-#[test]
-fn cpp_extracts_enums() {
-    let syms = parse_file_symbols("cpp_simple", "service.hpp");
-    let enums: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Enum)
-        .collect();
-    assert!(!enums.is_empty(), "Should extract C++ enums");
-    assert!(enums.iter().any(|s| s.name == "Status"));
+symbol_type_tests! {
+    cpp_extracts_classes: CPP_SIMPLE, "service.hpp", Class, ["DataService"];
+    cpp_extracts_namespaces: CPP_SIMPLE, "handler.cpp", Namespace, [];
+    cpp_extracts_functions: CPP_SIMPLE, "main.cpp", Function, [];
+    cpp_extracts_structs: CPP_SIMPLE, "models.hpp", Struct, [];
+    cpp_extracts_enums: CPP_SIMPLE, "service.hpp", Enum, ["Status"];
 }
 
 #[test]
 fn cpp_all_public() {
-    let syms = parse_file_symbols("cpp_simple", "handler.cpp");
+    let syms = parse_file_symbols(CPP_SIMPLE, "handler.cpp");
     for sym in &syms {
         assert_eq!(
             sym.visibility,
@@ -1353,7 +1031,7 @@ fn cpp_all_public() {
 
 #[test]
 fn cpp_line_numbers() {
-    let syms = parse_file_symbols("cpp_simple", "handler.cpp");
+    let syms = parse_file_symbols(CPP_SIMPLE, "handler.cpp");
     for sym in &syms {
         assert!(sym.line > 0, "Line numbers should be > 0 for {}", sym.name);
     }
@@ -1361,7 +1039,7 @@ fn cpp_line_numbers() {
 
 #[test]
 fn cpp_language_tag() {
-    let syms = parse_file_symbols("cpp_simple", "handler.cpp");
+    let syms = parse_file_symbols(CPP_SIMPLE, "handler.cpp");
     for sym in &syms {
         assert_eq!(sym.language.as_deref(), Some("C++"));
     }
@@ -1369,7 +1047,7 @@ fn cpp_language_tag() {
 
 #[test]
 fn cpp_extracts_imports() {
-    let imports = parse_file_imports("cpp_simple", "handler.cpp");
+    let imports = import_target_names(CPP_SIMPLE, "handler.cpp");
     assert!(
         !imports.is_empty(),
         "Should extract C++ #include statements"
@@ -1378,42 +1056,34 @@ fn cpp_extracts_imports() {
 
 #[test]
 fn cpp_extracts_calls() {
-    let calls = parse_file_calls("cpp_simple", "handler.cpp");
+    let calls = call_names(CPP_SIMPLE, "handler.cpp");
     assert!(!calls.is_empty(), "Should extract C++ calls");
 }
 
 #[test]
 fn cpp_builtin_exclusions() {
-    let registry = mycelium_core::languages::AnalyserRegistry::new();
-    let analyser = registry.get_by_extension("cpp").unwrap();
+    let analyser = analyser("cpp");
     let builtins = analyser.builtin_exclusions();
-    assert!(builtins.contains(&"std::cout".to_string()));
-    assert!(builtins.contains(&"printf".to_string())); // inherits C builtins
+    assert!(builtins.contains("std::cout"));
+    assert!(builtins.contains("printf")); // inherits C builtins
 }
 
-#[test]
-fn cpp_handler_class() {
-    let syms = parse_file_symbols("cpp_simple", "handler.cpp");
-    assert!(syms.iter().any(|s| s.name == "Handler"));
-}
-
-#[test]
-fn cpp_repository_class() {
-    let syms = parse_file_symbols("cpp_simple", "repository.hpp");
-    assert!(syms.iter().any(|s| s.name == "ItemRepository"));
+symbol_name_tests! {
+    cpp_handler_class: CPP_SIMPLE, "handler.cpp", ["Handler"];
+    cpp_repository_class: CPP_SIMPLE, "repository.hpp", ["ItemRepository"];
 }
 
 #[test]
 fn cpp_model_structs() {
-    let syms = parse_file_symbols("cpp_simple", "service.hpp");
-    assert!(syms.iter().any(|s| s.name == "ItemRecord"));
-    let model_syms = parse_file_symbols("cpp_simple", "models.hpp");
-    assert!(model_syms.iter().any(|s| s.name == "AppConfig"));
+    let index = symbol_index(CPP_SIMPLE, "service.hpp");
+    assert!(index.contains("ItemRecord"));
+    let model_index = symbol_index(CPP_SIMPLE, "models.hpp");
+    assert!(model_index.contains("AppConfig"));
 }
 
 #[test]
 fn cpp_extensions() {
-    let registry = mycelium_core::languages::AnalyserRegistry::new();
+    let registry = registry();
     assert!(registry.get_by_extension("cpp").is_some());
     assert!(registry.get_by_extension("hpp").is_some());
     assert!(registry.get_by_extension("cc").is_some());
@@ -1422,7 +1092,7 @@ fn cpp_extensions() {
 
 #[test]
 fn cpp_file_attribute() {
-    let syms = parse_file_symbols("cpp_simple", "handler.cpp");
+    let syms = parse_file_symbols(CPP_SIMPLE, "handler.cpp");
     for sym in &syms {
         assert_eq!(sym.file, "handler.cpp");
     }
@@ -1430,7 +1100,7 @@ fn cpp_file_attribute() {
 
 #[test]
 fn cpp_fixture_e2e() {
-    let r = run_two_phases("cpp_simple");
+    let r = shared_two_phases(CPP_SIMPLE);
     let count = r.kg.symbol_count();
     assert!(
         count >= 5,
@@ -1440,7 +1110,7 @@ fn cpp_fixture_e2e() {
 
 #[test]
 fn cpp_main_functions() {
-    let syms = parse_file_symbols("cpp_simple", "main.cpp");
+    let syms = parse_file_symbols(CPP_SIMPLE, "main.cpp");
     let names: Vec<_> = syms.iter().map(|s| s.name.as_str()).collect();
     assert!(
         names.contains(&"printUsage") || names.contains(&"runApp") || names.contains(&"main"),
@@ -1454,7 +1124,7 @@ fn cpp_main_functions() {
 
 #[test]
 fn vbnet_analyser_available() {
-    let registry = mycelium_core::languages::AnalyserRegistry::new();
+    let registry = registry();
     assert!(
         registry.get_by_extension("vb").is_some(),
         "VB.NET analyser should be registered"
@@ -1463,97 +1133,21 @@ fn vbnet_analyser_available() {
     assert!(analyser.is_available());
 }
 
-#[test]
-fn vbnet_extracts_classes() {
-    let syms = parse_file_symbols("vbnet_simple", "Calculator.vb");
-    let classes: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Class)
-        .collect();
-    assert!(!classes.is_empty(), "Should extract VB.NET classes");
-    assert!(classes.iter().any(|s| s.name == "Calculator"));
-}
-
-#[test]
-fn vbnet_extracts_interfaces() {
-    let syms = parse_file_symbols("vbnet_simple", "Calculator.vb");
-    let ifaces: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Interface)
-        .collect();
-    assert!(!ifaces.is_empty(), "Should extract VB.NET interfaces");
-    assert!(ifaces.iter().any(|s| s.name == "ICalculator"));
-}
-
-#[test]
-fn vbnet_extracts_enums() {
-    let syms = parse_file_symbols("vbnet_simple", "Calculator.vb");
-    let enums: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Enum)
-        .collect();
-    assert!(!enums.is_empty(), "Should extract VB.NET enums");
-    assert!(enums.iter().any(|s| s.name == "OperationType"));
-}
-
-#[test]
-fn vbnet_extracts_structs() {
-    let syms = parse_file_symbols("vbnet_simple", "Calculator.vb");
-    let structs: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Struct)
-        .collect();
-    assert!(!structs.is_empty(), "Should extract VB.NET structures");
-    assert!(structs.iter().any(|s| s.name == "CalculationResult"));
-}
-
-#[test]
-fn vbnet_extracts_modules() {
-    let syms = parse_file_symbols("vbnet_simple", "Calculator.vb");
-    let modules: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Module)
-        .collect();
-    assert!(!modules.is_empty(), "Should extract VB.NET modules");
-    assert!(modules.iter().any(|s| s.name == "MathHelpers"));
-}
-
-#[test]
-fn vbnet_extracts_methods() {
-    let syms = parse_file_symbols("vbnet_simple", "Calculator.vb");
-    let methods: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Method)
-        .collect();
-    assert!(!methods.is_empty(), "Should extract VB.NET methods");
-    assert!(methods.iter().any(|s| s.name == "Calculate"));
-}
-
-#[test]
-fn vbnet_extracts_delegates() {
-    let syms = parse_file_symbols("vbnet_simple", "Calculator.vb");
-    let delegates: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Delegate)
-        .collect();
-    assert!(!delegates.is_empty(), "Should extract VB.NET delegates");
-    assert!(delegates.iter().any(|s| s.name == "OperationCompleted"));
-}
-
-#[test]
-fn vbnet_extracts_namespace() {
-    let syms = parse_file_symbols("vbnet_simple", "Calculator.vb");
-    let ns: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == SymbolType::Namespace)
-        .collect();
-    assert!(!ns.is_empty(), "Should extract VB.NET namespaces");
+symbol_type_tests! {
+    vbnet_extracts_classes: VBNET_SIMPLE, "Calculator.vb", Class, ["Calculator"];
+    vbnet_extracts_interfaces: VBNET_SIMPLE, "Calculator.vb", Interface, ["ICalculator"];
+    vbnet_extracts_enums: VBNET_SIMPLE, "Calculator.vb", Enum, ["OperationType"];
+    vbnet_extracts_structs: VBNET_SIMPLE, "Calculator.vb", Struct, ["CalculationResult"];
+    vbnet_extracts_modules: VBNET_SIMPLE, "Calculator.vb", Module, ["MathHelpers"];
+    vbnet_extracts_methods: VBNET_SIMPLE, "Calculator.vb", Method, ["Calculate"];
+    vbnet_extracts_delegates: VBNET_SIMPLE, "Calculator.vb", Delegate, ["OperationCompleted"];
+    vbnet_extracts_namespace: VBNET_SIMPLE, "Calculator.vb", Namespace, [];
 }
 
 #[test]
 fn vbnet_public_visibility() {
-    let syms = parse_file_symbols("vbnet_simple", "Calculator.vb");
-    let calculator = syms.iter().find(|s| s.name == "Calculator");
+    let index = symbol_index(VBNET_SIMPLE, "Calculator.vb");
+    let calculator = index.find("Calculator");
     assert!(calculator.is_some(), "Should find Calculator class");
     if let Some(calc) = calculator {
         assert_eq!(calc.visibility, Visibility::Public);
@@ -1563,7 +1157,7 @@ fn vbnet_public_visibility() {
 
 #[test]
 fn vbnet_private_visibility() {
-    let syms = parse_file_symbols("vbnet_simple", "Calculator.vb");
+    let syms = parse_file_symbols(VBNET_SIMPLE, "Calculator.vb");
     let private: Vec<_> = syms
         .iter()
         .filter(|s| s.visibility == Visibility::Private)
@@ -1573,7 +1167,7 @@ fn vbnet_private_visibility() {
 
 #[test]
 fn vbnet_friend_visibility() {
-    let syms = parse_file_symbols("vbnet_simple", "Calculator.vb");
+    let syms = parse_file_symbols(VBNET_SIMPLE, "Calculator.vb");
     let friend: Vec<_> = syms
         .iter()
         .filter(|s| s.visibility == Visibility::Internal)
@@ -1586,20 +1180,20 @@ fn vbnet_friend_visibility() {
 
 #[test]
 fn vbnet_extracts_imports() {
-    let imports = parse_file_imports("vbnet_simple", "Calculator.vb");
+    let targets = import_target_names(VBNET_SIMPLE, "Calculator.vb");
     assert!(
-        !imports.is_empty(),
+        !targets.is_empty(),
         "Should extract VB.NET Imports statements"
     );
     assert!(
-        imports.iter().any(|i| i.target_name.contains("System")),
+        targets.iter().any(|t| t.contains("System")),
         "Should import System"
     );
 }
 
 #[test]
 fn vbnet_language_tag() {
-    let syms = parse_file_symbols("vbnet_simple", "Calculator.vb");
+    let syms = parse_file_symbols(VBNET_SIMPLE, "Calculator.vb");
     for sym in &syms {
         assert_eq!(sym.language.as_deref(), Some("VB.NET"));
     }
@@ -1607,7 +1201,7 @@ fn vbnet_language_tag() {
 
 #[test]
 fn vbnet_line_numbers() {
-    let syms = parse_file_symbols("vbnet_simple", "Calculator.vb");
+    let syms = parse_file_symbols(VBNET_SIMPLE, "Calculator.vb");
     for sym in &syms {
         assert!(sym.line > 0, "Line numbers should be > 0 for {}", sym.name);
     }
@@ -1615,7 +1209,7 @@ fn vbnet_line_numbers() {
 
 #[test]
 fn vbnet_parent_tracking() {
-    let syms = parse_file_symbols("vbnet_simple", "Calculator.vb");
+    let syms = parse_file_symbols(VBNET_SIMPLE, "Calculator.vb");
     let methods_with_parent: Vec<_> = syms
         .iter()
         .filter(|s| s.symbol_type == SymbolType::Method && s.parent.is_some())
@@ -1628,7 +1222,7 @@ fn vbnet_parent_tracking() {
 
 #[test]
 fn vbnet_file_attribute() {
-    let syms = parse_file_symbols("vbnet_simple", "Calculator.vb");
+    let syms = parse_file_symbols(VBNET_SIMPLE, "Calculator.vb");
     for sym in &syms {
         assert_eq!(sym.file, "Calculator.vb");
     }
@@ -1636,16 +1230,15 @@ fn vbnet_file_attribute() {
 
 #[test]
 fn vbnet_builtin_exclusions() {
-    let registry = mycelium_core::languages::AnalyserRegistry::new();
-    let analyser = registry.get_by_extension("vb").unwrap();
+    let analyser = analyser("vb");
     let builtins = analyser.builtin_exclusions();
-    assert!(builtins.contains(&"Console.WriteLine".to_string()));
-    assert!(builtins.contains(&"CType".to_string()));
+    assert!(builtins.contains("Console.WriteLine"));
+    assert!(builtins.contains("CType"));
 }
 
 #[test]
 fn vbnet_fixture_e2e() {
-    let r = run_two_phases("vbnet_simple");
+    let r = shared_two_phases(VBNET_SIMPLE);
     let count = r.kg.symbol_count();
     assert!(
         count >= 5,
@@ -1654,21 +1247,23 @@ fn vbnet_fixture_e2e() {
 }
 
 // ===========================================================================
-// Registry tests (3 tests)
+// Registry tests (5 tests)
 // ===========================================================================
 
+/// Extensions every build of the registry must handle.
+const EXPECTED_EXTENSIONS: [&str; 14] = [
+    "cs", "vb", "ts", "tsx", "js", "jsx", "py", "java", "go", "rs", "c", "h", "cpp", "hpp",
+];
+
 #[test]
 fn registry_has_all_languages() {
     let registry = mycelium_core::languages::AnalyserRegistry::new();
-    let expected = vec![
-        "cs", "vb", "ts", "tsx", "js", "jsx", "py", "java", "go", "rs", "c", "h", "cpp", "hpp",
-    ];
-    for ext in expected {
-        assert!(
-            registry.get_by_extension(ext).is_some(),
-            "Registry should have analyser for .{ext}"
-        );
-    }
+    let registered: HashSet<&str> = registry.extensions().into_iter().collect();
+    let missing: Vec<_> = EXPECTED_EXTENSIONS
+        .iter()
+        .filter(|ext| !registered.contains(*ext))
+        .collect();
+    assert!(missing.is_empty(), "Extensions not registered: {missing:?}");
 }
 
 #[test]
@@ -1692,13 +1287,36 @@ fn registry_analysers_available() {
     }
 }
 
+#[test]
+fn registry_caches_language_per_extension() {
+    let registry = mycelium_core::languages::AnalyserRegistry::new();
+    for ext in registry.extensions() {
+        let analyser = registry.get_by_extension(ext).unwrap();
+        let cached = registry.language_for_ext(ext).unwrap();
+        assert_eq!(
+            cached.node_kind_count(),
+            analyser.get_language_for_ext(ext).node_kind_count(),
+            "Cached language for .{ext} should match the analyser's grammar"
+        );
+    }
+    assert!(registry.language_for_ext("xyz").is_none());
+}
+
+#[test]
+fn registry_shared_is_built_once() {
+    let first = mycelium_core::languages::AnalyserRegistry::shared();
+    let second = mycelium_core::languages::AnalyserRegistry::shared();
+    assert!(std::ptr::eq(first, second));
+    assert!(first.get_by_extension("rs").is_some());
+}
+
 // ===========================================================================
 // E2E per-language (7 tests)
 // ===========================================================================
 
 #[test]
 fn e2e_csharp_full_pipeline() {
-    let r = run_two_phases("csharp_simple");
+    let r = shared_two_phases(CSHARP_SIMPLE);
     let names = symbol_names(&r.kg);
     assert!(names.len() >= 20, "C# fixture should have many symbols");
     assert!(names.contains(&"AbsenceController".to_string()));
@@ -1706,58 +1324,50 @@ fn e2e_csharp_full_pipeline() {
 
 #[test]
 fn e2e_typescript_full_pipeline() {
-    let r = run_two_phases("typescript_simple");
-    let names = symbol_names(&r.kg);
-    assert!(!names.is_empty());
-    assert!(names
-        .iter()
-        .any(|n| n.contains("User") || n.contains("Controller")));
+    let r = shared_two_phases(TYPESCRIPT_SIMPLE);
+    assert!(r.kg.symbol_count() > 0);
+    assert!(has_symbol_containing(&r.kg, "User") || has_symbol_containing(&r.kg, "Controller"));
 }
 
 #[test]
 fn e2e_python_full_pipeline() {
-    let r = run_two_phases("python_simple");
-    let names = symbol_names(&r.kg);
-    assert!(!names.is_empty());
-    assert!(names
-        .iter()
-        .any(|n| n.contains("Handler") || n.contains("Service")));
+    let r = shared_two_phases(PYTHON_SIMPLE);
+    assert!(r.kg.symbol_count() > 0);
+    assert!(has_symbol_containing(&r.kg, "Handler") || has_symbol_containing(&r.kg, "Service"));
 }
 
 #[test]
 fn e2e_java_full_pipeline() {
-    let r = run_two_phases("java_simple");
-    let names = symbol_names(&r.kg);
-    assert!(!names.is_empty());
-    assert!(names.contains(&"UserController".to_string()));
+    let r = shared_two_phases(JAVA_SIMPLE);
+    assert!(r.kg.symbol_count() > 0);
+    assert!(has_symbol(&r.kg, "UserController"));
 }
 
 #[test]
 fn e2e_go_full_pipeline() {
-    let r = run_two_phases("go_simple");
+    let r = shared_two_phases(GO_SIMPLE);
     let names = symbol_names(&r.kg);
     assert!(!names.is_empty());
 }
 
 #[test]
 fn e2e_rust_full_pipeline() {
-    let r = run_two_phases("rust_simple");
+    let r = shared_two_phases(RUST_SIMPLE);
     let names = symbol_names(&r.kg);
     assert!(!names.is_empty());
 }
 
 #[test]
 fn e2e_vbnet_full_pipeline() {
-    let r = run_two_phases("vbnet_simple");
-    let names = symbol_names(&r.kg);
-    assert!(!names.is_empty());
-    assert!(names.iter().any(|n| n.contains("Calculator")));
+    let r = shared_two_phases(VBNET_SIMPLE);
+    assert!(r.kg.symbol_count() > 0);
+    assert!(has_symbol_containing(&r.kg, "Calculator"));
 }
 
 #[test]
 fn e2e_c_cpp_full_pipeline() {
-    let r_c = run_two_phases("c_simple");
-    let r_cpp = run_two_phases("cpp_simple");
+    let r_c = shared_two_phases(C_SIMPLE);
+    let r_cpp = shared_two_phases(CPP_SIMPLE);
     assert!(
         r_c.kg.symbol_count() > 0,
         "C fixture should produce symbols"
@@ -6,7 +6,7 @@ use common::*;
 
 #[test]
 fn namespace_index_populated_from_parsing() {
-    let r = run_two_phases("csharp_simple");
+    let r = run_two_phases(CSHARP_SIMPLE);
     // Parsing should register namespaces found in C# files — test by checking known namespace
     let files = r.ns_index.get_files_for_namespace("Absence");
     let files2 = r.ns_index.get_files_for_namespace("Absence.Controllers");
@@ -20,7 +20,7 @@ fn namespace_index_populated_from_parsing() {
 
 #[test]
 fn namespace_maps_to_files() {
-    let r = run_two_phases("csharp_simple");
+    let r = run_two_phases(CSHARP_SIMPLE);
     // Find C# files and check that they have namespace registrations
     let files = file_paths(&r.kg);
     let cs_files: Vec<_> = files.iter().filter(|f| f.ends_with(".cs")).collect();
@@ -40,7 +40,7 @@ fn namespace_maps_to_files() {
 
 #[test]
 fn namespace_file_lookup() {
-    let r = run_two_phases("csharp_simple");
+    let r = run_two_phases(CSHARP_SIMPLE);
     // Find a C# file with a namespace and verify round-trip
     let files = file_paths(&r.kg);
     for f in files.iter().filter(|f| f.ends_with(".cs")) {
@@ -61,7 +61,7 @@ fn namespace_file_lookup() {
 
 #[test]
 fn namespace_reverse_lookup() {
-    let r = run_two_phases("csharp_simple");
+    let r = run_two_phases(CSHARP_SIMPLE);
     let files = file_paths(&r.kg);
     let cs_file = files.iter().find(|f| f.ends_with(".cs"));
     if let Some(cs_file) = cs_file {
@@ -76,7 +76,7 @@ fn namespace_reverse_lookup() {
 
 #[test]
 fn namespace_imports_tracked() {
-    let r = run_three_phases("csharp_simple");
+    let r = run_three_phases(CSHARP_SIMPLE);
     // After imports phase, file imports should be tracked
     let files = file_paths(&r.kg);
     let cs_files: Vec<_> = files.iter().filter(|f| f.ends_with(".cs")).collect();
@@ -96,7 +96,7 @@ fn namespace_imports_tracked() {
 
 #[test]
 fn namespace_mixed_dotnet() {
-    let r = run_two_phases("mixed_dotnet");
+    let r = run_two_phases(MIXED_DOTNET);
     // mixed_dotnet has C# files with namespaces
     let files = file_paths(&r.kg);
     let cs_files: Vec<_> = files.iter().filter(|f| f.ends_with(".cs")).collect();
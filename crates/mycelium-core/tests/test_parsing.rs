@@ -3,6 +3,7 @@
 mod common;
 
 use common::*;
+use mycelium_core::config::SymbolType;
 
 // ---------------------------------------------------------------------------
 // C# symbol extraction (17 tests)
@@ -10,112 +11,99 @@ use common::*;
 
 #[test]
 fn csharp_extracts_namespace() {
-    let r = run_two_phases("csharp_simple");
-    let names = symbol_names(&r.kg);
+    let r = shared_two_phases(CSHARP_SIMPLE);
     assert!(
-        names.iter().any(|n| n.contains("Absence")),
+        has_symbol_containing(&r.kg, "Absence"),
         "Should extract namespace symbols"
     );
 }
 
 #[test]
 fn csharp_extracts_classes() {
-    let r = run_two_phases("csharp_simple");
-    let names = symbol_names(&r.kg);
-    assert!(names.contains(&"AbsenceController".to_string()));
-    assert!(names.contains(&"AbsenceService".to_string()));
+    let r = shared_two_phases(CSHARP_SIMPLE);
+    assert!(has_symbol(&r.kg, "AbsenceController"));
+    assert!(has_symbol(&r.kg, "AbsenceService"));
 }
 
 #[test]
 fn csharp_extracts_interfaces() {
-    let r = run_two_phases("csharp_simple");
-    let syms = r.kg.get_symbols();
-    let interfaces: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == "Interface")
-        .collect();
-    assert!(
-        !interfaces.is_empty(),
-        "Should extract interface declarations"
-    );
-    assert!(interfaces
-        .iter()
-        .any(|s| s.name == "IAbsenceService" || s.name == "IAbsenceRepository"));
+    let r = shared_two_phases(CSHARP_SIMPLE);
+    let by_type = r.names_by_type();
+    let interfaces = by_type
+        .get(&SymbolType::Interface)
+        .expect("Should extract interface declarations");
+    assert!(interfaces.contains("IAbsenceService") || interfaces.contains("IAbsenceRepository"));
 }
 
 #[test]
 fn csharp_extracts_methods() {
-    let r = run_two_phases("csharp_simple");
-    let names = symbol_names(&r.kg);
-    assert!(names.contains(&"GetEntitlement".to_string()));
-    assert!(names.contains(&"CalculateEntitlement".to_string()));
+    let r = shared_two_phases(CSHARP_SIMPLE);
+    assert!(has_symbol(&r.kg, "GetEntitlement"));
+    assert!(has_symbol(&r.kg, "CalculateEntitlement"));
 }
 
 #[test]
 fn csharp_extracts_constructors() {
-    let r = run_two_phases("csharp_simple");
-    let syms = r.kg.get_symbols();
-    let constructors: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == "Constructor")
-        .collect();
+    let r = shared_two_phases(CSHARP_SIMPLE);
+    let by_type = r.names_by_type();
     assert!(
-        !constructors.is_empty(),
+        by_type.contains_key(&SymbolType::Constructor),
         "Should extract constructor declarations"
     );
 }
 
 #[test]
 fn csharp_extracts_properties() {
-    let r = run_two_phases("csharp_simple");
-    let syms = r.kg.get_symbols();
-    let props: Vec<_> = syms
-        .iter()
-        .filter(|s| s.symbol_type == "Property")
-        .collect();
-    assert!(!props.is_empty(), "Should extract property declarations");
+    let r = shared_two_phases(CSHARP_SIMPLE);
+    let by_type = r.names_by_type();
+    assert!(
+        by_type.contains_key(&SymbolType::Property),
+        "Should extract property declarations"
+    );
 }
 
 #[test]
 fn csharp_extracts_enums() {
-    let r = run_two_phases("csharp_simple");
-    let syms = r.kg.get_symbols();
-    let enums: Vec<_> = syms.iter().filter(|s| s.symbol_type == "Enum").collect();
-    assert!(!enums.is_empty(), "Should extract enum declarations");
-    assert!(enums.iter().any(|s| s.name == "LeaveType"));
+    let r = shared_two_phases(CSHARP_SIMPLE);
+    let by_type = r.names_by_type();
+    let enums = by_type
+        .get(&SymbolType::Enum)
+        .expect("Should extract enum declarations");
+    assert!(enums.contains("LeaveType"));
 }
 
 #[test]
 fn csharp_extracts_structs() {
-    let r = run_two_phases("csharp_simple");
-    let syms = r.kg.get_symbols();
-    let structs: Vec<_> = syms.iter().filter(|s| s.symbol_type == "Struct").collect();
-    assert!(!structs.is_empty(), "Should extract struct declarations");
-    assert!(structs.iter().any(|s| s.name == "DateRange"));
+    let r = shared_two_phases(CSHARP_SIMPLE);
+    let by_type = r.names_by_type();
+    let structs = by_type
+        .get(&SymbolType::Struct)
+        .expect("Should extract struct declarations");
+    assert!(structs.contains("DateRange"));
 }
 
 #[test]
 fn csharp_visibility_public() {
-    let r = run_two_phases("csharp_simple");
-    let syms = r.kg.get_symbols();
-    let controller = syms.iter().find(|s| s.name == "AbsenceController").unwrap();
+    let r = shared_two_phases(CSHARP_SIMPLE);
+    let syms = r.symbols();
+    let controller = syms.find("AbsenceController").unwrap();
     assert_eq!(controller.visibility, "public");
     assert!(controller.exported);
 }
 
 #[test]
 fn csharp_visibility_internal() {
-    let r = run_two_phases("csharp_simple");
-    let syms = r.kg.get_symbols();
-    let model = syms.iter().find(|s| s.name == "AbsenceModel").unwrap();
+    let r = shared_two_phases(CSHARP_SIMPLE);
+    let syms = r.symbols();
+    let model = syms.find("AbsenceModel").unwrap();
     assert_eq!(model.visibility, "internal");
     assert!(!model.exported);
 }
 
 #[test]
 fn csharp_visibility_private_method() {
-    let r = run_two_phases("csharp_simple");
-    let syms = r.kg.get_symbols();
+    let r = shared_two_phases(CSHARP_SIMPLE);
+    let syms = r.symbols();
     let private_methods: Vec<_> = syms
         .iter()
         .filter(|s| s.visibility == "private" && s.symbol_type == "Method")
@@ -125,8 +113,8 @@ fn csharp_visibility_private_method() {
 
 #[test]
 fn csharp_parent_tracking() {
-    let r = run_two_phases("csharp_simple");
-    let syms = r.kg.get_symbols();
+    let r = shared_two_phases(CSHARP_SIMPLE);
+    let syms = r.symbols();
     let methods_with_parent: Vec<_> = syms
         .iter()
         .filter(|s| s.symbol_type == "Method" && s.parent.is_some())
@@ -139,18 +127,18 @@ fn csharp_parent_tracking() {
 
 #[test]
 fn csharp_line_numbers() {
-    let r = run_two_phases("csharp_simple");
-    let syms = r.kg.get_symbols();
-    for sym in &syms {
+    let r = shared_two_phases(CSHARP_SIMPLE);
+    let syms = r.symbols();
+    for sym in syms.iter() {
         assert!(sym.line > 0, "Line numbers should be > 0");
     }
 }
 
 #[test]
 fn csharp_language_tag() {
-    let r = run_two_phases("csharp_simple");
-    let syms = r.kg.get_symbols();
-    for sym in &syms {
+    let r = shared_two_phases(CSHARP_SIMPLE);
+    let syms = r.symbols();
+    for sym in syms.iter() {
         assert_eq!(
             sym.language.as_deref(),
             Some("C#"),
@@ -161,8 +149,8 @@ fn csharp_language_tag() {
 
 #[test]
 fn csharp_constructor_parameter_types() {
-    let r = run_two_phases("csharp_simple");
-    let syms = r.kg.get_symbols();
+    let r = shared_two_phases(CSHARP_SIMPLE);
+    let syms = r.symbols();
     let constructors: Vec<_> = syms
         .iter()
         .filter(|s| s.symbol_type == "Constructor" && s.parameter_types.is_some())
@@ -175,7 +163,7 @@ fn csharp_constructor_parameter_types() {
 
 #[test]
 fn csharp_symbol_count() {
-    let r = run_two_phases("csharp_simple");
+    let r = shared_two_phases(CSHARP_SIMPLE);
     let count = r.kg.symbol_count();
     assert!(
         count >= 20,
@@ -185,7 +173,7 @@ fn csharp_symbol_count() {
 
 #[test]
 fn csharp_defines_edges() {
-    let r = run_two_phases("csharp_simple");
+    let r = shared_two_phases(CSHARP_SIMPLE);
     let syms = r.kg.get_symbols_in_file("AbsenceController.cs");
     assert!(!syms.is_empty(), "Should have DEFINES edges");
 }
@@ -197,8 +185,8 @@ fn csharp_defines_edges() {
 #[test]
 fn vbnet_files_parsed_in_mixed_dotnet() {
     // VB.NET grammar is now available; parsing should extract .vb symbols
-    let r = run_two_phases("mixed_dotnet");
-    let syms = r.kg.get_symbols();
+    let r = shared_two_phases(MIXED_DOTNET);
+    let syms = r.symbols();
     let vb_syms: Vec<_> = syms
         .iter()
         .filter(|s| s.language.as_deref() == Some("VB.NET"))
@@ -215,8 +203,8 @@ fn vbnet_files_parsed_in_mixed_dotnet() {
 
 #[test]
 fn mixed_dotnet_extracts_csharp() {
-    let r = run_two_phases("mixed_dotnet");
-    let syms = r.kg.get_symbols();
+    let r = shared_two_phases(MIXED_DOTNET);
+    let syms = r.symbols();
     let cs_syms: Vec<_> = syms
         .iter()
         .filter(|s| s.language.as_deref() == Some("C#"))
@@ -233,7 +221,7 @@ fn mixed_dotnet_extracts_csharp() {
 
 #[test]
 fn python_parsing_basic() {
-    let r = run_two_phases("python_simple");
+    let r = shared_two_phases(PYTHON_SIMPLE);
     let names = symbol_names(&r.kg);
     assert!(
         names
@@ -245,52 +233,51 @@ fn python_parsing_basic() {
 
 #[test]
 fn typescript_parsing_basic() {
-    let r = run_two_phases("typescript_simple");
+    let r = shared_two_phases(TYPESCRIPT_SIMPLE);
     let names = symbol_names(&r.kg);
     assert!(!names.is_empty(), "Should extract TypeScript symbols");
 }
 
 #[test]
 fn java_parsing_basic() {
-    let r = run_two_phases("java_simple");
-    let names = symbol_names(&r.kg);
-    assert!(names.contains(&"UserController".to_string()));
+    let r = shared_two_phases(JAVA_SIMPLE);
+    assert!(has_symbol(&r.kg, "UserController"));
 }
 
 #[test]
 fn go_parsing_basic() {
-    let r = run_two_phases("go_simple");
+    let r = shared_two_phases(GO_SIMPLE);
     let names = symbol_names(&r.kg);
     assert!(!names.is_empty(), "Should extract Go symbols");
 }
 
 #[test]
 fn rust_parsing_basic() {
-    let r = run_two_phases("rust_simple");
+    let r = shared_two_phases(RUST_SIMPLE);
     let names = symbol_names(&r.kg);
     assert!(!names.is_empty(), "Should extract Rust symbols");
 }
 
 #[test]
 fn c_parsing_basic() {
-    let r = run_two_phases("c_simple");
+    let r = shared_two_phases(C_SIMPLE);
     let names = symbol_names(&r.kg);
     assert!(!names.is_empty(), "Should extract C symbols");
 }
 
 #[test]
 fn cpp_parsing_basic() {
-    let r = run_two_phases("cpp_simple");
+    let r = shared_two_phases(CPP_SIMPLE);
     let names = symbol_names(&r.kg);
     assert!(!names.is_empty(), "Should extract C++ symbols");
 }
 
 #[test]
 fn symbol_ids_unique() {
-    let r = run_two_phases("csharp_simple");
-    let syms = r.kg.get_symbols();
+    let r = shared_two_phases(CSHARP_SIMPLE);
+    let syms = r.symbols();
     let mut seen = std::collections::HashSet::new();
-    for sym in &syms {
+    for sym in syms.iter() {
         assert!(seen.insert(&sym.id), "Duplicate symbol ID: {}", sym.id);
     }
 }
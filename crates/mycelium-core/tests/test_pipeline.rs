@@ -4,18 +4,31 @@ mod common;
 
 use common::*;
 
+/// Generate one test per row asserting that the pipeline fills every output
+/// section for `fixture`.
+macro_rules! all_sections_populated_tests {
+    ($($name:ident: $fixture:expr;)*) => {
+        $(
+            #[test]
+            fn $name() {
+                let result = shared_pipeline($fixture);
+                assert!(!result.structure.files.is_empty(), "files");
+                assert!(!result.symbols.is_empty(), "symbols");
+                assert!(!result.calls.is_empty(), "calls");
+                assert!(!result.communities.is_empty(), "communities");
+                assert!(!result.processes.is_empty(), "processes");
+            }
+        )*
+    };
+}
+
 // ===========================================================================
 // Pipeline orchestration (5 tests)
 // ===========================================================================
 
 #[test]
 fn pipeline_runs_all_phases() {
-    let path = fixture_path("csharp_simple");
-    let config = mycelium_core::config::AnalysisConfig {
-        repo_path: path.to_string_lossy().to_string(),
-        ..Default::default()
-    };
-    let result = mycelium_core::pipeline::run_pipeline(&config, None).unwrap();
+    let result = shared_pipeline(CSHARP_SIMPLE);
     assert_eq!(result.version, "1.0");
     assert!(
         !result.symbols.is_empty(),
@@ -25,11 +38,7 @@ fn pipeline_runs_all_phases() {
 
 #[test]
 fn pipeline_with_progress_callback() {
-    let path = fixture_path("python_simple");
-    let config = mycelium_core::config::AnalysisConfig {
-        repo_path: path.to_string_lossy().to_string(),
-        ..Default::default()
-    };
+    let config = fixture_config(PYTHON_SIMPLE);
     let mut phases_seen = Vec::new();
     let callback: mycelium_core::pipeline::ProgressCallback = Box::new(move |phase, _label| {
         phases_seen.push(phase.to_string());
@@ -40,12 +49,7 @@ fn pipeline_with_progress_callback() {
 
 #[test]
 fn pipeline_metadata() {
-    let path = fixture_path("csharp_simple");
-    let config = mycelium_core::config::AnalysisConfig {
-        repo_path: path.to_string_lossy().to_string(),
-        ..Default::default()
-    };
-    let result = mycelium_core::pipeline::run_pipeline(&config, None).unwrap();
+    let result = shared_pipeline(CSHARP_SIMPLE);
     assert!(result.metadata.contains_key("repo_name"));
     assert!(result.metadata.contains_key("analysed_at"));
     assert!(result.metadata.contains_key("analysis_duration_ms"));
@@ -54,12 +58,7 @@ fn pipeline_metadata() {
 
 #[test]
 fn pipeline_stats() {
-    let path = fixture_path("csharp_simple");
-    let config = mycelium_core::config::AnalysisConfig {
-        repo_path: path.to_string_lossy().to_string(),
-        ..Default::default()
-    };
-    let result = mycelium_core::pipeline::run_pipeline(&config, None).unwrap();
+    let result = shared_pipeline(CSHARP_SIMPLE);
     let expected_keys = [
         "files",
         "folders",
@@ -77,12 +76,7 @@ fn pipeline_stats() {
 
 #[test]
 fn pipeline_phase_timings() {
-    let path = fixture_path("python_simple");
-    let config = mycelium_core::config::AnalysisConfig {
-        repo_path: path.to_string_lossy().to_string(),
-        ..Default::default()
-    };
-    let result = mycelium_core::pipeline::run_pipeline(&config, None).unwrap();
+    let result = shared_pipeline(PYTHON_SIMPLE);
     let timings = result
         .metadata
         .get("phase_timings")
@@ -112,13 +106,8 @@ fn pipeline_phase_timings() {
 
 #[test]
 fn output_json_roundtrip() {
-    let path = fixture_path("csharp_simple");
-    let config = mycelium_core::config::AnalysisConfig {
-        repo_path: path.to_string_lossy().to_string(),
-        ..Default::default()
-    };
-    let result = mycelium_core::pipeline::run_pipeline(&config, None).unwrap();
-    let json = serde_json::to_string_pretty(&result).unwrap();
+    let result = shared_pipeline(CSHARP_SIMPLE);
+    let json = serde_json::to_string_pretty(&*result).unwrap();
     let parsed: mycelium_core::config::AnalysisResult = serde_json::from_str(&json).unwrap();
     assert_eq!(parsed.version, result.version);
     assert_eq!(parsed.symbols.len(), result.symbols.len());
@@ -126,12 +115,7 @@ fn output_json_roundtrip() {
 
 #[test]
 fn output_write_and_read() {
-    let path = fixture_path("python_simple");
-    let config = mycelium_core::config::AnalysisConfig {
-        repo_path: path.to_string_lossy().to_string(),
-        ..Default::default()
-    };
-    let result = mycelium_core::pipeline::run_pipeline(&config, None).unwrap();
+    let result = shared_pipeline(PYTHON_SIMPLE);
 
     let tmp = tempfile::NamedTempFile::new().unwrap();
     let out_path = tmp.path().to_string_lossy().to_string();
@@ -145,23 +129,13 @@ fn output_write_and_read() {
 
 #[test]
 fn output_structure_files() {
-    let path = fixture_path("csharp_simple");
-    let config = mycelium_core::config::AnalysisConfig {
-        repo_path: path.to_string_lossy().to_string(),
-        ..Default::default()
-    };
-    let result = mycelium_core::pipeline::run_pipeline(&config, None).unwrap();
+    let result = shared_pipeline(CSHARP_SIMPLE);
     assert!(!result.structure.files.is_empty(), "Should have file nodes");
 }
 
 #[test]
 fn output_structure_folders() {
-    let path = fixture_path("python_package");
-    let config = mycelium_core::config::AnalysisConfig {
-        repo_path: path.to_string_lossy().to_string(),
-        ..Default::default()
-    };
-    let result = mycelium_core::pipeline::run_pipeline(&config, None).unwrap();
+    let result = shared_pipeline(PYTHON_PACKAGE);
     assert!(
         !result.structure.folders.is_empty(),
         "Should have folder nodes for nested package"
@@ -172,59 +146,15 @@ fn output_structure_folders() {
 // E2E multi-language (4 tests)
 // ===========================================================================
 
-#[test]
-fn e2e_csharp_all_sections_populated() {
-    let path = fixture_path("csharp_simple");
-    let config = mycelium_core::config::AnalysisConfig {
-        repo_path: path.to_string_lossy().to_string(),
-        ..Default::default()
-    };
-    let result = mycelium_core::pipeline::run_pipeline(&config, None).unwrap();
-    assert!(!result.structure.files.is_empty(), "files");
-    assert!(!result.symbols.is_empty(), "symbols");
-    assert!(!result.calls.is_empty(), "calls");
-    assert!(!result.communities.is_empty(), "communities");
-    assert!(!result.processes.is_empty(), "processes");
-}
-
-#[test]
-fn e2e_python_all_sections_populated() {
-    let path = fixture_path("python_simple");
-    let config = mycelium_core::config::AnalysisConfig {
-        repo_path: path.to_string_lossy().to_string(),
-        ..Default::default()
-    };
-    let result = mycelium_core::pipeline::run_pipeline(&config, None).unwrap();
-    assert!(!result.structure.files.is_empty(), "files");
-    assert!(!result.symbols.is_empty(), "symbols");
-    assert!(!result.calls.is_empty(), "calls");
-    assert!(!result.communities.is_empty(), "communities");
-    assert!(!result.processes.is_empty(), "processes");
-}
-
-#[test]
-fn e2e_java_all_sections_populated() {
-    let path = fixture_path("java_simple");
-    let config = mycelium_core::config::AnalysisConfig {
-        repo_path: path.to_string_lossy().to_string(),
-        ..Default::default()
-    };
-    let result = mycelium_core::pipeline::run_pipeline(&config, None).unwrap();
-    assert!(!result.structure.files.is_empty(), "files");
-    assert!(!result.symbols.is_empty(), "symbols");
-    assert!(!result.calls.is_empty(), "calls");
-    assert!(!result.communities.is_empty(), "communities");
-    assert!(!result.processes.is_empty(), "processes");
+all_sections_populated_tests! {
+    e2e_csharp_all_sections_populated: CSHARP_SIMPLE;
+    e2e_python_all_sections_populated: PYTHON_SIMPLE;
+    e2e_java_all_sections_populated: JAVA_SIMPLE;
 }
 
 #[test]
 fn e2e_mixed_dotnet_pipeline() {
-    let path = fixture_path("mixed_dotnet");
-    let config = mycelium_core::config::AnalysisConfig {
-        repo_path: path.to_string_lossy().to_string(),
-        ..Default::default()
-    };
-    let result = mycelium_core::pipeline::run_pipeline(&config, None).unwrap();
+    let result = shared_pipeline(MIXED_DOTNET);
     assert!(!result.structure.files.is_empty(), "files");
     // mixed_dotnet has limited code so some sections may be sparse
     let _ = result;
@@ -10,8 +10,8 @@ use common::*;
 
 #[test]
 fn processes_detected() {
-    let r = run_all_phases("csharp_simple");
-    let processes = r.kg.get_processes();
+    let r = shared_all_phases(CSHARP_SIMPLE);
+    let processes = r.processes();
     assert!(
         !processes.is_empty(),
         "Should detect processes in csharp_simple"
@@ -20,9 +20,9 @@ fn processes_detected() {
 
 #[test]
 fn process_has_entry_and_terminal() {
-    let r = run_all_phases("csharp_simple");
-    let processes = r.kg.get_processes();
-    for (id, entry, terminal, _, _, _) in &processes {
+    let r = shared_all_phases(CSHARP_SIMPLE);
+    let processes = r.processes();
+    for (id, entry, terminal, _, _, _) in processes.iter() {
         assert!(!entry.is_empty(), "Process {} should have entry point", id);
         assert!(!terminal.is_empty(), "Process {} should have terminal", id);
     }
@@ -30,9 +30,9 @@ fn process_has_entry_and_terminal() {
 
 #[test]
 fn process_has_steps() {
-    let r = run_all_phases("csharp_simple");
-    let processes = r.kg.get_processes();
-    for (id, _, _, steps, _, _) in &processes {
+    let r = shared_all_phases(CSHARP_SIMPLE);
+    let processes = r.processes();
+    for (id, _, _, steps, _, _) in processes.iter() {
         assert!(
             steps.len() >= 2,
             "Process {} should have at least 2 steps, got {}",
@@ -44,19 +44,19 @@ fn process_has_steps() {
 
 #[test]
 fn process_ids_unique() {
-    let r = run_all_phases("csharp_simple");
-    let processes = r.kg.get_processes();
+    let r = shared_all_phases(CSHARP_SIMPLE);
+    let processes = r.processes();
     let mut seen = std::collections::HashSet::new();
-    for (id, _, _, _, _, _) in &processes {
+    for (id, _, _, _, _, _) in processes.iter() {
         assert!(seen.insert(id), "Duplicate process ID: {}", id);
     }
 }
 
 #[test]
 fn process_entry_is_first_step() {
-    let r = run_all_phases("csharp_simple");
-    let processes = r.kg.get_processes();
-    for (id, entry, _, steps, _, _) in &processes {
+    let r = shared_all_phases(CSHARP_SIMPLE);
+    let processes = r.processes();
+    for (id, entry, _, steps, _, _) in processes.iter() {
         if !steps.is_empty() {
             assert_eq!(
                 &steps[0], entry,
@@ -74,7 +74,7 @@ fn process_entry_is_first_step() {
 #[test]
 fn scoring_excludes_test_files() {
     use mycelium_core::graph::scoring::score_entry_points;
-    let r = run_four_phases("csharp_simple");
+    let r = shared_four_phases(CSHARP_SIMPLE);
     let scored = score_entry_points(&r.kg);
     let syms = r.kg.get_symbols();
     let sym_map: std::collections::HashMap<_, _> =
@@ -92,7 +92,7 @@ fn scoring_excludes_test_files() {
 #[test]
 fn scoring_returns_positive_scores() {
     use mycelium_core::graph::scoring::score_entry_points;
-    let r = run_four_phases("csharp_simple");
+    let r = shared_four_phases(CSHARP_SIMPLE);
     let scored = score_entry_points(&r.kg);
     for (_, score) in &scored {
         assert!(*score > 0.0, "Entry point scores should be positive");
@@ -102,7 +102,7 @@ fn scoring_returns_positive_scores() {
 #[test]
 fn scoring_sorted_descending() {
     use mycelium_core::graph::scoring::score_entry_points;
-    let r = run_four_phases("csharp_simple");
+    let r = shared_four_phases(CSHARP_SIMPLE);
     let scored = score_entry_points(&r.kg);
     for window in scored.windows(2) {
         assert!(
@@ -118,9 +118,9 @@ fn scoring_sorted_descending() {
 
 #[test]
 fn process_no_cycles() {
-    let r = run_all_phases("csharp_simple");
-    let processes = r.kg.get_processes();
-    for (id, _, _, steps, _, _) in &processes {
+    let r = shared_all_phases(CSHARP_SIMPLE);
+    let processes = r.processes();
+    for (id, _, _, steps, _, _) in processes.iter() {
         let mut seen = std::collections::HashSet::new();
         for step in steps {
             assert!(
@@ -135,8 +135,8 @@ fn process_no_cycles() {
 
 #[test]
 fn process_dedup_no_subsets() {
-    let r = run_all_phases("csharp_simple");
-    let processes = r.kg.get_processes();
+    let r = shared_all_phases(CSHARP_SIMPLE);
+    let processes = r.processes();
     let step_sets: Vec<std::collections::HashSet<&str>> = processes
         .iter()
         .map(|(_, _, _, steps, _, _)| steps.iter().map(|s| s.as_str()).collect())
@@ -158,8 +158,8 @@ fn process_dedup_no_subsets() {
 
 #[test]
 fn process_max_count() {
-    let r = run_all_phases("csharp_simple");
-    let processes = r.kg.get_processes();
+    let r = shared_all_phases(CSHARP_SIMPLE);
+    let processes = r.processes();
     assert!(
         processes.len() <= r.config.max_processes,
         "Should not exceed max_processes config"
@@ -168,9 +168,9 @@ fn process_max_count() {
 
 #[test]
 fn process_min_steps_respected() {
-    let r = run_all_phases("csharp_simple");
-    let processes = r.kg.get_processes();
-    for (id, _, _, steps, _, _) in &processes {
+    let r = shared_all_phases(CSHARP_SIMPLE);
+    let processes = r.processes();
+    for (id, _, _, steps, _, _) in processes.iter() {
         assert!(
             steps.len() >= r.config.min_steps,
             "Process {} has {} steps, should be >= min_steps={}",
@@ -187,9 +187,9 @@ fn process_min_steps_respected() {
 
 #[test]
 fn process_confidence_positive() {
-    let r = run_all_phases("csharp_simple");
-    let processes = r.kg.get_processes();
-    for (id, _, _, _, _, conf) in &processes {
+    let r = shared_all_phases(CSHARP_SIMPLE);
+    let processes = r.processes();
+    for (id, _, _, _, _, conf) in processes.iter() {
         assert!(
             *conf > 0.0,
             "Process {} should have positive confidence, got {}",
@@ -201,9 +201,9 @@ fn process_confidence_positive() {
 
 #[test]
 fn process_confidence_max_one() {
-    let r = run_all_phases("csharp_simple");
-    let processes = r.kg.get_processes();
-    for (id, _, _, _, _, conf) in &processes {
+    let r = shared_all_phases(CSHARP_SIMPLE);
+    let processes = r.processes();
+    for (id, _, _, _, _, conf) in processes.iter() {
         assert!(
             *conf <= 1.0,
             "Process {} confidence should be <= 1.0, got {}",
@@ -215,9 +215,9 @@ fn process_confidence_max_one() {
 
 #[test]
 fn process_type_valid() {
-    let r = run_all_phases("csharp_simple");
-    let processes = r.kg.get_processes();
-    for (id, _, _, _, ptype, _) in &processes {
+    let r = shared_all_phases(CSHARP_SIMPLE);
+    let processes = r.processes();
+    for (id, _, _, _, ptype, _) in processes.iter() {
         assert!(
             ptype == "intra_community" || ptype == "cross_community",
             "Process {} has invalid type: {}",
@@ -233,8 +233,8 @@ fn process_type_valid() {
 
 #[test]
 fn processes_python() {
-    let r = run_all_phases("python_simple");
-    let processes = r.kg.get_processes();
+    let r = shared_all_phases(PYTHON_SIMPLE);
+    let processes = r.processes();
     assert!(
         !processes.is_empty(),
         "Should detect processes in python_simple"
@@ -243,8 +243,8 @@ fn processes_python() {
 
 #[test]
 fn processes_java() {
-    let r = run_all_phases("java_simple");
-    let processes = r.kg.get_processes();
+    let r = shared_all_phases(JAVA_SIMPLE);
+    let processes = r.processes();
     assert!(
         !processes.is_empty(),
         "Should detect processes in java_simple"
@@ -253,8 +253,8 @@ fn processes_java() {
 
 #[test]
 fn processes_go() {
-    let r = run_all_phases("go_simple");
-    let processes = r.kg.get_processes();
+    let r = shared_all_phases(GO_SIMPLE);
+    let processes = r.processes();
     // Go simple may produce processes depending on call resolution
     let _ = processes;
 }
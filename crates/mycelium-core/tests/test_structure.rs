@@ -6,25 +6,22 @@ use common::*;
 
 #[test]
 fn discovers_csharp_files() {
-    let r = run_structure("csharp_simple");
-    let files = file_paths(&r.kg);
-    assert!(
-        files.iter().any(|f| f.ends_with(".cs")),
-        "Should discover .cs files"
-    );
-    assert!(files.len() >= 8, "csharp_simple has 8 .cs files");
+    let r = shared_structure(CSHARP_SIMPLE);
+    let files = r.files();
+    assert!(files.by_ext.contains_key("cs"), "Should discover .cs files");
+    assert!(files.paths.len() >= 8, "csharp_simple has 8 .cs files");
 }
 
 #[test]
 fn detects_languages() {
-    let r = run_structure("csharp_simple");
-    let langs = file_languages(&r.kg);
-    assert!(langs.contains("C#"), "Should detect C# language");
+    let r = shared_structure(CSHARP_SIMPLE);
+    let files = r.files();
+    assert!(files.languages.contains("C#"), "Should detect C# language");
 }
 
 #[test]
 fn counts_lines() {
-    let r = run_structure("csharp_simple");
+    let r = shared_structure(CSHARP_SIMPLE);
     for file_data in r.kg.get_files() {
         if let mycelium_core::graph::knowledge_graph::NodeData::File {
             language: Some(_),
@@ -39,33 +36,33 @@ fn counts_lines() {
 
 #[test]
 fn creates_folders() {
-    let r = run_structure("python_package");
-    let folders = folder_paths(&r.kg);
-    assert!(!folders.is_empty(), "Should create folder nodes");
+    let r = shared_structure(PYTHON_PACKAGE);
+    let files = r.files();
+    assert!(!files.folders.is_empty(), "Should create folder nodes");
 }
 
 #[test]
 fn ignores_default_excluded_dirs() {
-    let r = run_structure("python_simple");
-    let files = file_paths(&r.kg);
+    let r = shared_structure(PYTHON_SIMPLE);
+    let files = r.files();
     assert!(
-        files.iter().all(|f| !f.contains("__pycache__")),
+        files.paths.iter().all(|f| !f.contains("__pycache__")),
         "Should skip __pycache__"
     );
 }
 
 #[test]
 fn multi_language_detection() {
-    let r = run_structure("mixed_dotnet");
-    let langs = file_languages(&r.kg);
-    assert!(langs.contains("C#"), "Should detect C#");
+    let r = shared_structure(MIXED_DOTNET);
+    let files = r.files();
+    assert!(files.languages.contains("C#"), "Should detect C#");
     // .vb files won't have language if VB.NET analyser is unavailable
     // .sln and .csproj aren't source languages
 }
 
 #[test]
 fn file_size_tracked() {
-    let r = run_structure("csharp_simple");
+    let r = shared_structure(CSHARP_SIMPLE);
     for file_data in r.kg.get_files() {
         if let mycelium_core::graph::knowledge_graph::NodeData::File { size, .. } = file_data {
             assert!(*size > 0, "Files should have non-zero size");
@@ -75,11 +72,9 @@ fn file_size_tracked() {
 
 #[test]
 fn language_filter() {
-    let path = fixture_path("python_package");
     let config = mycelium_core::config::AnalysisConfig {
-        repo_path: path.to_string_lossy().to_string(),
         languages: Some(vec!["Python".to_string()]),
-        ..Default::default()
+        ..fixture_config(PYTHON_PACKAGE)
     };
     let mut kg = mycelium_core::graph::knowledge_graph::KnowledgeGraph::new();
     mycelium_core::phases::structure::run_structure_phase(&config, &mut kg);